@@ -0,0 +1,84 @@
+import re
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+AGGREGATES = ('count', 'sum', 'avg', 'min', 'max')
+_IDENTIFIER_RE = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+def _identifier(name: str) -> str:
+    if not isinstance(name, str) or not _IDENTIFIER_RE.match(name):
+        raise ValueError(f"Invalid column name: {name!r}")
+    return name
+
+def aggregate_columns(spec: Dict[str, Union[bool, str, Iterable[str], None]]) -> List[Tuple[str, str, Optional[str]]]:
+    """
+    Expand the aggregate arguments to (function, column, result key) triples.
+
+    Each argument is a column name or a list of column names; 'count' also accepts True or '*' for COUNT(*).
+    The result key is '<function>_<column>', or 'count' for COUNT(*).
+
+    Args:
+        spec (dict): The aggregate arguments keyed by function name ('count', 'sum', 'avg', 'min', 'max').
+
+    Returns:
+        list: Triples of (result key, SQL expression, column or None for COUNT(*)).
+
+    Raises:
+        ValueError: If a function or column name is invalid.
+    """
+    columns = []
+    for function, value in spec.items():
+        if function not in AGGREGATES:
+            raise ValueError(f"Unknown aggregate: {function!r}")
+        if value is None or value is False:
+            continue
+        for column in ([value] if isinstance(value, (str, bool)) else value):
+            if function == 'count' and (column is True or column == '*'):
+                columns.append(('count', 'COUNT(*)', None))
+            else:
+                columns.append((f"{function}_{_identifier(column)}", f"{function.upper()}({column})", column))
+    if not columns:
+        raise ValueError("At least one aggregate is required.")
+    return columns
+
+def compile_aggregate(source: str, columns: List[Tuple[str, str, Optional[str]]], group_by: Iterable[str] = (),
+                      where: Optional[str] = None, having: Optional[str] = None,
+                      order_by: Iterable[str] = (), limit: Optional[int] = None) -> Tuple[str, List[str]]:
+    """
+    Compile an aggregate query to a single SELECT ... GROUP BY statement.
+
+    Args:
+        source (str): The table name, or a parenthesized subquery.
+        columns (list): The aggregates, as returned by 'aggregate_columns'.
+        group_by (Iterable[str]): The columns to group by.
+        where (Optional[str]): A condition applied to the rows before grouping.
+        having (Optional[str]): A condition applied to the groups.
+        order_by (Iterable[str]): Group columns or result keys; prefix a name with '-' to sort descending.
+        limit (Optional[int]): The maximum number of groups.
+
+    Returns:
+        tuple: The SQL statement and the result keys, in column order.
+
+    Raises:
+        ValueError: If a column name is invalid or an ordering names an unknown key.
+    """
+    group_by = [_identifier(column) for column in group_by]
+    keys = group_by + [key for key, _, _ in columns]
+    select = group_by + [f"{expression} AS {key}" for key, expression, _ in columns]
+    sql = f"SELECT {', '.join(select)} FROM {source}"
+    if where:
+        sql += f" WHERE {where}"
+    if group_by:
+        sql += f" GROUP BY {', '.join(group_by)}"
+    if having:
+        sql += f" HAVING {having}"
+    ordering = []
+    for name in order_by:
+        key = name[1:] if name.startswith('-') else name
+        if key not in keys:
+            raise ValueError(f"Cannot order by {name!r}: not a group column or aggregate.")
+        ordering.append(f"{key} {'DESC' if name.startswith('-') else 'ASC'}")
+    if ordering:
+        sql += f" ORDER BY {', '.join(ordering)}"
+    if limit is not None:
+        sql += f" LIMIT {int(limit)}"
+    return sql, keys
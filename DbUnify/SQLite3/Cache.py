@@ -1,5 +1,11 @@
+import re
 import time
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
+
+_WRITE_RE = re.compile(r'^\s*(?:INSERT(?:\s+OR\s+\w+)?\s+INTO|REPLACE\s+INTO|UPDATE(?:\s+OR\s+\w+)?|DELETE\s+FROM|'
+                       r'DROP\s+TABLE(?:\s+IF\s+EXISTS)?|ALTER\s+TABLE)\s+(?:["`\[]?\w+["`\]]?\s*\.\s*)?["`\[]?(\w+)',
+                       re.IGNORECASE)
+_READ_RE = re.compile(r'^\s*(?:SELECT|EXPLAIN|PRAGMA|VALUES)\b', re.IGNORECASE)
 
 class Cache:
     """
@@ -79,3 +85,125 @@ class Cache:
         """
         current_time = time.time()
         self.cache = {k: v for k, v in self.cache.items() if v[1] > current_time}
+
+class GenerationCache:
+    """
+    GenerationCache Class
+
+    The GenerationCache class caches query results by the generation of the tables they read. Every
+    table has a generation counter that a write bumps, so invalidating every result that depends on
+    a table is O(1) and stale entries are only detected, and dropped, when they are next read.
+
+    Attributes:
+        generations (Dict[str, int]): The generation of each written table, by lowercase name.
+        epoch (int): A generation shared by every table, bumped when any table may have changed.
+        entries (Dict[Hashable, Tuple[Tuple[int, ...], Any]]): Cached results and the generations they were read at.
+        max_entries (int): The number of entries kept; the oldest entry is evicted first.
+        hits (int): Lookups answered from the cache.
+        misses (int): Lookups that found no valid entry.
+
+    Methods:
+        __init__(self, max_entries): Initializes an empty cache.
+        get(self, key, tables): Gets a result if no table it depends on was written since it was stored.
+        set(self, key, tables, value): Stores a result read from the given tables.
+        bump(self, table_name): Invalidates the results that depend on a table.
+        bump_all(self): Invalidates every result.
+        note_write(self, query): Bumps the table written by a statement.
+        clear(self): Removes every entry.
+
+    Note:
+        - Only writes that are reported through 'bump' or 'note_write' are seen; rows changed by
+          triggers on other tables are not tracked.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        """
+        Initialize the GenerationCache instance.
+
+        Args:
+            max_entries (int): The number of entries kept. Default is 256.
+        """
+        self.generations: Dict[str, int] = {}
+        self.epoch = 0
+        self.entries: Dict[Hashable, Tuple[Tuple[int, ...], Any]] = {}
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def _stamp(self, tables: Iterable[str]) -> Tuple[int, ...]:
+        generations = self.generations
+        return (self.epoch,) + tuple(generations.get(table.lower(), 0) for table in tables)
+
+    def get(self, key: Hashable, tables: Iterable[str]) -> Optional[Any]:
+        """
+        Get a cached result if none of the tables it was read from was written since it was stored.
+
+        Args:
+            key (Hashable): The cache key, usually the query and its parameters.
+            tables (Iterable[str]): The tables the result was read from.
+
+        Returns:
+            Any: The cached result, or None if there is no valid entry.
+        """
+        entry = self.entries.get(key)
+        if entry is not None:
+            if entry[0] == self._stamp(tables):
+                self.hits += 1
+                return entry[1]
+            del self.entries[key]
+        self.misses += 1
+        return None
+
+    def set(self, key: Hashable, tables: Iterable[str], value: Any) -> None:
+        """
+        Store a result read from the given tables at their current generations.
+
+        Args:
+            key (Hashable): The cache key, usually the query and its parameters.
+            tables (Iterable[str]): The tables the result was read from.
+            value (Any): The result to be cached.
+        """
+        if key not in self.entries and len(self.entries) >= self.max_entries:
+            del self.entries[next(iter(self.entries))]
+        self.entries[key] = (self._stamp(tables), value)
+
+    def bump(self, table_name: str) -> None:
+        """
+        Bump a table's generation, invalidating every result read from it.
+
+        Args:
+            table_name (str): The name of the written table.
+        """
+        table_name = table_name.lower()
+        self.generations[table_name] = self.generations.get(table_name, 0) + 1
+
+    def bump_all(self) -> None:
+        """
+        Bump the shared generation, invalidating every result.
+        """
+        self.epoch += 1
+
+    def note_write(self, query: str) -> None:
+        """
+        Bump the table written by a statement. A schema prefix such as 'main.' is skipped, so the
+        table itself is bumped. Statements whose target cannot be found, other than plain reads,
+        invalidate every result. Nothing is done while the cache is empty.
+
+        Args:
+            query (str): The executed SQL statement.
+        """
+        if not self.entries:
+            return
+        match = _WRITE_RE.match(query)
+        if match is not None:
+            self.bump(match.group(1))
+        elif not _READ_RE.match(query):
+            self.bump_all()
+
+    def clear(self) -> None:
+        """
+        Remove every entry and reset the counters.
+        """
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
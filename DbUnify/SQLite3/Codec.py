@@ -0,0 +1,109 @@
+import zlib, lzma
+from typing import Any, Union
+
+class Codec:
+    """
+    Codec Class
+
+    The Codec class compresses large TEXT/BLOB column values before they are written and decompresses them
+    transparently when they are read. Only values at or above a size threshold are compressed, and a value is
+    stored compressed only when that actually saves space.
+
+    Compressed values are stored as BLOBs that start with a marker header:
+    the 4-byte magic b'\\x00DbU', one byte for the algorithm (b'z' zlib, b'x' lzma) and one byte for the
+    original kind (b't' text, b'b' bytes). Decoding reads the header, so values written with another codec
+    configuration, or values that were never compressed, are always read back correctly.
+
+    Attributes:
+        algorithm (str): The compression algorithm, 'zlib' or 'lzma'.
+        threshold (int): Minimum size in bytes for a value to be compressed.
+        level (int): Compression level (zlib) or preset (lzma).
+
+    Methods:
+        __init__(self, algorithm, threshold, level): Initializes the Codec instance.
+        encode(self, value): Compresses a value if it is large enough.
+        decode(value): Decompresses a value if it carries the marker header.
+        is_encoded(value): Checks if a value carries the marker header.
+    """
+
+    MAGIC = b'\x00DbU'
+    ALGORITHMS = {'zlib': b'z', 'lzma': b'x'}
+
+    def __init__(self, algorithm: str = 'zlib', threshold: int = 1024, level: int = 6):
+        """
+        Initialize the Codec instance.
+
+        Args:
+            algorithm (str): The compression algorithm, 'zlib' or 'lzma'. Default is 'zlib'.
+            threshold (int): Minimum size in bytes for a value to be compressed. Default is 1024.
+            level (int): Compression level (zlib) or preset (lzma). Default is 6.
+
+        Raises:
+            ValueError: If the algorithm is not supported.
+        """
+        if algorithm not in self.ALGORITHMS:
+            raise ValueError(f"Unsupported compression algorithm: {algorithm}")
+        self.algorithm = algorithm
+        self.threshold = threshold
+        self.level = level
+        self._prefix = self.MAGIC + self.ALGORITHMS[algorithm]
+
+    def encode(self, value: Any) -> Any:
+        """
+        Compress a value if it is a str or bytes-like value at or above the threshold.
+
+        Args:
+            value (Any): The value to be stored.
+
+        Returns:
+            Any: The compressed BLOB with its marker header, or the original value.
+        """
+        if isinstance(value, str):
+            kind, raw = b't', value.encode('utf-8')
+        elif isinstance(value, (bytes, bytearray, memoryview)):
+            if Codec.is_encoded(value):
+                return value
+            kind, raw = b'b', bytes(value)
+        else:
+            return value
+
+        if len(raw) < self.threshold:
+            return value
+        if self.algorithm == 'zlib':
+            payload = zlib.compress(raw, self.level)
+        else:
+            payload = lzma.compress(raw, preset=self.level)
+
+        encoded = self._prefix + kind + payload
+        return encoded if len(encoded) < len(raw) else value
+
+    @staticmethod
+    def is_encoded(value: Any) -> bool:
+        """
+        Check if a value carries the codec marker header.
+
+        Args:
+            value (Any): The stored value.
+
+        Returns:
+            bool: True if the value was written compressed by a Codec, False otherwise.
+        """
+        return isinstance(value, (bytes, bytearray, memoryview)) and bytes(value[:4]) == Codec.MAGIC
+
+    @staticmethod
+    def decode(value: Any) -> Union[str, bytes, Any]:
+        """
+        Decompress a value if it carries the codec marker header.
+
+        Args:
+            value (Any): The stored value.
+
+        Returns:
+            Union[str, bytes, Any]: The original value.
+        """
+        if not Codec.is_encoded(value):
+            return value
+        value = bytes(value)
+        algorithm, kind, payload = value[4:5], value[5:6], value[6:]
+        raw = zlib.decompress(payload) if algorithm == b'z' else lzma.decompress(payload)
+        return raw.decode('utf-8') if kind == b't' else raw
@@ -0,0 +1,277 @@
+import json, math, re, sqlite3
+from typing import Any, Dict, List, Optional, Tuple
+from .QueryPlan import QueryPlan, table_aliases
+
+_CLAUSE_END = r'(?=\bGROUP\s+BY\b|\bORDER\s+BY\b|\bLIMIT\b|\bHAVING\b|\bWINDOW\b|\bUNION\b|$)'
+_WHERE_RE = re.compile(r'\bWHERE\b(.*?)' + _CLAUSE_END, re.I | re.S)
+_ON_RE = re.compile(r'\bON\b(.*?)(?=\b(?:LEFT|RIGHT|INNER|CROSS|FULL|NATURAL)?\s*JOIN\b|\bWHERE\b|\bGROUP\s+BY\b|\bORDER\s+BY\b|\bLIMIT\b|$)', re.I | re.S)
+_ORDER_RE = re.compile(r'\bORDER\s+BY\b(.*?)(?=\bLIMIT\b|$)', re.I | re.S)
+_PREDICATE_RE = re.compile(r'(?:(\w+)\.)?(\w+)\s*(==|=|<=|>=|<>|!=|<|>|\bIN\b|\bIS\b|\bBETWEEN\b|\bLIKE\b)', re.I)
+_EQUALITY_OPS = {'=', '==', 'IN', 'IS'}
+
+class IndexAdvisor:
+    """
+    IndexAdvisor Class
+
+    The IndexAdvisor class collects the statements that run through a Manager, weighted by frequency and
+    latency, and proposes indexes for them. Candidate indexes are built from the WHERE, JOIN ... ON and
+    ORDER BY columns of each statement and tried on a scratch copy of the database, so the live database
+    is never modified. A candidate is reported when it turns a full table scan into an index SEARCH or
+    removes a temporary B-tree sort.
+
+    The estimated cost change compares the rows visited per execution: a full scan visits every row,
+    while a search visits about log2(rows) B-tree pages plus the average rows per key that 'ANALYZE'
+    reports for the candidate index.
+
+    Attributes:
+        db_name (str): The database the workload runs against.
+        workload (dict): Recorded statements mapped to their parameters, execution count and total time.
+
+    Methods:
+        attach(self, manager): Records every query run through a Manager.
+        detach(self, manager): Stops recording a Manager's queries.
+        record(self, query, args, elapsed): Records one execution of a statement.
+        save_workload(self, path): Writes the recorded workload to a JSON lines file.
+        load_workload(self, path): Adds a workload saved by 'save_workload'.
+        candidates(self, connection): Derives candidate indexes from the workload.
+        advise(self, scratch, limit): Tries the candidates and reports the useful ones.
+    """
+
+    def __init__(self, db_name: str):
+        """
+        Initialize the IndexAdvisor instance.
+
+        Args:
+            db_name (str): The path of the database the workload runs against.
+        """
+        self.db_name = db_name
+        self.workload: Dict[str, Dict[str, Any]] = {}
+
+    def attach(self, manager) -> None:
+        """
+        Record every query run through a Manager's 'fetch_all' and 'Raw.execute_query'.
+
+        Args:
+            manager (Manager): A sync or aio Manager instance.
+        """
+        manager.add_query_listener(self.record)
+
+    def detach(self, manager) -> None:
+        """
+        Stop recording a Manager's queries.
+
+        Args:
+            manager (Manager): A sync or aio Manager instance.
+        """
+        manager.remove_query_listener(self.record)
+
+    def record(self, query: str, args: Tuple = (), elapsed: float = 0.0) -> None:
+        """
+        Record one execution of a statement. Only SELECT, UPDATE and DELETE statements are kept.
+
+        Args:
+            query (str): The SQL query.
+            args (tuple): Parameters passed to the query.
+            elapsed (float): Wall time of the query in seconds.
+        """
+        if query.lstrip()[:6].upper() not in ('SELECT', 'UPDATE', 'DELETE'):
+            return
+        entry = self.workload.get(query)
+        if entry is None:
+            self.workload[query] = {'params': list(args), 'count': 1, 'total_time': elapsed}
+        else:
+            entry['count'] += 1
+            entry['total_time'] += elapsed
+
+    def save_workload(self, path: str) -> None:
+        """
+        Write the recorded workload to a JSON lines file, one statement per line.
+
+        Args:
+            path (str): The output file path.
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            for query, entry in self.workload.items():
+                f.write(json.dumps({'query': query, **entry}, default=lambda value: None) + '\n')
+
+    def load_workload(self, path: str) -> None:
+        """
+        Add a workload saved by 'save_workload', merging counts and times of known statements.
+
+        Args:
+            path (str): The input file path.
+        """
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                item = json.loads(line)
+                entry = self.workload.setdefault(item['query'], {'params': item.get('params') or [], 'count': 0, 'total_time': 0.0})
+                entry['count'] += item.get('count', 1)
+                entry['total_time'] += item.get('total_time', 0.0)
+
+    def _columns_for(self, query: str, columns: Dict[str, set]) -> Dict[str, Dict[str, List[str]]]:
+        """
+        Collect the equality, range and ORDER BY columns of a statement per table.
+
+        Args:
+            query (str): The SQL query.
+            columns (dict): Table names mapped to their column names.
+
+        Returns:
+            dict: Table names mapped to {'eq': [...], 'range': [...], 'order': [...]}.
+        """
+        tables = {alias: table for alias, table in table_aliases(query).items() if table in columns}
+        result: Dict[str, Dict[str, List[str]]] = {}
+
+        def resolve(qualifier: Optional[str], column: str) -> Optional[str]:
+            if qualifier:
+                table = tables.get(qualifier)
+                return table if table and column in columns[table] else None
+            owners = [table for table in set(tables.values()) if column in columns[table]]
+            return owners[0] if len(owners) == 1 else None
+
+        def add(table: str, kind: str, column: str) -> None:
+            bucket = result.setdefault(table, {'eq': [], 'range': [], 'order': []})[kind]
+            if column not in bucket:
+                bucket.append(column)
+
+        clauses = _WHERE_RE.findall(query) + _ON_RE.findall(query)
+        for clause in clauses:
+            for qualifier, column, op in _PREDICATE_RE.findall(clause):
+                table = resolve(qualifier, column)
+                if table:
+                    add(table, 'eq' if op.upper() in _EQUALITY_OPS else 'range', column)
+            for match in re.finditer(r'=\s*(?:(\w+)\.)?(\w+)', clause):
+                table = resolve(match.group(1), match.group(2))
+                if table and match.group(1):
+                    add(table, 'eq', match.group(2))
+
+        for clause in _ORDER_RE.findall(query):
+            for term in clause.split(','):
+                match = re.match(r'\s*(?:(\w+)\.)?(\w+)', term)
+                if match:
+                    table = resolve(match.group(1), match.group(2))
+                    if table:
+                        add(table, 'order', match.group(2))
+        return result
+
+    def candidates(self, connection: sqlite3.Connection) -> Dict[Tuple[str, Tuple[str, ...]], List[str]]:
+        """
+        Derive candidate indexes from the recorded workload.
+
+        Equality columns come first, then the first range column, or the ORDER BY columns when there is
+        no range predicate, following the column order SQLite can use in a single index.
+
+        Args:
+            connection (sqlite3.Connection): A connection to the database (or its scratch copy).
+
+        Returns:
+            dict: (table, columns) mapped to the statements the candidate applies to.
+        """
+        tables = [row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'")]
+        columns = {table: {row[1] for row in connection.execute(f"PRAGMA table_info({table})")} for table in tables}
+
+        found: Dict[Tuple[str, Tuple[str, ...]], List[str]] = {}
+        for query in self.workload:
+            for table, used in self._columns_for(query, columns).items():
+                key_columns = list(used['eq'])
+                if used['range']:
+                    key_columns.append(used['range'][0])
+                else:
+                    key_columns.extend(col for col in used['order'] if col not in key_columns)
+                if key_columns:
+                    found.setdefault((table, tuple(key_columns)), []).append(query)
+        return found
+
+    def _explain(self, connection: sqlite3.Connection, query: str) -> Optional[QueryPlan]:
+        """
+        Explain a recorded statement on the scratch database.
+
+        Args:
+            connection (sqlite3.Connection): The scratch connection.
+            query (str): The SQL query.
+
+        Returns:
+            Optional[QueryPlan]: The plan, or None if the statement cannot be explained.
+        """
+        params = list(self.workload[query]['params'])
+        expected = query.count('?')
+        params = (params + [None] * expected)[:expected]
+        try:
+            rows = connection.execute(f"EXPLAIN QUERY PLAN {query}", params).fetchall()
+        except sqlite3.Error:
+            return None
+        return QueryPlan.from_rows(query, rows)
+
+    def advise(self, scratch: str = ':memory:', limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Try every candidate index on a scratch copy of the database and report the useful ones.
+
+        Args:
+            scratch (str): Where to copy the database, ':memory:' or a temporary file path. Default is ':memory:'.
+            limit (Optional[int]): Maximum number of recommendations to return.
+
+        Returns:
+            list: Recommendations ordered by estimated benefit, each a dictionary with 'statement', 'table',
+            'columns', 'queries', 'executions', 'observed_time', 'before', 'after', 'rows_before', 'rows_after'
+            and 'cost_change' (the estimated relative change of rows visited, e.g. -0.99).
+
+        Raises:
+            RuntimeError: If there is an error copying or analyzing the database.
+        """
+        try:
+            source = sqlite3.connect(self.db_name)
+            connection = sqlite3.connect(scratch)
+            source.backup(connection)
+            source.close()
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Error copying database for index advice: {str(e)}")
+
+        try:
+            baseline = {query: self._explain(connection, query) for query in self.workload}
+            recommendations = []
+            for number, ((table, key_columns), queries) in enumerate(self.candidates(connection).items()):
+                index_name = f"_dbunify_advisor_{number}"
+                connection.execute(f"CREATE INDEX {index_name} ON {table} ({', '.join(key_columns)})")
+                improved = []
+                for query in queries:
+                    before, after = baseline[query], self._explain(connection, query)
+                    if before is None or after is None:
+                        continue
+                    scan_fixed = table in before.full_scans() and table not in after.full_scans()
+                    sort_fixed = len(after.temp_btrees()) < len(before.temp_btrees())
+                    if (scan_fixed or sort_fixed) and index_name in str(after):
+                        improved.append((query, before, after))
+
+                if improved:
+                    connection.execute(f"ANALYZE {index_name}")
+                    stat = connection.execute("SELECT stat FROM sqlite_stat1 WHERE idx = ?", (index_name,)).fetchone()
+                    numbers = [int(n) for n in stat[0].split()[:len(key_columns) + 1]] if stat else [0]
+                    rows_before = numbers[0]
+                    rows_after = math.log2(rows_before + 1) + (numbers[-1] if len(numbers) > 1 else 0)
+                    cost_change = (rows_after - rows_before) / rows_before if rows_before else 0.0
+                    executions = sum(self.workload[query]['count'] for query, _, _ in improved)
+                    observed = sum(self.workload[query]['total_time'] for query, _, _ in improved)
+                    recommendations.append({
+                        'statement': f"CREATE INDEX IF NOT EXISTS ix_{table}_{'_'.join(key_columns)} ON {table} ({', '.join(key_columns)})",
+                        'table': table,
+                        'columns': list(key_columns),
+                        'queries': [query for query, _, _ in improved],
+                        'executions': executions,
+                        'observed_time': observed,
+                        'before': [str(plan) for _, plan, _ in improved],
+                        'after': [str(plan) for _, _, plan in improved],
+                        'rows_before': rows_before,
+                        'rows_after': rows_after,
+                        'cost_change': cost_change,
+                        'score': (observed or executions) * -cost_change
+                    })
+                connection.execute(f"DROP INDEX {index_name}")
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Error evaluating candidate indexes: {str(e)}")
+        finally:
+            connection.close()
+
+        recommendations.sort(key=lambda item: item['score'], reverse=True)
+        return recommendations[:limit] if limit else recommendations
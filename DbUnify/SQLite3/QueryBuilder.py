@@ -1,11 +1,87 @@
-from typing import List, Dict, Union, Optional
+from typing import Any, List, Dict, Hashable, Tuple, Union, Optional
+
+Condition = Union[str, Tuple]
 
 class QueryBuilder:
-    def __init__(self):
+    """
+    Builds SQL statements from clauses.
+
+    By default values are inlined with 'repr'. With 'parameterized=True' every value becomes a '?'
+    placeholder: the clause methods taking values ('values', 'set', 'where', 'having', 'delete_where',
+    'limit', 'offset') return a (clause, params) tuple, and the 'get_*_query' methods return a
+    (sql, params) tuple that can be passed straight to 'fetch_all(sql, *params)' or
+    'execute_query(sql, *params)'. Statements of the same shape then have the same SQL text, so
+    SQLite's statement cache and the SQL-keyed result caches reuse them whatever the values.
+
+    Conditions are SQL strings, or in parameterized mode (condition, *params) tuples whose
+    condition has its own '?' placeholders, such as ('age > ?', 18).
+
+    'get_select_query' keeps the SQL it compiles in an LRU keyed by the query's shape: the table,
+    columns, joins, condition and having SQL, grouping, ordering and, in parameterized mode, only
+    whether limit and offset are present. A call with a known shape only collects its parameters.
+    'hits' and 'misses' count the lookups.
+    """
+
+    def __init__(self, parameterized: bool = False, max_templates: int = 256):
         """
         Initializes the QueryBuilder instance.
+
+        :param parameterized: Use '?' placeholders and return (sql, params) tuples. Defaults to False.
+        :param max_templates: Number of compiled SELECT templates kept. Defaults to 256. With 0 or less,
+            nothing is cached.
+        """
+        self.parameterized = parameterized
+        self.max_templates = max_templates
+        self.templates: Dict[Hashable, str] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def clear_templates(self) -> None:
+        """
+        Forget every compiled SELECT template and reset the hit and miss counters.
+        """
+        self.templates.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def _value(self, value: Any, params: List) -> str:
+        """
+        Get the SQL for a value: a placeholder recording the value in params, or its inlined repr.
+        """
+        if self.parameterized:
+            params.append(value)
+            return '?'
+        return repr(value)
+
+    def _conditions(self, conditions, params: List) -> str:
+        """
+        Join conditions with AND, collecting the parameters of (condition, *params) tuples.
+
+        :raises ValueError: If a condition carries parameters and the builder is not parameterized.
+        """
+        if not conditions:
+            return ''
+        parts = []
+        for condition in conditions:
+            if condition.__class__ is tuple or (condition.__class__ is not str and isinstance(condition, tuple)):
+                if not self.parameterized:
+                    raise ValueError("Condition parameters require QueryBuilder(parameterized=True).")
+                params.extend(condition[1:])
+                condition = condition[0]
+            parts.append(condition)
+        return ' AND '.join(parts)
+
+    def _result(self, sql: str, params: List):
         """
-        pass
+        Get the result of a method: (sql, params) in parameterized mode, the SQL string otherwise.
+        """
+        return (sql, tuple(params)) if self.parameterized else sql
+
+    def _clause(self, clause) -> Tuple[str, List]:
+        """
+        Split the result of a clause method into its SQL and its parameters.
+        """
+        return (clause[0], list(clause[1])) if self.parameterized else (clause, [])
     
     def select(self, *columns: str) -> str:
         """
@@ -40,15 +116,16 @@ class QueryBuilder:
         """
         return f"{join_type} JOIN {table} ON {on_condition}"
     
-    def where(self, *conditions: str) -> str:
+    def where(self, *conditions: Condition) -> Union[str, Tuple[str, Tuple]]:
         """
         Constructs a SQL WHERE clause.
         
         :param conditions: Conditions to be used in the WHERE clause.
-        :return: SQL WHERE clause as a string.
+        :return: SQL WHERE clause as a string, or (clause, params) in parameterized mode.
         
         """
-        return f"WHERE {' AND '.join(conditions)}" if conditions else ''
+        params: List = []
+        return self._result(f"WHERE {self._conditions(conditions, params)}" if conditions else '', params)
     
     def group_by(self, *columns: str) -> str:
         """
@@ -60,15 +137,16 @@ class QueryBuilder:
         """
         return f"GROUP BY {', '.join(columns)}" if columns else ''
     
-    def having(self, *conditions: str) -> str:
+    def having(self, *conditions: Condition) -> Union[str, Tuple[str, Tuple]]:
         """
         Constructs a SQL HAVING clause.
         
         :param conditions: Conditions to be used in the HAVING clause.
-        :return: SQL HAVING clause as a string.
+        :return: SQL HAVING clause as a string, or (clause, params) in parameterized mode.
         
         """
-        return f"HAVING {' AND '.join(conditions)}" if conditions else ''
+        params: List = []
+        return self._result(f"HAVING {self._conditions(conditions, params)}" if conditions else '', params)
     
     def order_by(self, *columns: str) -> str:
         """
@@ -80,25 +158,31 @@ class QueryBuilder:
         """
         return f"ORDER BY {', '.join(columns)}" if columns else ''
     
-    def limit(self, limit: Optional[int] = None) -> str:
+    def limit(self, limit: Optional[int] = None) -> Union[str, Tuple[str, Tuple]]:
         """
         Constructs a SQL LIMIT clause.
         
         :param limit: Maximum number of rows to return.
-        :return: SQL LIMIT clause as a string.
+        :return: SQL LIMIT clause as a string, or (clause, params) in parameterized mode.
         
         """
-        return f"LIMIT {limit}" if limit is not None else ''
+        params: List = []
+        if limit is None:
+            return self._result('', params)
+        return self._result(f"LIMIT {self._value(limit, params) if self.parameterized else limit}", params)
     
-    def offset(self, offset: Optional[int] = None) -> str:
+    def offset(self, offset: Optional[int] = None) -> Union[str, Tuple[str, Tuple]]:
         """
         Constructs a SQL OFFSET clause.
         
         :param offset: Number of rows to skip before starting to return rows.
-        :return: SQL OFFSET clause as a string.
+        :return: SQL OFFSET clause as a string, or (clause, params) in parameterized mode.
         
         """
-        return f"OFFSET {offset}" if offset is not None else ''
+        params: List = []
+        if offset is None:
+            return self._result('', params)
+        return self._result(f"OFFSET {self._value(offset, params) if self.parameterized else offset}", params)
     
     def insert_into(self, table: str) -> str:
         """
@@ -110,17 +194,18 @@ class QueryBuilder:
         """
         return f"INSERT INTO {table}"
     
-    def values(self, **values: Union[str, int, float, bool]) -> str:
+    def values(self, **values: Union[str, int, float, bool]) -> Union[str, Tuple[str, Tuple]]:
         """
         Constructs a SQL VALUES clause.
         
         :param values: Column-value pairs to be inserted.
-        :return: SQL VALUES clause as a string.
+        :return: SQL VALUES clause as a string, or (clause, params) in parameterized mode.
         
         """
+        params: List = []
         columns = ', '.join(values.keys())
-        values_str = ', '.join(repr(v) for v in values.values())
-        return f"({columns}) VALUES ({values_str})"
+        values_str = ', '.join(self._value(v, params) for v in values.values())
+        return self._result(f"({columns}) VALUES ({values_str})", params)
     
     def update(self, table: str) -> str:
         """
@@ -132,16 +217,17 @@ class QueryBuilder:
         """
         return f"UPDATE {table}"
     
-    def set(self, **values: Union[str, int, float, bool]) -> str:
+    def set(self, **values: Union[str, int, float, bool]) -> Union[str, Tuple[str, Tuple]]:
         """
         Constructs a SQL SET clause for updating rows.
         
         :param values: Column-value pairs to be updated.
-        :return: SQL SET clause as a string.
+        :return: SQL SET clause as a string, or (clause, params) in parameterized mode.
         
         """
-        set_clause = ', '.join(f"{col} = {repr(val)}" for col, val in values.items())
-        return f"SET {set_clause}" if values else ''
+        params: List = []
+        set_clause = ', '.join(f"{col} = {self._value(val, params)}" for col, val in values.items())
+        return self._result(f"SET {set_clause}" if values else '', params)
     
     def delete_from(self, table: str) -> str:
         """
@@ -207,19 +293,21 @@ class QueryBuilder:
         """
         return f"DROP TABLE {table}"
 
-    def delete_where(self, *conditions: str) -> str:
+    def delete_where(self, *conditions: Condition) -> Union[str, Tuple[str, Tuple]]:
         """
         Constructs a SQL WHERE clause for deletion.
         
         :param conditions: Conditions to be used in the WHERE clause.
-        :return: SQL WHERE clause for deletion as a string.
+        :return: SQL WHERE clause for deletion as a string, or (clause, params) in parameterized mode.
         
         Example:
         >>> qb = QueryBuilder()
         >>> qb.delete_where('age < 18')
         'WHERE age < 18'
+        >>> QueryBuilder(parameterized=True).delete_where(('age < ?', 18))
+        ('WHERE age < ?', (18,))
         """
-        return f"WHERE {' AND '.join(conditions)}" if conditions else ''
+        return self.where(*conditions)
     
     def create_table(self, table: str, **columns: str) -> str:
         """
@@ -306,12 +394,12 @@ class QueryBuilder:
     
     def get_select_query(self, table: str, columns: Optional[List[str]] = None, 
                          joins: Optional[List[str]] = None,
-                         conditions: Optional[List[str]] = None, 
+                         conditions: Optional[List[Condition]] = None, 
                          group_by: Optional[List[str]] = None,
-                         having: Optional[List[str]] = None, 
+                         having: Optional[List[Condition]] = None, 
                          order_by: Optional[List[str]] = None,
                          limit: Optional[int] = None, 
-                         offset: Optional[int] = None) -> str:
+                         offset: Optional[int] = None) -> Union[str, Tuple[str, Tuple]]:
         """
         Constructs a complete SQL SELECT query.
         
@@ -324,72 +412,105 @@ class QueryBuilder:
         :param order_by: List of columns to order by, with optional sorting direction.
         :param limit: Number of rows to return.
         :param offset: Number of rows to skip before starting to return rows.
-        :return: Complete SQL SELECT query as a string.
-        
+        :return: Complete SQL SELECT query as a string, or (sql, params) in parameterized mode.
+        
+        """
+        params: List = []
+        where = self._conditions(conditions or (), params)
+        having = self._conditions(having or (), params)
+        if self.parameterized:
+            paging = (limit is not None, offset is not None)
+            if limit is not None:
+                params.append(limit)
+            if offset is not None:
+                params.append(offset)
+        else:
+            paging = (limit, offset)
+        key = (table, tuple(columns or ()), tuple(joins or ()), where, tuple(group_by or ()), having,
+               tuple(order_by or ()), paging)
+        if self.max_templates <= 0:
+            self.misses += 1
+            return self._result(self._compile_select(*key[:-1], limit, offset), params)
+        templates = self.templates
+        query = templates.pop(key, None)
+        if query is None:
+            self.misses += 1
+            query = self._compile_select(*key[:-1], limit, offset)
+            while len(templates) >= self.max_templates:
+                del templates[next(iter(templates))]
+        else:
+            self.hits += 1
+        templates[key] = query
+        return self._result(query, params)
+
+    def _compile_select(self, table: str, columns: Tuple[str, ...], joins: Tuple[str, ...], where: str,
+                        group_by: Tuple[str, ...], having: str, order_by: Tuple[str, ...],
+                        limit: Optional[int], offset: Optional[int]) -> str:
+        """
+        Compile a SELECT template from its shape, with placeholders for limit and offset in parameterized mode.
         """
-        columns = columns or []
-        joins = joins or []
-        conditions = conditions or []
-        group_by = group_by or []
-        having = having or []
-        order_by = order_by or []
-        
         query = f"{self.select(*columns)} {self.from_table(table)}"
         if joins:
             query += ' ' + ' '.join(joins)
-        if conditions:
-            query += ' ' + self.where(*conditions)
+        if where:
+            query += f" WHERE {where}"
         if group_by:
             query += ' ' + self.group_by(*group_by)
         if having:
-            query += ' ' + self.having(*having)
+            query += f" HAVING {having}"
         if order_by:
             query += ' ' + self.order_by(*order_by)
         if limit is not None:
-            query += ' ' + self.limit(limit)
+            query += f" LIMIT {'?' if self.parameterized else limit}"
         if offset is not None:
-            query += ' ' + self.offset(offset)
+            query += f" OFFSET {'?' if self.parameterized else offset}"
         return query
     
-    def get_insert_query(self, table: str, **values: Union[str, int, float, bool]) -> str:
+    def get_insert_query(self, table: str, **values: Union[str, int, float, bool]) -> Union[str, Tuple[str, Tuple]]:
         """
         Constructs a complete SQL INSERT query.
         
         :param table: Name of the table to insert into.
         :param values: Column-value pairs to be inserted.
-        :return: Complete SQL INSERT query as a string.
+        :return: Complete SQL INSERT query as a string, or (sql, params) in parameterized mode.
         
         """
-        return f"{self.insert_into(table)} {self.values(**values)}"
+        sql, params = self._clause(self.values(**values))
+        return self._result(f"{self.insert_into(table)} {sql}", params)
     
     def get_update_query(self, table: str, values: Dict[str, Union[str, int, float, bool]],
-                         conditions: Optional[List[str]] = None) -> str:
+                         conditions: Optional[List[Condition]] = None) -> Union[str, Tuple[str, Tuple]]:
         """
         Constructs a complete SQL UPDATE query.
         
         :param table: Name of the table to update.
         :param values: Column-value pairs to be updated.
         :param conditions: List of WHERE conditions to be applied.
-        :return: Complete SQL UPDATE query as a string.
+        :return: Complete SQL UPDATE query as a string, or (sql, params) in parameterized mode.
         
         """
         conditions = conditions or []
-        query = f"{self.update(table)} {self.set(**values)}"
+        sql, params = self._clause(self.set(**values))
+        query = f"{self.update(table)} {sql}"
         if conditions:
-            query += ' ' + self.where(*conditions)
-        return query
+            sql, values = self._clause(self.where(*conditions))
+            query += ' ' + sql
+            params.extend(values)
+        return self._result(query, params)
     
-    def get_delete_query(self, table: str, conditions: Optional[List[str]] = None) -> str:
+    def get_delete_query(self, table: str, conditions: Optional[List[Condition]] = None) -> Union[str, Tuple[str, Tuple]]:
         """
         Constructs a complete SQL DELETE query.
         
         :param table: Name of the table to delete from.
         :param conditions: List of WHERE conditions to be applied.
-        :return: Complete SQL DELETE query as a string.
+        :return: Complete SQL DELETE query as a string, or (sql, params) in parameterized mode.
         
         """
         conditions = conditions or []
         query = f"{self.delete_from(table)}"
+        params: List = []
         if conditions:
-            query += ' ' + self.delete_where(*conditions)
-        return query
+            sql, params = self._clause(self.delete_where(*conditions))
+            query += ' ' + sql
+        return self._result(query, params)
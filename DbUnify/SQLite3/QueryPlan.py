@@ -0,0 +1,317 @@
+import logging, os, re, traceback
+from typing import Dict, Iterator, List, Optional, Tuple
+
+_SCAN_RE = re.compile(r'^SCAN (?:TABLE )?(\w+)(?: AS \w+)?(?: (.*))?$')
+_SEARCH_RE = re.compile(r'^SEARCH (?:TABLE )?(\w+)(?: AS \w+)?(?: (.*))?$')
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+_SOURCE_KEYWORDS = ('WHERE', 'ON', 'JOIN', 'LEFT', 'RIGHT', 'INNER', 'CROSS', 'OUTER', 'FULL', 'NATURAL', 'GROUP',
+                    'ORDER', 'LIMIT', 'HAVING', 'WINDOW', 'UNION', 'EXCEPT', 'INTERSECT', 'SET', 'VALUES', 'SELECT',
+                    'USING', 'INDEXED', 'NOT', 'DEFAULT')
+_ALIAS = r'(?:\s+(?:AS\s+)?(?!(?:' + '|'.join(_SOURCE_KEYWORDS) + r')\b)(\w+))?'
+_FROM_RE = re.compile(r'\bFROM\b([^()]*?)(?=\bWHERE\b|\bGROUP\s+BY\b|\bORDER\s+BY\b|\bLIMIT\b|\bHAVING\b|\bWINDOW\b'
+                      r'|\bUNION\b|\bEXCEPT\b|\bINTERSECT\b|[()]|$)', re.I)
+_SOURCE_RE = re.compile(r'(?:^|,|\bJOIN\b)\s*(?:\w+\.)?(\w+)' + _ALIAS, re.I)
+_TARGET_RE = re.compile(r'\b(?:UPDATE|INTO)\s+(?:OR\s+\w+\s+)?(?:\w+\.)?(\w+)' + _ALIAS, re.I)
+
+def table_aliases(query: str) -> Dict[str, str]:
+    """
+    Map the table names and aliases of a statement to table names.
+
+    The FROM and JOIN sources (including comma separated ones) and the UPDATE or INSERT target are
+    read from the SQL text. A schema prefix is dropped. Subqueries are not aliased, so their alias
+    is left out.
+
+    Args:
+        query (str): The SQL query.
+
+    Returns:
+        dict: Alias or table name mapped to the table name.
+    """
+    sources = [source for clause in _FROM_RE.findall(query) for source in _SOURCE_RE.findall(clause)]
+    tables = {}
+    for table, alias in sources + _TARGET_RE.findall(query):
+        tables.setdefault(table, table)
+        if alias:
+            tables[alias] = table
+    return tables
+
+class PlanNode:
+    """
+    A single step of an 'EXPLAIN QUERY PLAN' result.
+
+    Attributes:
+        id (int): The node id reported by SQLite.
+        parent (int): The id of the parent node, 0 for top-level nodes.
+        detail (str): The human readable description of the step.
+        children (List[PlanNode]): The nested steps.
+    """
+
+    def __init__(self, id: int, parent: int, detail: str):
+        self.id = id
+        self.parent = parent
+        self.detail = detail
+        self.children: List['PlanNode'] = []
+
+    @property
+    def table(self) -> Optional[str]:
+        """
+        Get the table scanned or searched by this step, as 'EXPLAIN QUERY PLAN' prints it. This is the
+        alias when the query gives the table one; 'QueryPlan' maps it back to the table name.
+
+        Returns:
+            Optional[str]: The table name or alias, or None if the step does not read a table.
+        """
+        match = _SCAN_RE.match(self.detail) or _SEARCH_RE.match(self.detail)
+        return match.group(1) if match else None
+
+    @property
+    def is_full_scan(self) -> bool:
+        """
+        Check if this step reads a whole table without using an index.
+
+        Returns:
+            bool: True for a full table scan, False otherwise.
+        """
+        match = _SCAN_RE.match(self.detail)
+        if not match or match.group(1) == 'CONSTANT':
+            return False
+        return 'INDEX' not in (match.group(2) or '')
+
+    @property
+    def is_temp_btree(self) -> bool:
+        """
+        Check if this step builds a temporary B-tree (for ORDER BY, GROUP BY or DISTINCT).
+
+        Returns:
+            bool: True if a temporary B-tree is used, False otherwise.
+        """
+        return self.detail.startswith('USE TEMP B-TREE')
+
+    def to_dict(self) -> Dict:
+        """Convert the node and its children to a dictionary."""
+        return {
+            'id': self.id,
+            'parent': self.parent,
+            'detail': self.detail,
+            'children': [child.to_dict() for child in self.children]
+        }
+
+    def __repr__(self) -> str:
+        return f"<PlanNode(id={self.id}, parent={self.parent}, detail={self.detail!r})>"
+
+
+class QueryPlan:
+    """
+    QueryPlan Class
+
+    The QueryPlan class holds the parsed tree of an 'EXPLAIN QUERY PLAN' result.
+
+    Attributes:
+        query (str): The explained SQL query.
+        roots (List[PlanNode]): The top-level steps of the plan.
+        aliases (dict): Table aliases of the query mapped to table names.
+
+    Methods:
+        from_rows(query, rows): Builds a plan from the rows returned by 'EXPLAIN QUERY PLAN'.
+        walk(self): Iterates over every node depth-first.
+        full_scans(self): Gets the tables that are read with a full table scan.
+        temp_btrees(self): Gets the steps that build a temporary B-tree.
+        tables(self): Gets every table read by the plan.
+        resolve(self, name): Maps a table alias printed in the plan to the table name.
+    """
+
+    def __init__(self, query: str, roots: List[PlanNode]):
+        self.query = query
+        self.roots = roots
+        self.aliases = table_aliases(query)
+
+    def resolve(self, name: str) -> str:
+        """
+        Get the table name behind a name printed in the plan.
+
+        Args:
+            name (str): A table name or alias.
+
+        Returns:
+            str: The table name, or the name itself if it is not an alias of the query.
+        """
+        return self.aliases.get(name, name)
+
+    @classmethod
+    def from_rows(cls, query: str, rows: List[Tuple]) -> 'QueryPlan':
+        """
+        Build a plan tree from the rows returned by 'EXPLAIN QUERY PLAN'.
+
+        Args:
+            query (str): The explained SQL query.
+            rows (list): Rows of (id, parent, notused, detail).
+
+        Returns:
+            QueryPlan: The parsed plan.
+        """
+        nodes: Dict[int, PlanNode] = {}
+        roots: List[PlanNode] = []
+        for row in rows:
+            node = PlanNode(row[0], row[1], row[3])
+            nodes[node.id] = node
+            parent = nodes.get(node.parent)
+            if parent is None:
+                roots.append(node)
+            else:
+                parent.children.append(node)
+        return cls(query, roots)
+
+    def walk(self) -> Iterator[PlanNode]:
+        """
+        Iterate over every node of the plan depth-first.
+
+        Yields:
+            PlanNode: The plan nodes.
+        """
+        stack = list(reversed(self.roots))
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+    def full_scans(self) -> List[str]:
+        """
+        Get the tables that are read with a full table scan.
+
+        Returns:
+            list: The table names.
+        """
+        return [self.resolve(node.table) for node in self.walk() if node.is_full_scan]
+
+    def temp_btrees(self) -> List[PlanNode]:
+        """
+        Get the steps that build a temporary B-tree.
+
+        Returns:
+            list: The plan nodes.
+        """
+        return [node for node in self.walk() if node.is_temp_btree]
+
+    def tables(self) -> List[str]:
+        """
+        Get every table read by the plan.
+
+        Returns:
+            list: The table names, in plan order.
+        """
+        return [self.resolve(node.table) for node in self.walk() if node.table]
+
+    def to_list(self) -> List[Dict]:
+        """Convert the plan to a list of nested dictionaries."""
+        return [root.to_dict() for root in self.roots]
+
+    def __str__(self) -> str:
+        lines = []
+        def render(node: PlanNode, depth: int) -> None:
+            lines.append(f"{'  ' * depth}{node.detail}")
+            for child in node.children:
+                render(child, depth + 1)
+        for root in self.roots:
+            render(root, 0)
+        return '\n'.join(lines)
+
+    def __repr__(self) -> str:
+        return f"<QueryPlan(query={self.query!r}, nodes={sum(1 for _ in self.walk())})>"
+
+
+class PlanWatchdog:
+    """
+    PlanWatchdog Class
+
+    The PlanWatchdog class flags queries whose plan reads a large table with a full table scan or sorts
+    through a temporary B-tree, and logs them with the call site that issued them. Each distinct SQL
+    string is inspected once while it is among the 'max_checked' most recently seen.
+
+    Attributes:
+        min_rows (int): Only tables with at least this many rows are reported.
+        logger (logging.Logger): The logger warnings are written to.
+        checked (dict): SQL strings that were already inspected, least recently seen first.
+        max_checked (int): The number of SQL strings remembered; the least recently seen is evicted first.
+        reports (list): Every warning that was emitted, as dictionaries.
+    """
+
+    def __init__(self, min_rows: int = 10000, logger: Optional[logging.Logger] = None, max_checked: int = 4096):
+        """
+        Initialize the PlanWatchdog instance.
+
+        Args:
+            min_rows (int): Only tables with at least this many rows are reported. Default is 10000.
+            logger (Optional[logging.Logger]): The logger to use. Defaults to the 'DbUnify' logger.
+            max_checked (int): The number of SQL strings remembered. Default is 4096. With 0 or less,
+                every query is inspected.
+        """
+        self.min_rows = min_rows
+        self.logger = logger or logging.getLogger('DbUnify')
+        self.checked: Dict[str, None] = {}
+        self.max_checked = max_checked
+        self.reports: List[Dict] = []
+
+    def should_check(self, query: str) -> bool:
+        """
+        Check if a query still needs to be inspected, and mark it as inspected.
+
+        Args:
+            query (str): The SQL query.
+
+        Returns:
+            bool: True if the query is not among the remembered ones, False otherwise.
+        """
+        checked = self.checked
+        if query in checked:
+            del checked[query]
+            checked[query] = None
+            return False
+        if self.max_checked > 0:
+            if len(checked) >= self.max_checked:
+                del checked[next(iter(checked))]
+            checked[query] = None
+        return True
+
+    def inspect(self, plan: QueryPlan, row_counts: Dict[str, int]) -> List[Dict]:
+        """
+        Inspect a plan and log a warning for every problem on a large table.
+
+        Args:
+            plan (QueryPlan): The plan of the query.
+            row_counts (dict): Estimated row counts of the tables read by the plan.
+
+        Returns:
+            list: The reported problems.
+        """
+        issues = []
+        for table in plan.full_scans():
+            if row_counts.get(table, 0) >= self.min_rows:
+                issues.append({'problem': 'SCAN', 'table': table, 'rows': row_counts[table]})
+        large = [table for table in plan.tables() if row_counts.get(table, 0) >= self.min_rows]
+        if large:
+            for node in plan.temp_btrees():
+                issues.append({'problem': node.detail, 'table': large[0], 'rows': row_counts[large[0]]})
+
+        if issues:
+            call_site = self.call_site()
+            for issue in issues:
+                issue.update(query=plan.query, call_site=call_site)
+                self.logger.warning(
+                    "%s on table '%s' (~%d rows) at %s: %s",
+                    issue['problem'], issue['table'], issue['rows'], call_site, plan.query
+                )
+            self.reports.extend(issues)
+        return issues
+
+    @staticmethod
+    def call_site() -> str:
+        """
+        Get the first stack frame outside the DbUnify package.
+
+        Returns:
+            str: The location as 'file:line in function'.
+        """
+        for frame in reversed(traceback.extract_stack()):
+            if not os.path.abspath(frame.filename).startswith(_PACKAGE_DIR):
+                return f"{frame.filename}:{frame.lineno} in {frame.name}"
+        return '<unknown>'
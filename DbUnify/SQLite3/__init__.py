@@ -1,3 +1,5 @@
 from .sync import *
 from .aio import *
 from .QueryBuilder import QueryBuilder
+from .Codec import Codec
+from .IndexAdvisor import IndexAdvisor
@@ -1,5 +1,5 @@
 from ..Raw.Raw import Raw
-from typing import List, Union
+from typing import List, Optional, Union
 import os, csv, matplotlib.pyplot as plt
 
 class Exporter:
@@ -20,6 +20,8 @@ class Exporter:
             Creates a chart from data in a specific table and saves it as an image.
         - export_data_csv(self, table_name, csv_file_path, csv_file_name='output'):
             Exports data from a table to a CSV file.
+        - export_chart_aggregate(self, table_name, group_by, *args, column=None, function='count', ...):
+            Creates a chart of an aggregate per group, computed with a single GROUP BY query.
 
     ### Raises:
         - RuntimeError: If there is an error during chart creation or saving, or during CSV data export.
@@ -126,6 +128,58 @@ class Exporter:
         except Exception as e:
             raise RuntimeError(f"Error creating chart: {str(e)}")
    
+    async def export_chart_aggregate(self, table_name: str, group_by: str, *args, column: Optional[str] = None, function: str = 'count',
+                                     where: Optional[str] = None, x_label: str = 'X Label', y_label: str = 'Y Label', title: str = 'Chart Title',
+                                     save_path: str = 'chart.png', chart_type: str = 'bar', limit: Optional[int] = None) -> None:
+        """
+        Create a chart of an aggregate per group and save it as an image.
+
+        The aggregate is computed in the database with a single GROUP BY query, so only one row per
+        group is fetched instead of the whole table.
+
+        Args:
+            table_name (str): Name of the database table.
+            group_by (str): The column whose values form the x-axis.
+            *args: Parameters for the where condition.
+            column (Optional[str]): The aggregated column. Not needed for 'count', which counts rows.
+            function (str): The aggregate function ('count', 'sum', 'avg', 'min', 'max'). Default is 'count'.
+            where (Optional[str]): SQL condition applied to the rows before grouping.
+            x_label (str): Label for the x-axis.
+            y_label (str): Label for the y-axis.
+            title (str): Title of the chart.
+            save_path (str): Path to save the chart image.
+            chart_type (str): The type of chart to create ('bar', 'line', 'scatter').
+            limit (Optional[int]): Keep only the groups with the largest values.
+
+        Raises:
+            RuntimeError: If there is an error creating the chart or saving it as an image.
+        """
+        try:
+            key = 'count' if column is None else f"{function}_{column}"
+            rows = await self.manager.aggregate(table_name, *args, group_by=[group_by], where=where,
+                                                order_by=[f"-{key}"] if limit else None, limit=limit,
+                                                **{function: column if column is not None else True})
+            x_values: List[str] = [str(row[group_by]) for row in rows]
+            y_values: List[Union[int, float]] = [row[key] for row in rows]
+            plt.figure(figsize=(8, 6))
+            if chart_type == 'bar':
+                plt.bar(x_values, y_values)
+            elif chart_type == 'line':
+                plt.plot(x_values, y_values, marker='o', linestyle='-')
+            elif chart_type == 'scatter':
+                plt.scatter(x_values, y_values)
+            else:
+                raise RuntimeError(f"Error, Type chart not found!")
+
+            plt.xlabel(x_label)
+            plt.ylabel(y_label)
+            plt.title(title)
+            plt.savefig(save_path)
+            plt.close()
+
+        except Exception as e:
+            raise RuntimeError(f"Error creating chart: {str(e)}")
+
     async def export_data_csv(self, table_name: str, csv_file_path: str, csv_file_name: str = 'output') -> None:
         """
         Export data from a table to a CSV file.
@@ -0,0 +1,87 @@
+from typing import Optional, Sequence
+import hashlib
+import re
+from .ORMException import ORMMException
+
+MARKER = '/* dbunify */'
+
+class Index:
+    """
+    Index Class
+
+    A declarative index for a model, listed in the model's 'Meta.indexes' or created by 'Field(index=True)'.
+
+    Attributes:
+        expressions (tuple): Columns or SQL expressions indexed, in order. A column may carry 'ASC'/'DESC'.
+        name (Optional[str]): The index name. Generated from the table and expressions when omitted.
+        unique (bool): Whether the index is UNIQUE.
+        where (Optional[str]): The condition of a partial index.
+        include (tuple): Trailing columns stored in the index so queries reading them are covered
+            (SQLite has no INCLUDE clause, so they are appended to the key).
+
+    Note:
+        - The generated 'CREATE INDEX' statement ends with the '/* dbunify */' marker. SQLite keeps it in
+          'sqlite_master.sql', which is how managed indexes are told apart from hand-made ones.
+    """
+
+    def __init__(self, *expressions: str, name: Optional[str] = None, unique: bool = False,
+                 where: Optional[str] = None, include: Sequence[str] = ()):
+        """
+        Initialize the Index instance.
+
+        Args:
+            *expressions (str): Columns or SQL expressions to index.
+            name (Optional[str]): The index name.
+            unique (bool): Whether the index is UNIQUE. Default is False.
+            where (Optional[str]): The condition of a partial index.
+            include (Sequence[str]): Trailing columns that make the index covering.
+
+        Raises:
+            ORMMException: If no column or expression is given.
+        """
+        if not expressions:
+            raise ORMMException("An index needs at least one column or expression.")
+        self.expressions = tuple(expressions)
+        self.name = name
+        self.unique = unique
+        self.where = where
+        self.include = tuple(include)
+
+    def get_name(self, table_name: str) -> str:
+        """
+        Get the index name, generating it when none was given.
+
+        Args:
+            table_name (str): The indexed table.
+
+        Returns:
+            str: The index name.
+        """
+        if self.name:
+            return self.name
+        parts = [re.sub(r'\W+', '_', expression).strip('_').lower() for expression in self.expressions + self.include]
+        name = f"ix_{table_name}_{'_'.join(parts)}"
+        if self.unique:
+            name += '_unique'
+        if self.where:
+            name += '_' + hashlib.sha1(self.where.encode()).hexdigest()[:8]
+        return name
+
+    def sql(self, table_name: str) -> str:
+        """
+        Get the 'CREATE INDEX' statement, exactly as SQLite stores it in 'sqlite_master'.
+
+        Args:
+            table_name (str): The indexed table.
+
+        Returns:
+            str: The statement.
+        """
+        columns = ', '.join(self.expressions + self.include)
+        sql = f"CREATE {'UNIQUE ' if self.unique else ''}INDEX {self.get_name(table_name)} ON {table_name} ({columns})"
+        if self.where:
+            sql += f" WHERE {self.where}"
+        return f"{sql} {MARKER}"
+
+    def __repr__(self) -> str:
+        return f"<Index({', '.join(self.expressions + self.include)}, unique={self.unique}, where={self.where!r})>"
@@ -1,19 +1,42 @@
-from .Field import Field
+from .Field import Field, MISSING
 from .ModelMeta import ModelMeta
 from ...data.Rules import Rules
 from .ORMManager import ORMMException
+from .QuerySet import QuerySetDescriptor
+from .Types import ForeignKey
+from .FullText import fts_statements, fts_table, fts_triggers
+from .RTree import rtree_statements
+import aiosqlite
+import time
 from typing import Dict, List, Tuple, Optional, Union
 
+def _is_loaded(obj, name: str) -> bool:
+    try:
+        object.__getattribute__(obj, name)
+        return True
+    except AttributeError:
+        return False
+
+def _deferred_state(obj) -> Tuple[frozenset, Optional[List]]:
+    try:
+        return object.__getattribute__(obj, '_deferred')
+    except AttributeError:
+        return frozenset(), None
+
 class Model(metaclass=ModelMeta):
     """
     Base class for all models, handling field definitions and schema management.
     """
+    __slots__ = ('_dirty', '_related', '_deferred')
     orm_manager = None
+    objects = QuerySetDescriptor()
     
     def __init__(self, **kwargs):
         """
         Initialize the model with provided field values.
 
+        Subclasses get a compiled version of this method from ModelMeta.
+
         Args:
             kwargs: Field values to initialize the model with.
         """ 
@@ -21,6 +44,544 @@ class Model(metaclass=ModelMeta):
             if key in self._fields:
                 setattr(self, key, value)
 
+    def to_dict(self) -> Dict[str, Union[str, int, float]]:
+        """
+        Get the field values that are set on the instance. Deferred fields that are not loaded are left out.
+
+        Returns:
+            dict: A dictionary of field names and their values.
+        """
+        return {name: getattr(self, name) for name in self._fields if _is_loaded(self, name)}
+
+    def __repr__(self) -> str:
+        values = ', '.join(f"{name}={value!r}" for name, value in self.to_dict().items())
+        return f"<{type(self).__name__}({values})>"
+
+    def __setattr__(self, name: str, value) -> None:
+        """
+        Set an attribute, recording field changes on instances loaded from the database.
+
+        '_dirty' is unset on new instances, an empty tuple on clean loaded instances and the set of
+        changed field names once a loaded instance is modified.
+        """
+        object.__setattr__(self, name, value)
+        if name in self._fields:
+            related = getattr(self, '_related', None)
+            if related and name in related:
+                del related[name]
+            dirty = getattr(self, '_dirty', None)
+            if dirty:
+                dirty.add(name)
+            elif dirty is not None:
+                object.__setattr__(self, '_dirty', {name})
+
+    def dirty_fields(self) -> set:
+        """
+        Get the fields changed since the instance was loaded or last saved.
+
+        Returns:
+            set: The changed field names. Every set field counts as changed on a new instance.
+        """
+        dirty = getattr(self, '_dirty', None)
+        if dirty is None:
+            return set(self.to_dict())
+        return set(dirty)
+
+    def _set_related(self, name: str, instance) -> None:
+        """
+        Cache the instance referenced by a ForeignKey field.
+        """
+        related = getattr(self, '_related', None)
+        if related is None:
+            object.__setattr__(self, '_related', {name: instance})
+        else:
+            related[name] = instance
+
+    async def related(self, name: str):
+        """
+        Get the instance referenced by a ForeignKey field.
+
+        References loaded by 'select_related' or 'prefetch_related' are returned without a query;
+        otherwise the referenced row is queried once and cached on the instance.
+
+        Args:
+            name (str): The ForeignKey field name.
+
+        Returns:
+            Optional[Model]: The referenced instance, or None if the field is empty or the row is missing.
+
+        Raises:
+            ORMMException: If the field is not a ForeignKey.
+        """
+        field = self._fields.get(name)
+        if not isinstance(field, ForeignKey):
+            raise ORMMException(f"'{type(self).__name__}.{name}' is not a ForeignKey")
+        related = getattr(self, '_related', None)
+        if related is not None and name in related:
+            return related[name]
+        value = getattr(self, name, None)
+        target = None
+        if value is not None:
+            target = await field.to.get(value)
+        self._set_related(name, target)
+        return target
+
+    def _load_on_access(self, name: str):
+        """
+        Report a deferred field that was accessed before it was loaded. Installed as '__getattr__'
+        by 'QuerySet' once the model has deferred instances; attribute access cannot await a query.
+        """
+        names, _ = _deferred_state(self)
+        if name in names:
+            raise AttributeError(f"'{type(self).__name__}.{name}' is deferred; load it with: await instance.load_deferred({name!r})")
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    @classmethod
+    def _allow_deferred(cls) -> None:
+        if cls.__dict__.get('__getattr__') is None:
+            cls.__getattr__ = Model._load_on_access
+
+    async def load_deferred(self, *names: str) -> None:
+        """
+        Load deferred fields of the instance and of the other unloaded instances of its result set,
+        with one query per chunk of 900 instances.
+
+        Args:
+            *names (str): The fields to load. Default is every deferred field that is not loaded yet.
+        """
+        deferred, batch = _deferred_state(self)
+        names = names or tuple(name for name in deferred if not _is_loaded(self, name))
+        if names:
+            await type(self)._load_deferred(batch or [self], names)
+
+    @classmethod
+    async def _load_deferred(cls, instances: List['Model'], names: Tuple[str, ...]) -> None:
+        """
+        Load the given fields of every instance that lacks one of them, by primary key.
+        """
+        pk = cls._require_pk()
+        pending = {}
+        for obj in instances:
+            if not all(_is_loaded(obj, name) for name in names):
+                pending[cls._pk_to_db(getattr(obj, pk))] = obj
+        keys = list(pending)
+        columns = tuple(names)
+        decode_row = cls.orm_manager._decode_row
+        for start in range(0, len(keys), 900):
+            chunk = keys[start:start + 900]
+            query = f"SELECT {pk}, {', '.join(columns)} FROM {cls._table} WHERE {pk} IN ({', '.join('?' * len(chunk))})"
+            for key, *values in await cls._fetch(query, *chunk):
+                obj = pending[key]
+                for name, value in zip(columns, decode_row(cls._table, columns, tuple(values))):
+                    converter = cls._converters.get(name)
+                    if not _is_loaded(obj, name):
+                        object.__setattr__(obj, name, value if value is None or converter is None else converter(value))
+
+    @classmethod
+    def _require_pk(cls) -> str:
+        if cls._pk is None:
+            raise ORMMException(f"'{cls.__name__}' has no primary key field.")
+        return cls._pk
+
+    def _insert_statement(self) -> Tuple:
+        """
+        Get the INSERT statement for a new instance, followed by its parameters.
+
+        The statement precompiled by ModelMeta is used when every field other than an unset primary
+        key is set and the table has no codec columns; otherwise it is built from the set fields.
+
+        Returns:
+            tuple: The query followed by its parameters, ready to unpack into 'execute_query'.
+        """
+        cls = type(self)
+        if not cls.orm_manager.codecs.get(cls._table):
+            try:
+                if getattr(self, cls._pk, None) is None:
+                    return (cls._sql['insert_auto'], *cls._insert_values(self))
+                return (cls._sql['insert'], *cls._row_values(self))
+            except AttributeError:
+                pass
+        values = cls._to_db(self.to_dict())
+        return (f"INSERT INTO {cls._table} ({', '.join(values)}) VALUES ({', '.join('?' * len(values))})", *values.values())
+
+    @classmethod
+    def _to_db(cls, values: Dict[str, Union[str, int, float]]) -> Dict[str, Union[str, int, float, bytes]]:
+        """
+        Convert field values to their stored form: the fields' 'to_db' converters, then the manager's codecs.
+
+        Args:
+            values (dict): Dictionary of field names and Python values.
+
+        Returns:
+            dict: The values as they are written to the database.
+        """
+        adapters = cls._adapters
+        if adapters:
+            values = {name: value if value is None or name not in adapters else adapters[name](value)
+                      for name, value in values.items()}
+        return cls.orm_manager._encode_values(cls._table, values)
+
+    @classmethod
+    def _pk_to_db(cls, value):
+        """
+        Convert a primary key value to its stored form.
+        """
+        adapt = cls._adapters.get(cls._pk)
+        return value if adapt is None or value is None else adapt(value)
+
+    @classmethod
+    def _to_python(cls, values: Dict[str, Union[str, int, float]]) -> Dict:
+        """
+        Convert stored column values to Python values with the fields' 'to_python' converters.
+
+        Args:
+            values (dict): Dictionary of column names and stored values.
+
+        Returns:
+            dict: The converted values.
+        """
+        converters = cls._converters
+        if not converters:
+            return values
+        return {name: value if value is None or name not in converters else converters[name](value)
+                for name, value in values.items()}
+
+    @classmethod
+    def _update_sql(cls, columns: Tuple[str, ...]) -> str:
+        """
+        Get the UPDATE-by-primary-key statement for the given columns, building it on first use.
+
+        Args:
+            columns (Tuple[str, ...]): The columns to set, in parameter order.
+
+        Returns:
+            str: The SQL statement.
+        """
+        query = cls._updates.get(columns)
+        if query is None:
+            assignments = ', '.join(f"{name} = ?" for name in columns)
+            query = cls._updates[columns] = f"UPDATE {cls._table} SET {assignments} WHERE {cls._pk} = ?"
+        return query
+
+    @classmethod
+    async def get(cls, pk) -> Optional['Model']:
+        """
+        Get an instance by primary key.
+
+        Args:
+            pk: The primary key value.
+
+        Returns:
+            Optional[Model]: The instance, or None if no row has that key.
+
+        Raises:
+            ORMMException: If ORMManager instance is not set or the model has no primary key field.
+        """
+        if cls.orm_manager is None:
+            raise ORMMException("ORMManager instance is not set.")
+        cls._require_pk()
+        rows = await cls._fetch(cls._sql['select_pk'], cls._pk_to_db(pk))
+        return cls._hydrate(rows)[0] if rows else None
+
+    async def delete(self) -> None:
+        """
+        Delete the instance's row by primary key. The instance is treated as new afterwards, so
+        'save' inserts it again.
+
+        Raises:
+            ORMMException: If ORMManager instance is not set or the model has no primary key field.
+        """
+        cls = type(self)
+        if cls.orm_manager is None:
+            raise ORMMException("ORMManager instance is not set.")
+        cls._require_pk()
+        await cls.orm_manager.raw.execute_query(cls._sql['delete_pk'], cls._pk_to_db(getattr(self, cls._pk)))
+        if hasattr(self, '_dirty'):
+            object.__delattr__(self, '_dirty')
+
+    @classmethod
+    async def _execute_insert(cls, query: str, *args) -> int:
+        """
+        Run an INSERT and commit it like 'Raw.execute_query', returning the new rowid.
+
+        The statement runs on its own cursor and the rowid is read from that cursor, so saves
+        running concurrently on the shared connection do not see each other's rows.
+        """
+        manager = cls.orm_manager
+        started = time.perf_counter() if manager.query_listeners else 0.0
+        try:
+            async with manager.connection.execute(query, args) as cursor:
+                rowid = cursor.lastrowid
+            await manager.connection.commit()
+        except Exception as e:
+            await manager.connection.rollback()
+            raise RuntimeError(f"Error executing query: {str(e)}")
+        manager.result_cache.note_write(query)
+        if manager.query_listeners:
+            manager._notify_query(query, args, time.perf_counter() - started)
+        return rowid
+
+    async def save(self) -> None:
+        """
+        Write the instance to the database.
+
+        A new instance is inserted and, when its primary key was not set, receives the new rowid.
+        A loaded instance is updated by primary key, writing only its changed fields; nothing is
+        sent when no field changed.
+
+        Raises:
+            ORMMException: If ORMManager instance is not set, the model has no primary key field, or
+                the primary key of a loaded instance was changed.
+        """
+        cls = type(self)
+        if cls.orm_manager is None:
+            raise ORMMException("ORMManager instance is not set.")
+        pk = cls._require_pk()
+        dirty = getattr(self, '_dirty', None)
+        if dirty is None:
+            rowid = await cls._execute_insert(*self._insert_statement())
+            if getattr(self, pk, None) is None:
+                object.__setattr__(self, pk, rowid)
+        elif dirty:
+            if pk in dirty:
+                raise ORMMException(f"The primary key of a saved '{cls.__name__}' cannot be changed.")
+            columns = tuple(sorted(dirty))
+            values = cls._to_db({name: getattr(self, name) for name in columns})
+            await cls.orm_manager.raw.execute_query(cls._update_sql(columns), *values.values(), cls._pk_to_db(getattr(self, pk)))
+        object.__setattr__(self, '_dirty', ())
+
+    @classmethod
+    async def bulk_save(cls, instances: List['Model']) -> int:
+        """
+        Save many instances in one transaction.
+
+        Loaded instances are grouped by their set of changed fields and each group is written with a
+        single 'executemany' UPDATE; clean instances are skipped. New instances are grouped by their
+        set fields and inserted with 'executemany', except those without a primary key value, which
+        are inserted one by one to receive their rowid.
+
+        Args:
+            instances (List[Model]): Instances of this model.
+
+        Returns:
+            int: The number of instances written.
+
+        Raises:
+            ORMMException: If ORMManager instance is not set, the model has no primary key field, or
+                there is an error writing the rows. The transaction is rolled back on error.
+        """
+        if cls.orm_manager is None:
+            raise ORMMException("ORMManager instance is not set.")
+        pk = cls._require_pk()
+        manager = cls.orm_manager
+        table_name = cls.get_table_name()
+        updates: Dict[Tuple[str, ...], List['Model']] = {}
+        inserts: Dict[Tuple[str, ...], List['Model']] = {}
+        single_inserts: List['Model'] = []
+        for instance in instances:
+            dirty = getattr(instance, '_dirty', None)
+            if dirty is None:
+                if getattr(instance, pk, None) is None:
+                    single_inserts.append(instance)
+                else:
+                    inserts.setdefault(tuple(instance.to_dict()), []).append(instance)
+            elif dirty:
+                if pk in dirty:
+                    raise ORMMException(f"The primary key of a saved '{cls.__name__}' cannot be changed.")
+                updates.setdefault(tuple(sorted(dirty)), []).append(instance)
+
+        connection = manager.connection
+        written = 0
+        try:
+            for columns, group in inserts.items():
+                rows = [tuple(cls._to_db(instance.to_dict()).values()) for instance in group]
+                await connection.executemany(f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})", rows)
+                written += len(group)
+            for instance in single_inserts:
+                values = cls._to_db(instance.to_dict())
+                values.pop(pk, None)
+                if values:
+                    query = f"INSERT INTO {table_name} ({', '.join(values)}) VALUES ({', '.join('?' * len(values))})"
+                else:
+                    query = f"INSERT INTO {table_name} DEFAULT VALUES"
+                cursor = await connection.execute(query, tuple(values.values()))
+                object.__setattr__(instance, pk, cursor.lastrowid)
+                written += 1
+            for columns, group in updates.items():
+                rows = [
+                    tuple(cls._to_db({name: getattr(instance, name) for name in columns}).values()) + (cls._pk_to_db(getattr(instance, pk)),)
+                    for instance in group
+                ]
+                assignments = ', '.join(f"{name} = ?" for name in columns)
+                await connection.executemany(f"UPDATE {table_name} SET {assignments} WHERE {pk} = ?", rows)
+                written += len(group)
+            await connection.commit()
+        except aiosqlite.Error as e:
+            await connection.rollback()
+            raise ORMMException(f"Error saving instances: {str(e)}")
+        manager.touch(table_name)
+
+        for instance in single_inserts:
+            object.__setattr__(instance, '_dirty', ())
+        for group in list(inserts.values()) + list(updates.values()):
+            for instance in group:
+                object.__setattr__(instance, '_dirty', ())
+        return written
+
+    @classmethod
+    async def validate(cls, values: Dict[str, Union[str, int, float]]) -> List[str]:
+        """
+        Validate a row of values against the fields' compiled checks.
+
+        Args:
+            values (Dict[str, Union[str, int, float]]): The values keyed by field name. Absent fields
+                only fail fields that are required.
+
+        Returns:
+            List[str]: The names of the invalid fields, empty if the row is valid.
+        """
+        invalid = [name for name, check in cls._checks.items() if not check(values.get(name, MISSING))]
+        for name, validators in cls._async_checks.items():
+            value = values.get(name)
+            if name in invalid or value is None:
+                continue
+            for validator in validators:
+                if not await validator(value):
+                    invalid.append(name)
+                    break
+        return invalid
+
+    @classmethod
+    async def validate_many(cls, rows: List[Dict[str, Union[str, int, float]]]) -> Dict[int, List[str]]:
+        """
+        Validate many rows column by column.
+
+        Each field's compiled check is mapped over the column's values, so the per-row cost is one
+        call per checked field with no per-row setup.
+        Async validators are awaited only for values that passed the synchronous checks.
+
+        Args:
+            rows (List[Dict[str, Union[str, int, float]]]): The rows, as dictionaries keyed by field name.
+
+        Returns:
+            Dict[int, List[str]]: The names of the invalid fields keyed by row index, for invalid rows only.
+        """
+        errors: Dict[int, List[str]] = {}
+        for name, check in cls._checks.items():
+            for index, valid in enumerate(map(check, (row.get(name, MISSING) for row in rows))):
+                if not valid:
+                    errors.setdefault(index, []).append(name)
+        for name, validators in cls._async_checks.items():
+            for index, row in enumerate(rows):
+                value = row.get(name)
+                if value is None or name in errors.get(index, ()):
+                    continue
+                for validator in validators:
+                    if not await validator(value):
+                        errors.setdefault(index, []).append(name)
+                        break
+        return dict(sorted(errors.items()))
+
+    @classmethod
+    async def insert_many(cls, rows: List[Dict[str, Union[str, int, float]]], validate: bool = True) -> int:
+        """
+        Insert many rows in one transaction.
+
+        The rows are validated first with 'validate_many', then grouped by their set of columns and
+        each group is inserted with a single 'executemany'.
+
+        For models with searchable fields, the FTS5 insert trigger is dropped for the duration of the
+        transaction and each group is indexed in one statement instead of one trigger call per row:
+        groups with explicit rowids only are indexed with an 'executemany', the others with a single
+        'INSERT ... SELECT' over the rowids above the table's previous maximum, plus the explicit
+        rowids at or below it.
+
+        Args:
+            rows (List[Dict[str, Union[str, int, float]]]): The rows, as dictionaries keyed by field name.
+            validate (bool): Validate the rows before inserting them. Default is True.
+
+        Returns:
+            int: The number of rows inserted.
+
+        Raises:
+            ORMMException: If ORMManager instance is not set, a row is invalid (nothing is inserted), or
+                there is an error inserting the rows. The transaction is rolled back on error.
+        """
+        if cls.orm_manager is None:
+            raise ORMMException("ORMManager instance is not set.")
+        if validate:
+            errors = await cls.validate_many(rows)
+            if errors:
+                details = '; '.join(f"row {index}: {', '.join(names)}" for index, names in list(errors.items())[:10])
+                raise ORMMException(f"{len(errors)} invalid row(s) for '{cls.__name__}': {details}")
+        groups: Dict[Tuple[str, ...], List[Dict]] = {}
+        for row in rows:
+            groups.setdefault(tuple(row), []).append(row)
+
+        table_name = cls.get_table_name()
+        connection = cls.orm_manager.connection
+        trigger = fts_triggers(table_name)['insert']
+        statements = cls._search_statements() if cls._fts and rows else {}
+        indexed = False
+        if statements:
+            async with connection.execute("SELECT sql FROM sqlite_master WHERE name = ?", (trigger,)) as cursor:
+                indexed = await cursor.fetchone() == (statements[trigger],)
+        try:
+            if indexed:
+                if not connection.in_transaction:
+                    await connection.execute("BEGIN")
+                await connection.execute(f"DROP TRIGGER {trigger}")
+            for columns, group in groups.items():
+                values = [tuple(cls._to_db(row).values()) for row in group]
+                query = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+                if not indexed:
+                    await connection.executemany(query, values)
+                    continue
+                await cls._insert_indexed(connection, query, columns, values)
+            if indexed:
+                await connection.execute(statements[trigger])
+            await connection.commit()
+        except aiosqlite.Error as e:
+            await connection.rollback()
+            raise ORMMException(f"Error inserting rows: {str(e)}")
+        cls.orm_manager.touch(table_name)
+        return len(rows)
+
+    @classmethod
+    async def _insert_indexed(cls, connection, query: str, columns: Tuple[str, ...], values: List[Tuple]) -> None:
+        """
+        Insert a group of rows and add them to the FTS5 index, while the insert trigger is dropped.
+
+        A group mixing explicit and assigned keys indexes every row above the previous maximum rowid
+        in one 'INSERT ... SELECT', then the explicit keys at or below it one by one.
+        """
+        fts = fts_table(cls._table)
+        names = ', '.join(cls._fts)
+        rowid = cls._rowid_pk()
+        if rowid in columns and all(value[columns.index(rowid)] is not None for value in values):
+            await connection.executemany(query, values)
+            positions = [columns.index(name) if name in columns else None for name in (rowid,) + cls._fts]
+            await connection.executemany(
+                f"INSERT INTO {fts}(rowid, {names}) VALUES ({', '.join('?' * len(positions))})",
+                [tuple(None if position is None else value[position] for position in positions) for value in values]
+            )
+            return
+        async with connection.execute(f"SELECT max(rowid) FROM {cls._table}") as cursor:
+            last = (await cursor.fetchone())[0]
+        floor = last if last is not None else -2 ** 63
+        await connection.executemany(query, values)
+        await connection.execute(
+            f"INSERT INTO {fts}(rowid, {names}) SELECT rowid, {names} FROM {cls._table} WHERE rowid > ?", (floor,)
+        )
+        if rowid in columns:
+            position = columns.index(rowid)
+            below = [(value[position], floor) for value in values if value[position] is not None]
+            if below:
+                await connection.executemany(
+                    f"INSERT INTO {fts}(rowid, {names}) SELECT rowid, {names} FROM {cls._table} WHERE rowid = ? AND rowid <= ?",
+                    below
+                )
+
     @classmethod
     def set_manager(cls, manager) -> None:
         """
@@ -30,6 +591,9 @@ class Model(metaclass=ModelMeta):
             manager (ORMManager): The ORMManager instance to be used by the model.
         """
         cls.orm_manager = manager
+        for field_name, field in getattr(cls, '_fields', {}).items():
+            if field.codec is not None:
+                manager.set_codec(cls.get_table_name(), field_name, field.codec)
         
     @classmethod
     def get_fields(cls) -> Dict[str, Field]:
@@ -56,14 +620,12 @@ class Model(metaclass=ModelMeta):
         """
         Generate the SQL schema for creating a table based on the model's fields.
 
+        The statement is precompiled by ModelMeta.
+
         Returns:
             str: The SQL schema string for creating the table.
         """
-        columns_definitions = [
-            f"{field_name} {field.data_type} {' '.join(rule.value for rule in field.constraints if rule)}"
-            for field_name, field in cls.get_fields().items()
-        ]
-        return f"CREATE TABLE IF NOT EXISTS {cls.get_table_name()} ({', '.join(columns_definitions)})"
+        return cls._sql['create']
 
     @classmethod
     async def alter_table_schema(cls) -> None:
@@ -146,7 +708,7 @@ class Model(metaclass=ModelMeta):
         if cls.orm_manager is None:
             raise ORMMException("ORMManager instance is not set.")
         
-        constraints_str = ' '.join(rule.value for rule in constraints if rule) if constraints else ''
+        constraints_str = Rules.render(constraints)
         await cls.orm_manager.add_column(cls.get_table_name(), column_name, data_type, constraints_str)
 
     @classmethod
@@ -163,7 +725,12 @@ class Model(metaclass=ModelMeta):
         if cls.orm_manager is None:
             raise ORMMException("ORMManager instance is not set.")
         
-        await cls.orm_manager.insert_row(cls.get_table_name(), values)
+        values = cls._to_db(values)
+        if tuple(values) == cls._columns:
+            query = cls._sql['insert']
+        else:
+            query = f"INSERT INTO {cls._table} ({', '.join(values)}) VALUES ({', '.join('?' * len(values))})"
+        await cls.orm_manager.raw.execute_query(query, *values.values())
 
     @classmethod
     async def delete_column(cls, column_name: str) -> None:
@@ -196,7 +763,7 @@ class Model(metaclass=ModelMeta):
         if cls.orm_manager is None:
             raise ORMMException("ORMManager instance is not set.")
         
-        query = f"DELETE FROM {cls.get_table_name()} WHERE {condition}"
+        query = f"{cls._sql['delete']} WHERE {condition}"
         await cls.orm_manager.raw.execute_query(query, *args)
         
     @classmethod
@@ -215,19 +782,22 @@ class Model(metaclass=ModelMeta):
         if cls.orm_manager is None:
             raise ORMMException("ORMManager instance is not set.")
         
-        await cls.orm_manager.update_row(cls.get_table_name(), values, condition, *args)
+        values = cls._to_db(values)
+        assignments = ', '.join(f"{name} = ?" for name in values)
+        await cls.orm_manager.raw.execute_query(f"UPDATE {cls._table} SET {assignments} WHERE {condition}", *values.values(), *args)
 
     @classmethod
-    async def select_one(cls, condition: str, *args) -> Optional[Dict[str, Union[str, int, float]]]:
+    async def select_one(cls, condition: str, *args, as_model: bool = False) -> Optional[Union['Model', Dict[str, Union[str, int, float]]]]:
         """
         Search for a single row in the table based on a condition using the ORMManager instance.
 
         Args:
             condition (str): The condition to identify the row to select.
             *args: Additional arguments for the query.
+            as_model (bool): Return a model instance instead of a dictionary. Default is False.
 
         Returns:
-            Optional[Dict[str, Union[str, int, float]]]: The selected row as a dictionary, or None if no row is found.
+            Optional[Union[Model, Dict[str, Union[str, int, float]]]]: The selected row, or None if no row is found.
         
         Raises:
             ORMMException: If ORMManager instance is not set.
@@ -235,20 +805,34 @@ class Model(metaclass=ModelMeta):
         if cls.orm_manager is None:
             raise ORMMException("ORMManager instance is not set.")
        
-        query = f"SELECT * FROM {cls.get_table_name()} WHERE {condition}"
-        result = await cls.orm_manager.fetch_all(query, *args)
+        if as_model:
+            if cls._deferred_fields:
+                return await cls.objects.where(condition, *args).first()
+            query = f"{cls._sql['select']} WHERE {condition} LIMIT 1"
+            result = await cls._fetch(query, *args)
+            return cls._hydrate(result)[0] if result else None
+
+        columns = await cls._dict_columns()
+        query = f"SELECT {', '.join(columns)} FROM {cls.get_table_name()} WHERE {condition}"
+        result = await cls._fetch(query, *args)
         if result:
-            columns = await cls.get_table_columns()
-            return dict(zip(columns.keys(), result[0]))
+            return cls._to_python(dict(zip(columns, cls.orm_manager._decode_row(cls._table, columns, result[0]))))
         return None
     
     @classmethod
-    async def select(cls) -> List[Dict[str, Union[str, int, float]]]:
+    async def select(cls, as_model: bool = False) -> List[Union['Model', Dict[str, Union[str, int, float]]]]:
         """
         Search for all rows in the table using the ORMManager instance.
 
+        Args:
+            as_model (bool): Return model instances built straight from the cursor rows instead of
+                dictionaries. Instances are slotted and hydrated by a compiled constructor, which
+                uses less memory and time for large result sets. Default is False.
+
+        Fields declared with 'deferred=True' are left out of both forms; instances load them on demand.
+
         Returns:
-            List[Dict[str, Union[str, int, float]]]: A list of dictionaries representing all rows in the table.
+            List[Union[Model, Dict[str, Union[str, int, float]]]]: All rows in the table.
         
         Raises:
             ORMMException: If ORMManager instance is not set.
@@ -256,11 +840,242 @@ class Model(metaclass=ModelMeta):
         if cls.orm_manager is None:
             raise ORMMException("ORMManager instance is not set.")
         
-        query = f"SELECT * FROM {cls.get_table_name()}"
-        results = await cls.orm_manager.fetch_all(query)
-        columns = await cls.get_table_columns()
+        if as_model:
+            if cls._deferred_fields:
+                return [obj async for obj in cls.objects]
+            results = await cls._fetch(cls._sql['select'])
+            return cls._hydrate(results)
+
+        columns = await cls._dict_columns()
+        query = f"SELECT {', '.join(columns)} FROM {cls.get_table_name()}"
+        results = await cls._fetch(query)
+        decode_row = cls.orm_manager._decode_row
   
-        return [dict(zip(columns.keys(), row)) for row in results]
+        return [cls._to_python(dict(zip(columns, decode_row(cls._table, columns, row)))) for row in results]
+
+    @classmethod
+    async def aggregate(cls, *args, count=None, sum=None, avg=None, min=None, max=None, group_by: Optional[List[str]] = None,
+                        where: Optional[Union[str, Dict]] = None, having: Optional[str] = None,
+                        order_by: Optional[List[str]] = None, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Compute aggregates in the database with a single SELECT ... GROUP BY query.
+
+        Args:
+            *args: Parameters for a string 'where' condition.
+            count, sum, avg, min, max: The fields to aggregate; 'count' also accepts True for COUNT(*).
+            group_by (Optional[List[str]]): The fields to group by.
+            where (Optional[Union[str, Dict]]): A SQL condition, or a dictionary of QuerySet lookups.
+            having (Optional[str]): SQL condition applied to the groups.
+            order_by (Optional[List[str]]): Group fields or result keys; prefix '-' to sort descending.
+            limit (Optional[int]): The maximum number of groups.
+
+        Returns:
+            list: One dictionary per group, see 'QuerySet.aggregate'.
+
+        Raises:
+            ORMMException: If ORMManager instance is not set, or an aggregate or field name is invalid.
+        """
+        queryset = cls.objects
+        if isinstance(where, dict):
+            queryset = queryset.filter(**where)
+        elif where:
+            queryset = queryset.where(where, *args)
+        return await queryset.aggregate(count=count, sum=sum, avg=avg, min=min, max=max, group_by=group_by,
+                                        having=having, order_by=order_by, limit=limit)
+
+    @classmethod
+    async def search(cls, query: str, rank: bool = True, limit: Optional[int] = None,
+                     as_model: bool = False) -> List[Union['Model', Dict[str, Union[str, int, float]]]]:
+        """
+        Search the model's searchable fields with an FTS5 query.
+
+        The query runs against the model's FTS5 index and joins the matching rows by rowid, so no row
+        is scanned. See 'QuerySet.search' to combine a search with other filters.
+
+        Args:
+            query (str): The FTS5 query, such as 'sqlite AND "full text"' or 'prefix*'.
+            rank (bool): Order the rows by relevance (bm25), best first. Default is True.
+            limit (Optional[int]): The maximum number of rows.
+            as_model (bool): Return model instances instead of dictionaries. Default is False.
+
+        Returns:
+            List[Union[Model, Dict[str, Union[str, int, float]]]]: The matching rows.
+
+        Raises:
+            ORMMException: If ORMManager instance is not set or the model has no searchable fields.
+        """
+        if cls.orm_manager is None:
+            raise ORMMException("ORMManager instance is not set.")
+        queryset = cls.objects.search(query, rank=rank)
+        if limit is not None:
+            queryset = queryset.limit(limit)
+        instances = await queryset
+        if as_model:
+            return instances
+        return [instance.to_dict() for instance in instances]
+
+    @classmethod
+    async def within(cls, box, as_model: bool = False) -> List[Union['Model', Dict[str, Union[str, int, float]]]]:
+        """
+        Get the rows whose box lies entirely inside a bounding box, through the model's R*Tree index.
+
+        Args:
+            box (Sequence[Sequence]): A (low, high) pair of bounds per 'Meta.rtree' dimension, in order,
+                such as ((min_lon, max_lon), (min_lat, max_lat)). A bound of None leaves that side open.
+            as_model (bool): Return model instances instead of dictionaries. Default is False.
+
+        Returns:
+            List[Union[Model, Dict[str, Union[str, int, float]]]]: The matching rows.
+
+        Raises:
+            ORMMException: If ORMManager instance is not set, the model has no R*Tree index or the box
+                does not match its dimensions.
+        """
+        if cls.orm_manager is None:
+            raise ORMMException("ORMManager instance is not set.")
+        instances = await cls.objects.within(box)
+        return instances if as_model else [instance.to_dict() for instance in instances]
+
+    @classmethod
+    async def overlapping(cls, box, as_model: bool = False) -> List[Union['Model', Dict[str, Union[str, int, float]]]]:
+        """
+        Get the rows whose box overlaps a bounding box or range, through the model's R*Tree index.
+
+        Args:
+            box (Sequence[Sequence]): A (low, high) pair of bounds per 'Meta.rtree' dimension, in order,
+                such as ((start, end),) for a time range. A bound of None leaves that side open.
+            as_model (bool): Return model instances instead of dictionaries. Default is False.
+
+        Returns:
+            List[Union[Model, Dict[str, Union[str, int, float]]]]: The matching rows.
+
+        Raises:
+            ORMMException: If ORMManager instance is not set, the model has no R*Tree index or the box
+                does not match its dimensions.
+        """
+        if cls.orm_manager is None:
+            raise ORMMException("ORMManager instance is not set.")
+        instances = await cls.objects.overlapping(box)
+        return instances if as_model else [instance.to_dict() for instance in instances]
+
+    @classmethod
+    async def optimize_search(cls) -> None:
+        """
+        Merge the segments of the model's FTS5 index into one, which makes later searches faster.
+        Worth running after large bulk inserts.
+
+        Raises:
+            ORMMException: If ORMManager instance is not set or the model has no searchable fields.
+        """
+        await cls._search_command('optimize')
+
+    @classmethod
+    async def rebuild_search(cls) -> None:
+        """
+        Rebuild the model's FTS5 index from the table, for rows written while the triggers were bypassed.
+
+        Raises:
+            ORMMException: If ORMManager instance is not set or the model has no searchable fields.
+        """
+        await cls._search_command('rebuild')
+
+    @classmethod
+    async def _search_command(cls, command: str) -> None:
+        if cls.orm_manager is None:
+            raise ORMMException("ORMManager instance is not set.")
+        if not cls._fts:
+            raise ORMMException(f"'{cls.__name__}' has no searchable fields")
+        fts = fts_table(cls._table)
+        connection = cls.orm_manager.connection
+        try:
+            await connection.execute(f"INSERT INTO {fts}({fts}) VALUES (?)", (command,))
+            await connection.commit()
+        except aiosqlite.Error as e:
+            await connection.rollback()
+            raise ORMMException(f"Error running '{command}' on the search index: {str(e)}")
+
+    @classmethod
+    def _rowid_pk(cls) -> Optional[str]:
+        """
+        Get the primary key field when it aliases the rowid (declared INTEGER PRIMARY KEY), else None.
+        """
+        if cls._pk is not None and cls._fields[cls._pk].data_type.upper() == 'INTEGER':
+            return cls._pk
+        return None
+
+    @classmethod
+    def _search_statements(cls) -> Dict[str, str]:
+        """
+        Get the statements of the model's FTS5 index and its sync triggers, keyed by object name.
+        """
+        return fts_statements(cls.get_table_name(), cls._fts, cls._rowid_pk())
+
+    @classmethod
+    def _rtree_statements(cls) -> Dict[str, str]:
+        """
+        Get the statements of the model's R*Tree index and its sync triggers, keyed by object name.
+        """
+        return rtree_statements(cls.get_table_name(), cls._rtree, cls._rowid_pk())
+
+    @classmethod
+    async def _fetch(cls, query: str, *args) -> List[Tuple]:
+        """
+        Fetch all rows of a query on the model's table, through the result cache when 'Meta.cache' is set.
+        """
+        if cls._cached:
+            return await cls.orm_manager.fetch_cached((cls._table,), query, *args)
+        return await cls.orm_manager.fetch_all(query, *args)
+
+    @classmethod
+    async def _dict_columns(cls) -> List[str]:
+        """
+        Get the table's columns for dictionary results, leaving out the model's deferred fields.
+        """
+        return [name for name in await cls.get_table_columns() if name not in cls._deferred_fields]
+
+    @classmethod
+    def _column_list(cls) -> str:
+        """
+        Get the model's columns in field order, for queries hydrated with '_from_row'.
+
+        Returns:
+            str: Comma separated column names.
+        """
+        return ', '.join(cls._fields)
+
+    @classmethod
+    def _loader(cls, columns: Tuple[str, ...]):
+        """
+        Get the compiled constructor for rows holding the given columns, compiling it on first use.
+
+        Args:
+            columns (Tuple[str, ...]): The field names, in row order.
+
+        Returns:
+            Callable: A function building an instance from a row tuple.
+        """
+        loader = cls._loaders.get(columns)
+        if loader is None:
+            loader = cls._loaders[columns] = type(cls)._compile_from_row(cls, columns)
+        return loader
+
+    @classmethod
+    def _hydrate(cls, rows: List[Tuple]) -> List['Model']:
+        """
+        Build model instances from rows fetched with '_column_list', decoding codec columns.
+
+        Args:
+            rows (List[Tuple]): The fetched rows, in field order.
+
+        Returns:
+            List[Model]: The model instances.
+        """
+        table_name = cls.get_table_name()
+        if cls.orm_manager.codecs.get(table_name):
+            decode_row = cls.orm_manager._decode_row
+            columns = list(cls._fields)
+            rows = [decode_row(table_name, columns, row) for row in rows]
+        return list(map(cls._from_row, rows))
   
     @classmethod
     async def get_table_columns(cls) -> Dict[str, str]:
@@ -305,6 +1120,10 @@ class Model(metaclass=ModelMeta):
         for existing_column in existing_columns:
             if existing_column not in model_fields:
                 await cls.orm_manager.delete_column(table_name, existing_column)
+        await cls.orm_manager.sync_generated_columns(cls)
+        await cls.orm_manager.sync_indexes(cls)
+        await cls.orm_manager.sync_search(cls)
+        await cls.orm_manager.sync_rtree(cls)
                 
     @classmethod
     async def map_model(cls) -> None:
@@ -323,6 +1142,10 @@ class Model(metaclass=ModelMeta):
         for field_name, field_obj in cls._fields.items():
             if field_name not in existing_columns:
                 await cls.orm_manager.add_column(table_name, field_name, field_obj.data_type, field_obj.constraints)
+        await cls.orm_manager.sync_generated_columns(cls)
+        await cls.orm_manager.sync_indexes(cls)
+        await cls.orm_manager.sync_search(cls)
+        await cls.orm_manager.sync_rtree(cls)
     
     @classmethod
     def get_orm_manager(cls):
@@ -1,8 +1,15 @@
-from typing import Dict, Type, Optional
+from typing import Dict, List, Type, Optional
+import hashlib
 from .ORMException import ORMMException
+from .Session import Session
+from .Index import MARKER
+from .FullText import fts_table, fts_triggers
+from .RTree import rtree_fill, rtree_table, rtree_triggers
 from ..Manager.Manager import Manager
 import aiosqlite
 
+SCHEMA_TABLE = '_dbunify_schema'
+
 class ORMManager(Manager):
     async def __aenter__(self):
         """
@@ -23,6 +30,7 @@ class ORMManager(Manager):
             exc_val (Exception): The value of the exception if one occurred within the `async with` block.
             exc_tb (traceback): The traceback of the exception if one occurred within the `async with` block.
         """
+        await self.stop_maintenance()
         if self.connection:
             await self.connection.close()
 
@@ -76,31 +84,314 @@ class ORMManager(Manager):
             for existing_column in existing_columns:
                 if existing_column not in model_fields:
                     await self.delete_column(table_name, existing_column)
+            await self.sync_generated_columns(model)
+            await self.sync_indexes(model)
+            await self.sync_search(model)
+            await self.sync_rtree(model)
         except Exception as e:
             raise ORMMException(f"Error applying migrations: {str(e)}")
 
-    async def map_model(self, model: Type['Model']) -> None:
+    async def map_model(self, model: Type['Model'], force: bool = False) -> None:
         """
-        Map a model to a database table and create it if it doesn't exist asynchronously.
+        Map a model to a database table and create it if it doesn't exist.
+
+        Nothing is executed when the fingerprint stored for the table matches the model's schema.
 
         Args:
             model (Type[Model]): The model class to be mapped to the database.
+            force (bool): Check the table and migrate even if the fingerprint matches. Default is False.
 
         Raises:
             ORMMException: If there is an error mapping the model.
         """
+        await self.map_models([model], force=force)
+
+    async def map_models(self, models: List[Type['Model']], force: bool = False) -> List[str]:
+        """
+        Map many models to database tables, creating or migrating only those whose schema changed.
+
+        The fingerprints stored for every table are read with a single query. Models whose
+        fingerprint matches (and whose table still exists) are skipped; the others are created or
+        migrated and their new fingerprints are stored. Partitioned models map their own partitions and view.
+
+        Args:
+            models (List[Type[Model]]): The model classes to be mapped to the database.
+            force (bool): Check and migrate every model even if its fingerprint matches. Default is False.
+
+        Returns:
+            list: The names of the tables that were created or migrated.
+
+        Raises:
+            ORMMException: If there is an error mapping a model.
+        """
         from .Model import Model
 
         try:
-            table_name = model.get_table_name()
-            columns = [(field_name, field_obj.data_type, field_obj.constraints) for field_name, field_obj in model.get_fields().items()]
-            if not await self.table_exists(table_name):
-                await self.create_table(table_name, columns)
-            else:
-                await self.apply_migrations(model)
+            stored = {} if force else await self._stored_fingerprints()
+            changed = {}
+            for model in models:
+                table_name = model.get_table_name()
+                if getattr(model, '_partition_by', None) is not None:
+                    await model.map_model()
+                    continue
+                for field_name, field_obj in model.get_fields().items():
+                    if field_obj.codec is not None:
+                        self.set_codec(table_name, field_name, field_obj.codec)
+                fingerprint = await self.schema_fingerprint(model)
+                if stored.get(table_name) == fingerprint:
+                    continue
+                columns = [(field_name, field_obj.data_type, field_obj.constraints) for field_name, field_obj in model.get_fields().items()]
+                if not await self.table_exists(table_name):
+                    await self.create_table(table_name, columns)
+                    await self.sync_generated_columns(model)
+                    await self.sync_indexes(model)
+                    await self.sync_search(model)
+                    await self.sync_rtree(model)
+                else:
+                    await self.apply_migrations(model)
+                changed[table_name] = fingerprint
+            if changed:
+                await self._store_fingerprints(changed)
+            return list(changed)
         except Exception as e:
             raise ORMMException(f"Error mapping model: {str(e)}")
 
+    @staticmethod
+    async def schema_fingerprint(model: Type['Model']) -> str:
+        """
+        Get a stable hash of the schema a model generates: its CREATE TABLE statement, its index
+        definitions, its generated columns and the statements of its full-text search and R*Tree indexes.
+
+        Args:
+            model (Type[Model]): The model class.
+
+        Returns:
+            str: The SHA-256 hex digest.
+        """
+        table_name = model.get_table_name()
+        parts = [await model.create_table_schema()]
+        parts.extend(sorted(index.sql(table_name) for index in getattr(model, '_indexes', [])))
+        parts.extend(f"{column} AS ({expression})" for column, expression in getattr(model, '_generated', {}).items())
+        if getattr(model, '_fts', ()):
+            parts.extend(model._search_statements().values())
+        if getattr(model, '_rtree', ()):
+            parts.extend(model._rtree_statements().values())
+        return hashlib.sha256('\n'.join(parts).encode()).hexdigest()
+
+    async def _stored_fingerprints(self) -> Dict[str, str]:
+        """
+        Read the stored fingerprints of every table that still exists, with a single query.
+
+        Returns:
+            dict: Fingerprints keyed by table name, empty if none were stored yet.
+        """
+        try:
+            async with self.connection.execute(
+                f"SELECT s.name, s.fingerprint FROM {SCHEMA_TABLE} s "
+                "JOIN sqlite_master m ON m.type = 'table' AND m.name = s.name"
+            ) as cursor:
+                rows = await cursor.fetchall()
+        except aiosqlite.Error:
+            return {}
+        return dict(rows)
+
+    async def _store_fingerprints(self, fingerprints: Dict[str, str]) -> None:
+        """
+        Store table fingerprints, creating the metadata table on first use.
+
+        Args:
+            fingerprints (dict): Fingerprints keyed by table name.
+        """
+        await self.connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {SCHEMA_TABLE} (name TEXT PRIMARY KEY, fingerprint TEXT NOT NULL)"
+        )
+        await self.connection.executemany(
+            f"INSERT OR REPLACE INTO {SCHEMA_TABLE} (name, fingerprint) VALUES (?, ?)", list(fingerprints.items())
+        )
+        await self.connection.commit()
+
+    async def sync_indexes(self, model: Type['Model']) -> Dict[str, List[str]]:
+        """
+        Create and drop indexes so the table matches the model's declared indexes.
+
+        Only indexes created by DbUnify (marked in their SQL) are dropped. An index whose definition
+        changed is dropped and recreated. All changes run in a single transaction, and nothing is
+        executed when the indexes already match.
+
+        Args:
+            model (Type[Model]): The model class.
+
+        Returns:
+            dict: The names of the 'created' and 'dropped' indexes.
+
+        Raises:
+            ORMMException: If there is an error building the indexes. The transaction is rolled back.
+        """
+        table_name = model.get_table_name()
+        desired = {index.get_name(table_name): index.sql(table_name) for index in getattr(model, '_indexes', [])}
+        existing = dict(await self.fetch_all(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql LIKE ?",
+            table_name, f"%{MARKER}"
+        ))
+        dropped = [name for name, sql in existing.items() if desired.get(name) != sql]
+        created = [name for name, sql in desired.items() if existing.get(name) != sql]
+        if not dropped and not created:
+            return {'created': [], 'dropped': []}
+        try:
+            await self.connection.execute("BEGIN")
+            for name in dropped:
+                await self.connection.execute(f"DROP INDEX {name}")
+            for name in created:
+                await self.connection.execute(desired[name])
+            await self.connection.commit()
+        except aiosqlite.Error as e:
+            await self.connection.rollback()
+            raise ORMMException(f"Error building indexes for '{table_name}': {str(e)}")
+        return {'created': created, 'dropped': dropped}
+
+    async def sync_generated_columns(self, model: Type['Model']) -> List[str]:
+        """
+        Add the model's missing VIRTUAL generated columns (see 'JSONField.index_paths') to its table.
+
+        Generated columns are computed when read and take no space in the rows. Columns that are no
+        longer declared are left in place; their managed indexes are dropped by 'sync_indexes'.
+
+        Args:
+            model (Type[Model]): The model class.
+
+        Returns:
+            list: The names of the columns that were added.
+
+        Raises:
+            ORMMException: If a generated column clashes with a field or cannot be added.
+        """
+        generated = getattr(model, '_generated', {})
+        if not generated:
+            return []
+        table_name = model.get_table_name()
+        clashing = [column for column in generated if column in model._fields]
+        if clashing:
+            raise ORMMException(f"Generated column '{clashing[0]}' clashes with a field of '{model.__name__}'.")
+        existing = {row[1] for row in await self.fetch_all(f"PRAGMA table_xinfo({table_name})")}
+        added = [column for column in generated if column not in existing]
+        try:
+            for column in added:
+                await self.connection.execute(
+                    f"ALTER TABLE {table_name} ADD COLUMN {column} GENERATED ALWAYS AS ({generated[column]}) VIRTUAL"
+                )
+            await self.connection.commit()
+        except aiosqlite.Error as e:
+            await self.connection.rollback()
+            raise ORMMException(f"Error adding generated columns to '{table_name}': {str(e)}")
+        return added
+
+    async def sync_search(self, model: Type['Model']) -> Dict[str, List[str]]:
+        """
+        Create, rebuild or drop the model's FTS5 index and its sync triggers so they match the
+        model's searchable fields.
+
+        The FTS5 table and triggers are recognised by name. Objects whose definition changed are
+        dropped and recreated, and a new FTS5 table is filled from the existing rows with a single
+        'rebuild'. All changes run in a single transaction, and nothing is executed when they match.
+
+        Args:
+            model (Type[Model]): The model class.
+
+        Returns:
+            dict: The names of the 'created' and 'dropped' tables and triggers.
+
+        Raises:
+            ORMMException: If a searchable field is unknown or there is an error building the index.
+                The transaction is rolled back.
+        """
+        table_name = model.get_table_name()
+        fts = fts_table(table_name)
+        columns = getattr(model, '_fts', ())
+        self._check_columns(model, columns)
+        desired = model._search_statements() if columns else {}
+        return await self._sync_companion(table_name, fts, list(fts_triggers(table_name).values()), desired,
+                                          f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+    async def sync_rtree(self, model: Type['Model']) -> Dict[str, List[str]]:
+        """
+        Create, refill or drop the model's R*Tree index and its sync triggers so they match the
+        model's 'Meta.rtree' dimensions.
+
+        The R*Tree table and triggers are recognised by name. Objects whose definition changed are
+        dropped and recreated, and a new R*Tree table is filled from the existing rows with a single
+        'INSERT ... SELECT'. All changes run in a single transaction, and nothing is executed when they match.
+
+        Args:
+            model (Type[Model]): The model class.
+
+        Returns:
+            dict: The names of the 'created' and 'dropped' tables and triggers.
+
+        Raises:
+            ORMMException: If a dimension column is unknown, there are more than 5 dimensions, or there
+                is an error building the index. The transaction is rolled back.
+        """
+        table_name = model.get_table_name()
+        dimensions = getattr(model, '_rtree', ())
+        if len(dimensions) > 5:
+            raise ORMMException(f"'{model.__name__}' declares {len(dimensions)} R*Tree dimensions; at most 5 are supported.")
+        self._check_columns(model, [column for dimension in dimensions for column in dimension])
+        desired = model._rtree_statements() if dimensions else {}
+        return await self._sync_companion(table_name, rtree_table(table_name), list(rtree_triggers(table_name).values()),
+                                          desired, rtree_fill(table_name, dimensions) if dimensions else '')
+
+    @staticmethod
+    def _check_columns(model: Type['Model'], columns) -> None:
+        unknown = [name for name in columns if name not in model._fields]
+        if unknown:
+            raise ORMMException(f"'{model.__name__}' has no field '{unknown[0]}' to index.")
+
+    async def _sync_companion(self, table_name: str, companion: str, triggers: List[str],
+                        desired: Dict[str, str], fill: str) -> Dict[str, List[str]]:
+        """
+        Make a companion virtual table and its sync triggers match their desired statements.
+
+        Args:
+            table_name (str): The indexed table.
+            companion (str): The companion table name.
+            triggers (List[str]): The names of its triggers.
+            desired (dict): The desired statements keyed by object name, empty to drop everything.
+            fill (str): The statement filling a newly created companion table from the existing rows.
+
+        Returns:
+            dict: The names of the 'created' and 'dropped' tables and triggers.
+        """
+        names = [companion] + triggers
+        existing = dict(await self.fetch_all(
+            f"SELECT name, sql FROM sqlite_master WHERE name IN ({', '.join('?' * len(names))})", *names
+        ))
+        dropped = [name for name, sql in existing.items() if desired.get(name) != sql]
+        created = [name for name, sql in desired.items() if existing.get(name) != sql]
+        if not dropped and not created:
+            return {'created': [], 'dropped': []}
+        try:
+            await self.connection.execute("BEGIN")
+            for name in sorted(dropped, key=lambda name: name == companion):
+                await self.connection.execute(f"DROP {'TABLE' if name == companion else 'TRIGGER'} {name}")
+            for name in created:
+                await self.connection.execute(desired[name])
+            if companion in created:
+                await self.connection.execute(fill)
+            await self.connection.commit()
+        except aiosqlite.Error as e:
+            await self.connection.rollback()
+            raise ORMMException(f"Error building '{companion}' for '{table_name}': {str(e)}")
+        return {'created': created, 'dropped': dropped}
+
+    def session(self) -> Session:
+        """
+        Start a unit of work with an identity map over this manager's connection.
+
+        Returns:
+            Session: A new session.
+        """
+        return Session(self)
+
     async def table_exists(self, table_name: str) -> bool:
         """
         Check if a table exists in the database asynchronously.
@@ -127,5 +418,6 @@ class ORMManager(Manager):
         This method should be implemented to ensure that resources related to `ORMManager`
         are properly released and no resources are left open.
         """
+        await self.stop_maintenance()
         if hasattr(self, 'connection') and self.connection:
             await self.connection.close()
@@ -0,0 +1,121 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+from .ORMException import ORMMException
+
+def rtree_table(table_name: str) -> str:
+    """
+    Get the name of the R*Tree table indexing a table.
+
+    Args:
+        table_name (str): The indexed table.
+
+    Returns:
+        str: The R*Tree table name.
+    """
+    return f"{table_name}_rtree"
+
+def rtree_triggers(table_name: str) -> Dict[str, str]:
+    """
+    Get the names of the triggers keeping a table's R*Tree index in sync, keyed by event.
+
+    Args:
+        table_name (str): The indexed table.
+
+    Returns:
+        dict: The trigger names keyed by 'insert', 'delete' and 'update'.
+    """
+    rtree = rtree_table(table_name)
+    return {'insert': f"{rtree}_ai", 'delete': f"{rtree}_ad", 'update': f"{rtree}_au"}
+
+def _present(prefix: str, dimensions: Sequence[Tuple[str, str]]) -> str:
+    columns = dict.fromkeys(column for dimension in dimensions for column in dimension)
+    return ' AND '.join(f"{prefix}{column} IS NOT NULL" for column in columns)
+
+def rtree_statements(table_name: str, dimensions: Sequence[Tuple[str, str]],
+                     rowid_column: Optional[str] = None) -> Dict[str, str]:
+    """
+    Get the statements of an R*Tree index over some columns of a table, exactly as SQLite stores them
+    in 'sqlite_master'.
+
+    The R*Tree table holds one box per row, keyed by the row's rowid, with a (min, max) pair of
+    coordinates per dimension. Three triggers keep it in sync with inserts, deletes and updates of
+    the indexed columns inside the writing transaction. Rows with a NULL coordinate are not indexed.
+
+    Args:
+        table_name (str): The indexed table.
+        dimensions (Sequence[Tuple[str, str]]): The (min, max) column pair of each dimension. A point
+            dimension uses the same column twice.
+        rowid_column (Optional[str]): The INTEGER PRIMARY KEY column aliasing the rowid, if any. Updates
+            of it also move the box.
+
+    Returns:
+        dict: The statements keyed by object name, the R*Tree table first.
+    """
+    rtree = rtree_table(table_name)
+    triggers = rtree_triggers(table_name)
+    coordinates = ', '.join(f"min{index}, max{index}" for index in range(len(dimensions)))
+    values = ', '.join(f"new.{low}, new.{high}" for low, high in dimensions)
+    watched = ', '.join(dict.fromkeys([column for dimension in dimensions for column in dimension]
+                                      + ([rowid_column] if rowid_column else [])))
+    insert = f"INSERT INTO {rtree} SELECT new.rowid, {values} WHERE {_present('new.', dimensions)};"
+    delete = f"DELETE FROM {rtree} WHERE id = old.rowid;"
+    return {
+        rtree: f"CREATE VIRTUAL TABLE {rtree} USING rtree(id, {coordinates})",
+        triggers['insert']: f"CREATE TRIGGER {triggers['insert']} AFTER INSERT ON {table_name} BEGIN {insert} END",
+        triggers['delete']: f"CREATE TRIGGER {triggers['delete']} AFTER DELETE ON {table_name} BEGIN {delete} END",
+        triggers['update']: f"CREATE TRIGGER {triggers['update']} AFTER UPDATE OF {watched} ON {table_name} BEGIN {delete} {insert} END",
+    }
+
+def rtree_fill(table_name: str, dimensions: Sequence[Tuple[str, str]]) -> str:
+    """
+    Get the statement filling a new R*Tree index from the rows already in the table.
+
+    Args:
+        table_name (str): The indexed table.
+        dimensions (Sequence[Tuple[str, str]]): The (min, max) column pair of each dimension.
+
+    Returns:
+        str: The statement.
+    """
+    values = ', '.join(f"{low}, {high}" for low, high in dimensions)
+    return f"INSERT INTO {rtree_table(table_name)} SELECT rowid, {values} FROM {table_name} WHERE {_present('', dimensions)}"
+
+def box_condition(table_name: str, dimensions: Sequence[Tuple[str, str]], box: Sequence[Sequence],
+                  contained: bool) -> Tuple[str, List]:
+    """
+    Compile a bounding-box query to a condition on the table.
+
+    The R*Tree stores coordinates as 32-bit floats rounded outwards, so it is used to find the rows
+    whose stored box overlaps the query box, and the exact test is then applied to the table's own
+    columns for those rows only.
+
+    Args:
+        table_name (str): The indexed table.
+        dimensions (Sequence[Tuple[str, str]]): The (min, max) column pair of each dimension.
+        box (Sequence[Sequence]): A (low, high) pair of bounds per dimension, in the order of the
+            dimensions. A bound of None leaves that side open.
+        contained (bool): Keep the rows lying entirely inside the box instead of those overlapping it.
+
+    Returns:
+        tuple: The SQL condition and its parameters.
+
+    Raises:
+        ORMMException: If the box does not have one pair of bounds per dimension.
+    """
+    if len(box) != len(dimensions) or any(len(bounds) != 2 for bounds in box):
+        raise ORMMException(f"Expected a (low, high) pair for each of the {len(dimensions)} dimension(s).")
+    rtree = rtree_table(table_name)
+    candidates, exact = [], []
+    candidate_params, exact_params = [], []
+    for index, ((low_column, high_column), (low, high)) in enumerate(zip(dimensions, box)):
+        if low is not None:
+            candidates.append(f"max{index} >= ?")
+            candidate_params.append(low)
+            exact.append(f"{table_name}.{low_column if contained else high_column} >= ?")
+            exact_params.append(low)
+        if high is not None:
+            candidates.append(f"min{index} <= ?")
+            candidate_params.append(high)
+            exact.append(f"{table_name}.{high_column if contained else low_column} <= ?")
+            exact_params.append(high)
+    condition = f"{table_name}.rowid IN (SELECT id FROM {rtree}{' WHERE ' if candidates else ''}{' AND '.join(candidates)})"
+    return ' AND '.join([condition] + exact), candidate_params + exact_params
@@ -1,9 +1,83 @@
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, BinaryIO, Callable, Dict, List, Optional, Union
 import base64
 import binascii
 import shutil
 import asyncio
- 
+import os
+import time
+from ...QueryPlan import QueryPlan
+
+
+_AIOSQLITE_SUPPORTED = "aiosqlite>=0.17,<0.23"
+
+
+def _aiosqlite_private(connection, name: str):
+    """
+    Get a private attribute of an 'aiosqlite.Connection'.
+
+    aiosqlite has no public API for incremental BLOB I/O, so the BLOB methods rely on
+    'Connection._execute' (run a callable on the worker thread) and 'Connection._conn'
+    (the wrapped 'sqlite3.Connection'). Every such access goes through this function.
+
+    Args:
+        connection (aiosqlite.Connection): The connection.
+        name (str): The private attribute name.
+
+    Returns:
+        Any: The attribute value.
+
+    Raises:
+        RuntimeError: If the installed aiosqlite does not provide the attribute.
+    """
+    try:
+        return getattr(connection, name)
+    except AttributeError:
+        raise RuntimeError(f"Incremental BLOB I/O needs 'aiosqlite.Connection.{name}', which the installed "
+                           f"aiosqlite does not provide. Supported versions: {_AIOSQLITE_SUPPORTED}.")
+
+
+class AsyncBlob:
+    """
+    # AsyncBlob Class
+
+    #### Awaitable wrapper around a 'sqlite3.Blob' handle. Every call runs on the aiosqlite worker thread
+    #### that owns the connection, so the handle can be used from the event loop.
+    """
+
+    def __init__(self, connection, blob):
+        """
+        Initialize the AsyncBlob instance.
+
+        Args:
+            connection (aiosqlite.Connection): The connection that opened the handle.
+            blob (sqlite3.Blob): The underlying BLOB handle.
+        """
+        self.connection = connection
+        self.blob = blob
+        self._execute = _aiosqlite_private(connection, '_execute')
+
+    async def read(self, length: int = -1) -> bytes:
+        return await self._execute(self.blob.read, length)
+
+    async def write(self, data: Union[bytes, bytearray, memoryview]) -> None:
+        await self._execute(self.blob.write, data)
+
+    async def seek(self, offset: int, origin: int = os.SEEK_SET) -> None:
+        await self._execute(self.blob.seek, offset, origin)
+
+    async def tell(self) -> int:
+        return await self._execute(self.blob.tell)
+
+    async def close(self) -> None:
+        await self._execute(self.blob.close)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
 class Raw:
     """
     # Raw Class
@@ -31,6 +105,7 @@ class Raw:
             manager (Manager): The Manager instance managing the database connection.
         """
         self.manager = manager
+        self._base64_columns: Dict[str, set] = {}
 
     async def backup_database(self, backup_path: str) -> bool:
         """
@@ -85,10 +160,14 @@ class Raw:
         if not self.manager.connection:
             raise RuntimeError("Database connection is not initialized.")
 
+        started = time.perf_counter() if self.manager.query_listeners else 0.0
         try:
             async with self.manager.connection.cursor() as cursor:
                 await cursor.execute(query, args)
                 await self.manager.connection.commit()
+            self.manager.result_cache.note_write(query)
+            if self.manager.query_listeners:
+                self.manager._notify_query(query, args, time.perf_counter() - started)
             return True
         except Exception as e:
             if self.manager.connection:
@@ -113,10 +192,82 @@ class Raw:
         except Exception as e:
             raise RuntimeError(f"Error listing tables: {str(e)}")
         
+    async def explain(self, query: str, *args: Any) -> QueryPlan:
+        """
+        Get the parsed 'EXPLAIN QUERY PLAN' tree of a query without running it.
+
+        Args:
+            query (str): The SQL query to be explained.
+            *args: Parameters to be passed to the query.
+
+        Returns:
+            QueryPlan: The plan tree of the query.
+
+        Raises:
+            RuntimeError: If there is an error explaining the query.
+        """
+        try:
+            async with self.manager.connection.cursor() as cursor:
+                await cursor.execute(f"EXPLAIN QUERY PLAN {query}", args)
+                return QueryPlan.from_rows(query, await cursor.fetchall())
+        except Exception as e:
+            raise RuntimeError(f"Error explaining query: {str(e)}")
+
+    async def _record_base64_columns(self, cursor, table_name: str, columns: List[str]) -> None:
+        """
+        Record which columns of a table hold base64 encoded data.
+
+        The columns are stored in the '_dbunify_base64' metadata table so that 'read_base64'
+        can decode only those columns. Already recorded columns are skipped without a query.
+
+        Args:
+            cursor (aiosqlite.Cursor): The cursor used for the surrounding insert.
+            table_name (str): Name of the table.
+            columns (list): Names of the encoded columns.
+        """
+        known = self._base64_columns.setdefault(table_name, set())
+        missing = [column for column in columns if column not in known]
+        if not missing:
+            return
+        await cursor.execute(
+            "CREATE TABLE IF NOT EXISTS _dbunify_base64 (table_name TEXT NOT NULL, column_name TEXT NOT NULL, "
+            "PRIMARY KEY (table_name, column_name))"
+        )
+        await cursor.executemany(
+            "INSERT OR IGNORE INTO _dbunify_base64 (table_name, column_name) VALUES (?, ?)",
+            [(table_name, column) for column in missing]
+        )
+        known.update(missing)
+
+    async def get_base64_columns(self, table_name: str) -> List[str]:
+        """
+        Get the columns of a table recorded as base64 encoded by 'insert_base64'.
+
+        Args:
+            table_name (str): Name of the table.
+
+        Returns:
+            list: The recorded column names, empty if none were recorded.
+
+        Raises:
+            RuntimeError: If there is an error reading the metadata table.
+        """
+        try:
+            async with self.manager.connection.cursor() as cursor:
+                await cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='_dbunify_base64'")
+                if await cursor.fetchone() is None:
+                    return []
+                await cursor.execute("SELECT column_name FROM _dbunify_base64 WHERE table_name = ?", (table_name,))
+                return [row[0] for row in await cursor.fetchall()]
+        except Exception as e:
+            raise RuntimeError(f"Error reading base64 metadata: {str(e)}")
+
     async def insert_base64(self, table_name: str, data_dict: Dict[str, Any]) -> None:
         """
         Insert base64 encoded data into a database table.
 
+        The encoded columns are recorded in the '_dbunify_base64' metadata table.
+
         Args:
             table_name (str): Name of the table to insert data into.
             data_dict (dict): A dictionary where keys are column names, and values are data to be encoded and inserted.
@@ -128,21 +279,120 @@ class Raw:
             raise RuntimeError("Database connection is not initialized.")
 
         try:
+            encoded_data_dict = {column: base64.b64encode(str(data).encode()).decode() for column, data in
+                                 data_dict.items()}
+            columns = ', '.join(encoded_data_dict.keys())
+            values = ', '.join(['?' for _ in encoded_data_dict])
+            query = f"INSERT INTO {table_name} ({columns}) VALUES ({values})"
             async with self.manager.connection.cursor() as cursor:
-                await cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-                tables = await cursor.fetchall()
-                return [table[0] for table in tables]
+                await self._record_base64_columns(cursor, table_name, list(encoded_data_dict.keys()))
+                await cursor.execute(query, tuple(encoded_data_dict.values()))
+            await self.manager.connection.commit()
         except Exception as e:
-            raise RuntimeError(f"Error listing tables: {str(e)}")
-        
+            self._base64_columns.pop(table_name, None)
+            await self.manager.connection.rollback()
+            raise RuntimeError(f"Error inserting base64 data: {str(e)}")
+
+    def _decode_base64_guess(self, column_names: List[str], row: tuple) -> Dict[str, Any]:
+        """
+        Decode a row by trying base64 on every column and keeping the raw value on failure.
+
+        Args:
+            column_names (list): Names of the selected columns.
+            row (tuple): The fetched row.
+
+        Returns:
+            dict: The row with every decodable value replaced by bytes.
+        """
+        row_data = {}
+        for i in range(len(row)):
+            if isinstance(row[i], str):
+                try:
+                    base64_decoded = base64.b64decode(row[i])
+                    row_data[column_names[i]] = base64_decoded
+                except binascii.Error:
+                    row_data[column_names[i]] = row[i]
+            else:
+                try:
+                    base64_decoded = base64.b64decode(str(row[i]))
+                    row_data[column_names[i]] = base64_decoded
+                except (binascii.Error, TypeError):
+                    row_data[column_names[i]] = row[i]
+        return row_data
 
-    async def read_base64(self, table_name: str, only_base64: bool) -> List[Dict[str, Any]]:
+    async def iter_base64(self, table_name: str, only_base64: bool = False, columns: Optional[List[str]] = None,
+                          batch_size: int = 1000,
+                          on_error: Optional[Callable[[str, Any, Exception], None]] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream rows from a table, decoding base64 encoded columns.
+
+        Only the declared columns are decoded. When 'columns' is None the columns recorded by
+        'insert_base64' are used, and if none were recorded every column is tried as before. An
+        empty list decodes nothing. A declared value that is not valid base64 is kept as stored and
+        passed to 'on_error'; the remaining cells and rows are still read.
+        Rows are fetched with 'fetchmany' so the table is never loaded at once.
+
+        Args:
+            table_name (str): Name of the table to read data from.
+            only_base64 (bool): If True, only yield rows where at least one column was decoded.
+            columns (Optional[list]): Names of the base64 encoded columns.
+            batch_size (int): Number of rows fetched per round trip. Default is 1000.
+            on_error (Optional[Callable]): Called as on_error(column, value, error) for each declared
+                value that could not be decoded.
+
+        Yields:
+            dict: A row where keys are column names and decoded values are bytes.
+
+        Raises:
+            RuntimeError: If there is an error selecting or decoding the data.
+        """
+        try:
+            guess = False
+            if columns is None:
+                columns = await self.get_base64_columns(table_name)
+                guess = not columns
+            async with self.manager.connection.cursor() as cursor:
+                await cursor.execute(f"SELECT * FROM {table_name}")
+                column_names = [description[0] for description in cursor.description]
+                wanted = set(columns)
+                encoded = [i for i, name in enumerate(column_names) if name in wanted]
+                b64decode = base64.b64decode
+
+                rows = await cursor.fetchmany(batch_size)
+                while rows:
+                    for row in rows:
+                        if guess:
+                            row_data = self._decode_base64_guess(column_names, row)
+                            decoded = any(isinstance(value, bytes) for value in row_data.values())
+                        else:
+                            row_data = dict(zip(column_names, row))
+                            decoded = False
+                            for i in encoded:
+                                if isinstance(row[i], str):
+                                    try:
+                                        row_data[column_names[i]] = b64decode(row[i])
+                                        decoded = True
+                                    except (binascii.Error, ValueError) as e:
+                                        if on_error is not None:
+                                            on_error(column_names[i], row[i], e)
+                        if decoded or not only_base64:
+                            yield row_data
+                    rows = await cursor.fetchmany(batch_size)
+        except Exception as e:
+            raise RuntimeError(f"Error reading and decoding base64 data: {str(e)}")
+
+    async def read_base64(self, table_name: str, only_base64: bool, columns: Optional[List[str]] = None,
+                          on_error: Optional[Callable[[str, Any, Exception], None]] = None) -> List[Dict[str, Any]]:
         """
         Read and decode base64 encoded data from a database table.
 
         Args:
             table_name (str): Name of the table to read data from.
             only_base64 (bool): If True, only return rows where at least one column contains base64 encoded data.
+            columns (Optional[list]): Names of the base64 encoded columns. Defaults to the columns recorded by
+                'insert_base64', or to trying every column when none were recorded.
+            on_error (Optional[Callable]): Called as on_error(column, value, error) for each declared
+                value that could not be decoded. The value is returned as stored.
 
         Returns:
             list: A list of dictionaries where keys are column names, and values are decoded data as bytes.
@@ -150,35 +400,144 @@ class Raw:
         Raises:
             RuntimeError: If there is an error selecting or decoding the data.
         """
+        return [row async for row in self.iter_base64(table_name, only_base64, columns, on_error=on_error)]
+
+    def _blob_size(self, data: Union[bytes, bytearray, memoryview, BinaryIO]) -> int:
+        """
+        Get the number of bytes that will be written for a binary value.
+
+        Args:
+            data: A bytes-like object or a binary file object positioned at the start of the payload.
+
+        Returns:
+            int: The payload size in bytes.
+        """
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            return memoryview(data).nbytes
+        start = data.tell()
         try:
-            async with self.manager.connection.cursor() as cursor:
-                await cursor.execute(f"SELECT * FROM {table_name}")
-                rows = await cursor.fetchall()
+            return os.fstat(data.fileno()).st_size - start
+        except (AttributeError, OSError):
+            end = data.seek(0, os.SEEK_END)
+            data.seek(start)
+            return end - start
 
-                if rows:
-                    column_names = [description[0] for description in cursor.description]
-                    decoded_data = []
-                    for row in rows:
-                        row_data = {}
-                        for i in range(len(row)):
-                            if isinstance(row[i], str):
-                                try:
-                                    base64_decoded = base64.b64decode(row[i])
-                                    row_data[column_names[i]] = base64_decoded
-                                except binascii.Error:
-                                    row_data[column_names[i]] = row[i]
-                            else:
-                                try:
-                                    base64_decoded = base64.b64decode(str(row[i]))
-                                    row_data[column_names[i]] = base64_decoded
-                                except (binascii.Error, TypeError):
-                                    row_data[column_names[i]] = row[i]
-                        if not only_base64:
-                            decoded_data.append(row_data)
-                        elif any(isinstance(value, bytes) for value in row_data.values()):
-                            decoded_data.append(row_data)
-                    return decoded_data
+    def _require_blobopen(self) -> None:
+        """
+        Ensure the underlying connection supports incremental BLOB I/O.
+
+        Raises:
+            RuntimeError: If the connection is not initialized, has no 'blobopen' (Python < 3.11), or the
+                installed aiosqlite lacks the private API used to reach it.
+        """
+        if not self.manager.connection:
+            raise RuntimeError("Database connection is not initialized.")
+        if not hasattr(_aiosqlite_private(self.manager.connection, '_conn'), 'blobopen'):
+            raise RuntimeError("Incremental BLOB I/O requires Python 3.11 or newer.")
+
+    async def insert_blob(self, table_name: str, data_dict: Dict[str, Any], chunk_size: int = 65536) -> int:
+        """
+        Insert a row, storing binary values as raw bytes in BLOB columns.
+
+        Bytes-like values and binary file objects are reserved with 'zeroblob()' and then written
+        in chunks through 'Connection.blobopen', so file payloads are never read fully into memory.
+        Any other value is bound as a regular parameter.
+
+        Args:
+            table_name (str): Name of the table to insert data into.
+            data_dict (dict): A dictionary where keys are column names and values are the data to insert.
+            chunk_size (int): Number of bytes written per chunk. Default is 64 KiB.
+
+        Returns:
+            int: The rowid of the inserted row.
+
+        Raises:
+            RuntimeError: If there is an error inserting the data.
+        """
+        self._require_blobopen()
+        try:
+            placeholders, params, blobs = [], [], []
+            for column, data in data_dict.items():
+                if isinstance(data, (bytes, bytearray, memoryview)) or hasattr(data, 'read'):
+                    placeholders.append('zeroblob(?)')
+                    params.append(self._blob_size(data))
+                    blobs.append((column, data))
                 else:
-                    return []
+                    placeholders.append('?')
+                    params.append(data)
+
+            query = f"INSERT INTO {table_name} ({', '.join(data_dict.keys())}) VALUES ({', '.join(placeholders)})"
+            async with self.manager.connection.cursor() as cursor:
+                await cursor.execute(query, params)
+                rowid = cursor.lastrowid
+
+            for column, data in blobs:
+                async with await self.open_blob(table_name, column, rowid, readonly=False) as blob:
+                    if hasattr(data, 'read'):
+                        chunk = await asyncio.to_thread(data.read, chunk_size)
+                        while chunk:
+                            await blob.write(chunk)
+                            chunk = await asyncio.to_thread(data.read, chunk_size)
+                    else:
+                        view = memoryview(data).cast('B')
+                        for offset in range(0, len(view), chunk_size):
+                            await blob.write(view[offset:offset + chunk_size])
+
+            await self.manager.connection.commit()
+            return rowid
         except Exception as e:
-            raise RuntimeError(f"Error reading and decoding base64 data: {str(e)}")
+            await self.manager.connection.rollback()
+            raise RuntimeError(f"Error inserting blob data: {str(e)}")
+
+    async def open_blob(self, table_name: str, column: str, rowid: int, readonly: bool = True) -> AsyncBlob:
+        """
+        Open a BLOB handle for incremental reads and writes.
+
+        The returned handle supports awaitable 'read', 'write', 'seek' and 'tell' and can be used
+        as an async context manager. Writes cannot change the size of the stored value.
+
+        Args:
+            table_name (str): Name of the table.
+            column (str): Name of the BLOB column.
+            rowid (int): The rowid of the row holding the value.
+            readonly (bool): Open the handle read-only. Default is True.
+
+        Returns:
+            AsyncBlob: The open BLOB handle.
+
+        Raises:
+            RuntimeError: If there is an error opening the BLOB.
+        """
+        self._require_blobopen()
+        connection = self.manager.connection
+        try:
+            execute = _aiosqlite_private(connection, '_execute')
+            blob = await execute(_aiosqlite_private(connection, '_conn').blobopen, table_name, column, rowid, readonly=readonly)
+            return AsyncBlob(connection, blob)
+        except Exception as e:
+            raise RuntimeError(f"Error opening blob: {str(e)}")
+
+    async def read_blob(self, table_name: str, column: str, rowid: int, chunk_size: int = 65536) -> AsyncIterator[memoryview]:
+        """
+        Stream a BLOB value in chunks without materializing the whole object.
+
+        Args:
+            table_name (str): Name of the table.
+            column (str): Name of the BLOB column.
+            rowid (int): The rowid of the row holding the value.
+            chunk_size (int): Maximum number of bytes per chunk. Default is 64 KiB.
+
+        Yields:
+            memoryview: Consecutive slices of the stored value.
+
+        Raises:
+            RuntimeError: If there is an error reading the BLOB.
+        """
+        async with await self.open_blob(table_name, column, rowid) as blob:
+            try:
+                chunk = await blob.read(chunk_size)
+                while chunk:
+                    yield memoryview(chunk)
+                    chunk = await blob.read(chunk_size)
+            except Exception as e:
+                raise RuntimeError(f"Error reading blob: {str(e)}")
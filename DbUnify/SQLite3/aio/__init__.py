@@ -1,4 +1,5 @@
 from .Manager.Manager import Manager
 from .Exporter.Exporter import Exporter
 from .Raw.Raw import Raw
-from .ORM import Model
\ No newline at end of file
+from .ORM import Model
+from .Maintenance.Maintenance import Maintenance
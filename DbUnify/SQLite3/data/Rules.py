@@ -12,4 +12,17 @@ class Rules(Enum):
     REFERENCES = 'REFERENCES'
     DEFERRABLE = 'DEFERRABLE'
     INITIALLY_DEFERRED = 'INITIALLY DEFERRED'
-    INITIALLY_IMMEDIATE = 'INITIALLY IMMEDIATE'
\ No newline at end of file
+    INITIALLY_IMMEDIATE = 'INITIALLY IMMEDIATE'
+
+    @staticmethod
+    def render(rules) -> str:
+        """
+        Join column constraints into SQL. Rules contribute their value, plain strings are used as they are.
+
+        Args:
+            rules (Optional[List[Union[str, Rules]]]): The constraints.
+
+        Returns:
+            str: The constraints separated by spaces.
+        """
+        return ' '.join(rule.value if isinstance(rule, Rules) else str(rule) for rule in rules if rule) if rules else ''
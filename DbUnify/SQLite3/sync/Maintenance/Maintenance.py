@@ -0,0 +1,234 @@
+from collections import deque
+from typing import Dict, List, Optional
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+class Maintenance:
+    """
+    # Maintenance Class
+
+    #### The Maintenance class keeps a database healthy by running 'PRAGMA optimize', 'ANALYZE',
+    #### 'PRAGMA incremental_vacuum(N)' and 'PRAGMA wal_checkpoint' on schedules and thresholds in a background thread.
+
+    ### Attributes:
+        - db_name (str): The name of the SQLite database file.
+        - history (deque): The most recent task results, as dictionaries.
+
+    ### Methods:
+        - __init__(self, db_name, ...): Initializes the scheduler with its intervals and thresholds.
+        - start(self): Starts the background thread.
+        - stop(self): Stops the background thread.
+        - run_once(self, force): Runs every task that is due, or every task when force is True.
+        - optimize(self): Runs 'PRAGMA optimize'.
+        - analyze(self): Runs 'ANALYZE' one table at a time.
+        - incremental_vacuum(self): Releases free pages in slices of 'vacuum_pages'.
+        - checkpoint(self): Checkpoints the WAL, truncating it when it grew past 'truncate_threshold'.
+
+    ### Note:
+        - The scheduler uses its own connection with a short busy timeout. Every step is a short
+          statement, and a step that finds the database locked is skipped until the next tick instead
+          of waiting, so foreground writers are never stalled.
+        - incremental_vacuum only has an effect on databases created with 'PRAGMA auto_vacuum = INCREMENTAL'.
+    """
+
+    def __init__(self, db_name: str, tick: float = 1.0, optimize_interval: Optional[float] = 3600,
+                 analyze_interval: Optional[float] = None, analysis_limit: int = 1000,
+                 vacuum_interval: Optional[float] = 300, freelist_threshold: int = 1000, vacuum_pages: int = 100,
+                 checkpoint_interval: Optional[float] = 60, wal_threshold: int = 4 * 1024 * 1024,
+                 truncate_threshold: int = 64 * 1024 * 1024, busy_timeout: float = 0.05, slice_pause: float = 0.05):
+        """
+        Initialize the Maintenance instance.
+
+        Args:
+            db_name (str): The name of the SQLite database file.
+            tick (float): Seconds between checks for due tasks. Default is 1 second.
+            optimize_interval (Optional[float]): Seconds between 'PRAGMA optimize' runs, None to disable. Default is 1 hour.
+            analyze_interval (Optional[float]): Seconds between full 'ANALYZE' runs, None to disable. Default is None.
+            analysis_limit (int): 'PRAGMA analysis_limit' used while analyzing. Default is 1000.
+            vacuum_interval (Optional[float]): Seconds between free page checks, None to disable. Default is 5 minutes.
+            freelist_threshold (int): Free pages needed before incremental vacuum runs. Default is 1000.
+            vacuum_pages (int): Pages released per 'incremental_vacuum' slice. Default is 100.
+            checkpoint_interval (Optional[float]): Seconds between WAL size checks, None to disable. Default is 60 seconds.
+            wal_threshold (int): WAL size in bytes that triggers a PASSIVE checkpoint. Default is 4 MiB.
+            truncate_threshold (int): WAL size in bytes that triggers a TRUNCATE checkpoint. Default is 64 MiB.
+            busy_timeout (float): Seconds a step waits for a lock before it is skipped. Default is 0.05.
+            slice_pause (float): Seconds slept between slices so foreground work can interleave. Default is 0.05.
+
+        Raises:
+            ValueError: If db_name is an in-memory database.
+        """
+        if db_name == ':memory:' or db_name.startswith('file::memory:'):
+            raise ValueError("Maintenance needs a database file; in-memory databases are private to their connection.")
+        self.db_name = db_name
+        self.tick = tick
+        self.intervals: Dict[str, Optional[float]] = {
+            'optimize': optimize_interval,
+            'analyze': analyze_interval,
+            'incremental_vacuum': vacuum_interval,
+            'checkpoint': checkpoint_interval
+        }
+        self.analysis_limit = analysis_limit
+        self.freelist_threshold = freelist_threshold
+        self.vacuum_pages = vacuum_pages
+        self.wal_threshold = wal_threshold
+        self.truncate_threshold = truncate_threshold
+        self.busy_timeout = busy_timeout
+        self.slice_pause = slice_pause
+        self.history: deque = deque(maxlen=100)
+        self._last_run: Dict[str, float] = {task: time.monotonic() for task in self.intervals}
+        self._connection: Optional[sqlite3.Connection] = None
+        self._running = False
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Get the scheduler's own connection, opening it on first use.
+
+        Returns:
+            sqlite3.Connection: A connection in autocommit mode with a short busy timeout.
+        """
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.db_name, timeout=self.busy_timeout,
+                                               isolation_level=None, check_same_thread=False)
+        return self._connection
+
+    def _pragma(self, statement: str) -> List[tuple]:
+        """
+        Run a single maintenance statement.
+
+        Args:
+            statement (str): The statement to run.
+
+        Returns:
+            list: The rows returned by the statement.
+        """
+        return self._connect().execute(statement).fetchall()
+
+    def _record(self, task: str, started: float, result) -> None:
+        """
+        Store the result of a task in the history.
+        """
+        self.history.append({'task': task, 'at': time.time(), 'elapsed': time.perf_counter() - started, 'result': result})
+
+    def optimize(self) -> None:
+        """
+        Run 'PRAGMA optimize', which analyzes only the tables whose statistics are likely stale.
+        """
+        started = time.perf_counter()
+        self._pragma(f"PRAGMA analysis_limit = {int(self.analysis_limit)}")
+        self._pragma("PRAGMA optimize")
+        self._record('optimize', started, None)
+
+    def analyze(self) -> None:
+        """
+        Run 'ANALYZE' one table at a time, pausing between tables.
+        """
+        started = time.perf_counter()
+        self._pragma(f"PRAGMA analysis_limit = {int(self.analysis_limit)}")
+        tables = [row[0] for row in self._pragma("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'")]
+        for table in tables:
+            if self._stop_event.is_set():
+                break
+            self._pragma(f'ANALYZE "{table}"')
+            self._stop_event.wait(self.slice_pause)
+        self._record('analyze', started, len(tables))
+
+    def incremental_vacuum(self) -> None:
+        """
+        Release free pages in slices of 'vacuum_pages' once the freelist exceeds 'freelist_threshold'.
+
+        Each slice is its own short write transaction, followed by a pause.
+        """
+        started = time.perf_counter()
+        if self._pragma("PRAGMA auto_vacuum")[0][0] != 2:
+            return
+        released = 0
+        free = self._pragma("PRAGMA freelist_count")[0][0]
+        if free < self.freelist_threshold:
+            return
+        while free > 0 and not self._stop_event.is_set():
+            # execute() steps the pragma once, which frees a single page; executescript runs it to completion.
+            self._connect().executescript(f"PRAGMA incremental_vacuum({int(self.vacuum_pages)})")
+            remaining = self._pragma("PRAGMA freelist_count")[0][0]
+            released += free - remaining
+            if remaining >= free:
+                break
+            free = remaining
+            self._stop_event.wait(self.slice_pause)
+        self._record('incremental_vacuum', started, released)
+
+    def checkpoint(self) -> None:
+        """
+        Checkpoint the WAL: PASSIVE above 'wal_threshold', TRUNCATE above 'truncate_threshold'.
+
+        A PASSIVE checkpoint never waits for readers or writers. A TRUNCATE checkpoint waits at most
+        'busy_timeout' and is retried on a later tick when the database is busy.
+        """
+        started = time.perf_counter()
+        if self._pragma("PRAGMA journal_mode")[0][0].lower() != 'wal':
+            return
+        wal_path = f"{self.db_name}-wal"
+        size = os.path.getsize(wal_path) if os.path.exists(wal_path) else 0
+        if size < self.wal_threshold:
+            return
+        mode = 'TRUNCATE' if size >= self.truncate_threshold else 'PASSIVE'
+        busy, log_frames, checkpointed = self._pragma(f"PRAGMA wal_checkpoint({mode})")[0]
+        self._record('checkpoint', started, {'mode': mode, 'busy': busy, 'log': log_frames, 'checkpointed': checkpointed})
+
+    def run_once(self, force: bool = False) -> None:
+        """
+        Run every task whose interval has elapsed.
+
+        Args:
+            force (bool): Run every enabled task regardless of its interval. Default is False.
+        """
+        tasks = {'optimize': self.optimize, 'analyze': self.analyze,
+                 'incremental_vacuum': self.incremental_vacuum, 'checkpoint': self.checkpoint}
+        for task, interval in self.intervals.items():
+            if interval is None or (self._stop_event.is_set() and not force):
+                continue
+            now = time.monotonic()
+            if force or now - self._last_run[task] >= interval:
+                self._last_run[task] = now
+                try:
+                    tasks[task]()
+                except sqlite3.OperationalError as e:
+                    self.history.append({'task': task, 'at': time.time(), 'elapsed': 0.0, 'result': f"skipped: {str(e)}"})
+
+    def _monitor(self) -> None:
+        """
+        Run due tasks every 'tick' seconds until stopped.
+        """
+        while self._running:
+            try:
+                self.run_once()
+            except Exception as e:
+                logging.getLogger('DbUnify').exception("Maintenance error: %s", e)
+            self._stop_event.wait(self.tick)
+
+    def start(self) -> None:
+        """
+        Start the background maintenance thread.
+        """
+        if not self._running:
+            self._running = True
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._monitor, daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop the background maintenance thread and close its connection.
+        """
+        if self._running:
+            self._running = False
+            self._stop_event.set()
+            if self._thread:
+                self._thread.join()
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
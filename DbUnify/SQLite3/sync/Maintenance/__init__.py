@@ -0,0 +1 @@
+from .Maintenance import Maintenance
@@ -1,6 +1,12 @@
 from ...data.Rules import Rules
-from ...Cache import Cache
-from typing import List, Tuple, Dict, Union, Optional
+from ...Cache import Cache, GenerationCache
+from ...Codec import Codec
+from ...QueryPlan import PlanWatchdog
+from ...Aggregate import aggregate_columns, compile_aggregate
+from ..Maintenance.Maintenance import Maintenance
+from typing import Callable, Iterator, List, Tuple, Dict, Union, Optional
+import logging
+import time
 import sqlite3
 
 class Manager:
@@ -15,11 +21,18 @@ class Manager:
         - connection: The connection object to the SQLite database.
         - cursor: The cursor object for executing SQL queries.
         - cache (Cache): An instance of the Cache class for caching query results.
+        - result_cache (GenerationCache): Results of cached models, invalidated per table on every write.
+        - check_data_version (bool): Check 'PRAGMA data_version' before cached reads, to see commits made by other connections.
+        - codecs (dict): Compression codecs per table and column.
+        - plan_watchdog (PlanWatchdog): The optional query plan watchdog used by 'fetch_all'.
+        - maintenance (Maintenance): The optional background maintenance scheduler.
+        - query_listeners (list): Callables notified of every query run through 'fetch_all' and 'Raw.execute_query'.
     
     ### Methods:
         - __init__(self, db_name): Initializes the Manager instance with the name of the SQLite database.
         - connect(self): Asynchronously connects to the SQLite database.
         - fetch_all(self, query, *args): Executes a query and fetches all results.
+        - fetch_iter(self, query, *args, batch_size): Streams the rows of a query with fetchmany.
         - create_table(self, table_name, columns): Creates a table in the database.
         - drop_table(self, table_name): Drops a table from the database.
         - add_column(self, table_name, column_name, data_type): Adds a column to an existing table.
@@ -29,6 +42,17 @@ class Manager:
         - update_row(self, table_name, values, condition): Updates a row in the table based on a condition.
         - select_one(self, table_name, condition): Searches for a single row in the table based on a condition.
         - select(self, table_name): Searches for all rows in the table.
+        - aggregate(self, table_name, *args, count, sum, avg, min, max, group_by, where, ...): Computes aggregates in a single GROUP BY query.
+        - set_codec(self, table_name, column_name, codec): Attaches a compression codec to a column.
+        - enable_plan_watchdog(self, min_rows, logger, max_checked): Flags full scans and temp B-trees issued through 'fetch_all'.
+        - disable_plan_watchdog(self): Turns the plan watchdog off.
+        - start_maintenance(self, **options): Starts the background maintenance scheduler.
+        - stop_maintenance(self): Stops the background maintenance scheduler.
+        - add_query_listener(self, listener): Registers a callable notified of every executed query and its latency.
+        - remove_query_listener(self, listener): Unregisters a query listener.
+        - fetch_cached(self, tables, query, *args): Fetches all rows through the result cache.
+        - touch(self, table_name): Invalidates the cached results read from a table.
+        - recompress_table(self, table_name, chunk_size): Rewrites a table's codec columns in chunks.
         - close(self): Closes the database connection.
     
     ### Raises:
@@ -52,6 +76,13 @@ class Manager:
         self.cache = Cache(ttl=cache_ttl)
         self.connection = None
         self.cursor = None
+        self.codecs: Dict[str, Dict[str, Codec]] = {}
+        self.result_cache = GenerationCache()
+        self.check_data_version = False
+        self._data_version: Optional[int] = None
+        self.plan_watchdog: Optional[PlanWatchdog] = None
+        self.query_listeners: List[Callable[[str, Tuple, float], None]] = []
+        self.maintenance: Optional[Maintenance] = None
         self.raw = Raw(self)
         self.connect()
 
@@ -79,12 +110,103 @@ class Manager:
         Raises:
             RuntimeError: If there is an error fetching data.
         """
+        if self.plan_watchdog is not None and self.plan_watchdog.should_check(query):
+            self._watch_plan(query, args)
+        started = time.perf_counter() if self.query_listeners else 0.0
         try:
             self.cursor.execute(query, args)
-            return self.cursor.fetchall()
+            rows = self.cursor.fetchall()
+            if self.query_listeners:
+                self._notify_query(query, args, time.perf_counter() - started)
+            return rows
         except sqlite3.Error as e:
             raise RuntimeError(f"Error executing query: {str(e)}")
 
+    def fetch_cached(self, tables: Tuple[str, ...], query: str, *args) -> List[Tuple]:
+        """
+        Execute a query and fetch all results through the result cache.
+
+        The rows are cached under the query and its parameters, and reused until one of 'tables' is
+        written through this manager, or, with 'check_data_version', by another connection.
+
+        Args:
+            tables (Tuple[str, ...]): The tables the query reads.
+            query (str): The SQL query to be executed.
+            *args: Parameters to be passed to the query.
+
+        Returns:
+            list: List of fetched rows. The list is shared with the cache and must not be modified.
+
+        Raises:
+            RuntimeError: If there is an error fetching data.
+        """
+        if self.check_data_version:
+            self._check_data_version()
+        key = (query, args)
+        rows = self.result_cache.get(key, tables)
+        if rows is None:
+            rows = self.fetch_all(query, *args)
+            self.result_cache.set(key, tables, rows)
+        return rows
+
+    def _check_data_version(self) -> None:
+        """
+        Invalidate every cached result when another connection committed since the last check.
+        """
+        cursor = self.connection.execute("PRAGMA data_version")
+        version = (cursor.fetchone())[0]
+        if self._data_version is not None and version != self._data_version:
+            self.result_cache.bump_all()
+        self._data_version = version
+
+    def touch(self, table_name: Optional[str] = None) -> None:
+        """
+        Invalidate the cached results read from a table. Writes made through this manager do this
+        already; call it after writing through the connection directly.
+
+        Args:
+            table_name (Optional[str]): The written table, or None to invalidate every cached result.
+        """
+        if table_name is None:
+            self.result_cache.bump_all()
+        else:
+            self.result_cache.bump(table_name)
+
+    def fetch_iter(self, query: str, *args, batch_size: int = 1000) -> Iterator[Tuple]:
+        """
+        Execute a query and stream its rows with 'fetchmany', on a cursor of its own.
+
+        Args:
+            query (str): The SQL query to be executed.
+            *args: Parameters to be passed to the query.
+            batch_size (int): Number of rows fetched per round trip. Default is 1000.
+
+        Yields:
+            tuple: The fetched rows.
+
+        Raises:
+            RuntimeError: If there is an error fetching data.
+        """
+        if self.plan_watchdog is not None and self.plan_watchdog.should_check(query):
+            self._watch_plan(query, args)
+        started = time.perf_counter() if self.query_listeners else 0.0
+        try:
+            cursor = self.connection.execute(query, args)
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Error executing query: {str(e)}")
+        if self.query_listeners:
+            self._notify_query(query, args, time.perf_counter() - started)
+        try:
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Error fetching data: {str(e)}")
+        finally:
+            cursor.close()
+
     def create_table(self, table_name: str, columns: List[Tuple[str, str, Optional[List[Union[str, Rules]]]]]) -> None:
         """
         Create a table in the database.
@@ -99,7 +221,7 @@ class Manager:
         try:
             columns_definitions = []
             for col_name, data_type, rules in columns:
-                rules_str = ' '.join(rule.value for rule in rules) if rules else ''
+                rules_str = Rules.render(rules)
                 columns_definitions.append(f"{col_name} {data_type} {rules_str}")
             query = f"CREATE TABLE IF NOT EXISTS {table_name} ({', '.join(columns_definitions)})"
             self.raw.execute_query(query)
@@ -122,7 +244,7 @@ class Manager:
         except sqlite3.Error as e:
             raise RuntimeError(f"Error dropping table: {str(e)}")
 
-    def add_column(self, table_name: str, column_name: str, data_type: str, constraints: str) -> None:
+    def add_column(self, table_name: str, column_name: str, data_type: str, constraints: Union[str, List[Union[str, Rules]]]) -> None:
         """
         Add a column to an existing table.
         
@@ -130,11 +252,13 @@ class Manager:
             table_name (str): Name of the table to add the column to.
             column_name (str): Name of the column to be added.
             data_type (str): Data type of the column.
-            constraints (str): Constraints to be applied on the column.
+            constraints (Union[str, List[Union[str, Rules]]]): Constraints to be applied on the column.
         
         Raises:
             RuntimeError: If there is an error adding the column.
         """
+        if not isinstance(constraints, str):
+            constraints = Rules.render(constraints)
         query = f"ALTER TABLE {table_name} ADD COLUMN {column_name} {data_type} {constraints}"
         try:
             self.raw.execute_query(query)
@@ -153,6 +277,7 @@ class Manager:
             RuntimeError: If there is an error inserting the row.
         """
         try:
+            values = self._encode_values(table_name, values)
             columns = ', '.join(values.keys())
             placeholders = ', '.join(['?' for _ in values])
             query = f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders})"
@@ -219,6 +344,7 @@ class Manager:
             RuntimeError: If there is an error updating the row.
         """
         try:
+            values = self._encode_values(table_name, values)
             set_clause = ', '.join([f"{col} = ?" for col in values])
             query = f"UPDATE {table_name} SET {set_clause} WHERE {condition}"
             self.raw.execute_query(query, *values.values(), *args)
@@ -245,7 +371,7 @@ class Manager:
             result = self.fetch_all(query, *args)
             if result:
                 columns = self.get_table_columns(table_name)
-                return dict(zip(columns.keys(), result[0]))
+                return dict(zip(columns.keys(), self._decode_row(table_name, columns.keys(), result[0])))
             return None
         except sqlite3.Error as e:
             raise RuntimeError(f"Error searching for row: {str(e)}")
@@ -267,10 +393,43 @@ class Manager:
             query = f"SELECT * FROM {table_name}"
             results = self.fetch_all(query)
             columns = self.get_table_columns(table_name)
-            return [dict(zip(columns.keys(), row)) for row in results]
+            return [dict(zip(columns.keys(), self._decode_row(table_name, columns.keys(), row))) for row in results]
         except sqlite3.Error as e:
             raise RuntimeError(f"Error searching for rows: {str(e)}")
 
+    def aggregate(self, table_name: str, *args, count=None, sum=None, avg=None, min=None, max=None,
+                  group_by: Optional[List[str]] = None, where: Optional[str] = None, having: Optional[str] = None,
+                  order_by: Optional[List[str]] = None, limit: Optional[int] = None) -> List[Dict[str, Union[str, int, float]]]:
+        """
+        Compute aggregates in the database with a single SELECT ... GROUP BY query, so only the
+        aggregated rows are fetched.
+
+        Each aggregate is a column name or a list of column names, and 'count' also accepts True
+        for COUNT(*). Results are keyed '<function>_<column>' (for example 'sum_amount'), 'count'
+        for COUNT(*), and by name for the group columns.
+
+        Args:
+            table_name (str): Name of the table.
+            *args: Parameters to be passed to the where and having conditions.
+            count, sum, avg, min, max: The columns to aggregate.
+            group_by (Optional[List[str]]): The columns to group by. Without it a single row is returned.
+            where (Optional[str]): SQL condition applied to the rows before grouping.
+            having (Optional[str]): SQL condition applied to the groups.
+            order_by (Optional[List[str]]): Group columns or result keys; prefix '-' to sort descending.
+            limit (Optional[int]): The maximum number of groups.
+
+        Returns:
+            list: One dictionary per group.
+
+        Raises:
+            ValueError: If an aggregate or column name is invalid.
+            RuntimeError: If there is an error executing the query.
+        """
+        columns = aggregate_columns({'count': count, 'sum': sum, 'avg': avg, 'min': min, 'max': max})
+        query, keys = compile_aggregate(table_name, columns, group_by or (), where, having, order_by or (), limit)
+        rows = self.fetch_all(query, *args)
+        return [dict(zip(keys, row)) for row in rows]
+
     def get_table_columns(self, table_name: str) -> Dict[str, str]:
         """
         Get the columns and their data types for a table.
@@ -291,6 +450,231 @@ class Manager:
         except sqlite3.Error as e:
             raise RuntimeError(f"Error getting table columns: {str(e)}")
 
+    def set_codec(self, table_name: str, column_name: str, codec: Optional[Codec]) -> None:
+        """
+        Attach a compression codec to a column, or detach it when codec is None.
+
+        Values written through 'insert_row' and 'update_row' are compressed by the codec,
+        and values read through 'select' and 'select_one' are decompressed transparently.
+
+        Args:
+            table_name (str): Name of the table.
+            column_name (str): Name of the column.
+            codec (Optional[Codec]): The codec to use, or None to remove it.
+        """
+        if codec is None:
+            self.codecs.get(table_name, {}).pop(column_name, None)
+        else:
+            self.codecs.setdefault(table_name, {})[column_name] = codec
+
+    def _encode_values(self, table_name: str, values: Dict[str, Union[str, int, float]]) -> Dict[str, Union[str, int, float, bytes]]:
+        """
+        Compress the values of codec columns before they are written.
+
+        Args:
+            table_name (str): Name of the table.
+            values (dict): Dictionary of column-value pairs.
+
+        Returns:
+            dict: The values with codec columns encoded.
+        """
+        codecs = self.codecs.get(table_name)
+        if not codecs:
+            return values
+        return {col: codecs[col].encode(val) if col in codecs else val for col, val in values.items()}
+
+    def _decode_row(self, table_name: str, column_names, row: Tuple) -> Tuple:
+        """
+        Decompress the values of codec columns in a fetched row.
+
+        Args:
+            table_name (str): Name of the table.
+            column_names (Iterable[str]): Names of the columns in row order.
+            row (tuple): The fetched row.
+
+        Returns:
+            tuple: The row with codec columns decoded.
+        """
+        codecs = self.codecs.get(table_name)
+        if not codecs:
+            return row
+        return tuple(Codec.decode(val) if col in codecs else val for col, val in zip(column_names, row))
+
+    def recompress_table(self, table_name: str, chunk_size: int = 500) -> int:
+        """
+        Rewrite every codec column of a table with its current codec.
+
+        The table is streamed in rowid order, 'chunk_size' rows at a time, and each chunk is
+        written and committed in its own short transaction so foreground writers are not blocked.
+        Use it after attaching a codec to an existing table or after changing its settings.
+
+        Args:
+            table_name (str): Name of the table.
+            chunk_size (int): Number of rows read and rewritten per transaction. Default is 500.
+
+        Returns:
+            int: The number of rows that were rewritten.
+
+        Raises:
+            RuntimeError: If the table has no codec columns or there is an error rewriting it.
+        """
+        codecs = self.codecs.get(table_name)
+        if not codecs:
+            raise RuntimeError(f"No codec columns registered for table '{table_name}'")
+        columns = list(codecs)
+        select_query = f"SELECT rowid, {', '.join(columns)} FROM {table_name} WHERE rowid > ? ORDER BY rowid LIMIT ?"
+        update_query = f"UPDATE {table_name} SET {', '.join(f'{col} = ?' for col in columns)} WHERE rowid = ?"
+        cursor = self.connection.cursor()
+        last_rowid, rewritten = -1, 0
+        try:
+            while True:
+                cursor.execute(select_query, (last_rowid, chunk_size))
+                rows = cursor.fetchall()
+                if not rows:
+                    return rewritten
+                updates = []
+                for rowid, *stored in rows:
+                    encoded = [codecs[col].encode(Codec.decode(val)) for col, val in zip(columns, stored)]
+                    if encoded != stored:
+                        updates.append((*encoded, rowid))
+                if updates:
+                    cursor.executemany(update_query, updates)
+                    self.connection.commit()
+                    self.result_cache.bump(table_name)
+                    rewritten += len(updates)
+                last_rowid = rows[-1][0]
+        except sqlite3.Error as e:
+            self.connection.rollback()
+            raise RuntimeError(f"Error recompressing table: {str(e)}")
+
+    def add_query_listener(self, listener: Callable[[str, Tuple, float], None]) -> None:
+        """
+        Register a callable notified of every query run through 'fetch_all' and 'Raw.execute_query'.
+
+        The listener is called as listener(query, args, elapsed) after the query succeeds,
+        where elapsed is the wall time in seconds. Queries are only timed while listeners exist.
+
+        Args:
+            listener (Callable[[str, tuple, float], None]): The callable to register.
+        """
+        if listener not in self.query_listeners:
+            self.query_listeners.append(listener)
+
+    def remove_query_listener(self, listener: Callable[[str, Tuple, float], None]) -> None:
+        """
+        Unregister a query listener.
+
+        Args:
+            listener (Callable[[str, tuple, float], None]): The callable to remove.
+        """
+        if listener in self.query_listeners:
+            self.query_listeners.remove(listener)
+
+    def _notify_query(self, query: str, args: Tuple, elapsed: float) -> None:
+        """
+        Notify every query listener of an executed query.
+
+        Args:
+            query (str): The SQL query.
+            args (tuple): Parameters passed to the query.
+            elapsed (float): Wall time of the query in seconds.
+        """
+        for listener in list(self.query_listeners):
+            listener(query, args, elapsed)
+
+    def enable_plan_watchdog(self, min_rows: int = 10000, logger: Optional[logging.Logger] = None,
+                             max_checked: int = 4096) -> PlanWatchdog:
+        """
+        Flag queries issued through 'fetch_all' that fully scan or sort large tables.
+
+        The first time a SQL string is fetched, its 'EXPLAIN QUERY PLAN' is inspected. A 'SCAN' of a table
+        or a 'USE TEMP B-TREE' step over a table with at least 'min_rows' rows is logged as a warning
+        together with the call site of the query.
+
+        Args:
+            min_rows (int): Only tables with at least this many rows are reported. Default is 10000.
+            logger (Optional[logging.Logger]): The logger to use. Defaults to the 'DbUnify' logger.
+            max_checked (int): The number of distinct SQL strings remembered as inspected. Default is 4096.
+
+        Returns:
+            PlanWatchdog: The watchdog, whose 'reports' list collects every warning.
+        """
+        self.plan_watchdog = PlanWatchdog(min_rows, logger, max_checked)
+        return self.plan_watchdog
+
+    def disable_plan_watchdog(self) -> None:
+        """
+        Turn the plan watchdog off.
+        """
+        self.plan_watchdog = None
+
+    def _estimate_rows(self, table_name: str) -> int:
+        """
+        Estimate the number of rows in a table, cached for the cache TTL.
+
+        Args:
+            table_name (str): Name of the table.
+
+        Returns:
+            int: The largest rowid, or the row count for tables without rowid.
+        """
+        key = f"__rows__:{table_name}"
+        rows = self.cache.get(key)
+        if rows is None:
+            try:
+                rows = self.connection.execute(f"SELECT MAX(rowid) FROM {table_name}").fetchone()[0] or 0
+            except sqlite3.Error:
+                rows = self.connection.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
+            self.cache.set(key, rows)
+        return rows
+
+    def _watch_plan(self, query: str, args: Tuple) -> None:
+        """
+        Explain a query and report it to the plan watchdog.
+
+        Problems explaining the query are ignored here; the query itself reports them when it runs.
+        Tables whose size cannot be estimated (such as CTE names) are left out of the report.
+
+        Args:
+            query (str): The SQL query.
+            args (tuple): Parameters to be passed to the query.
+        """
+        try:
+            plan = self.raw.explain(query, *args)
+        except (RuntimeError, sqlite3.Error):
+            return
+        row_counts = {}
+        for table in set(plan.tables()):
+            try:
+                row_counts[table] = self._estimate_rows(table)
+            except sqlite3.Error:
+                continue
+        self.plan_watchdog.inspect(plan, row_counts)
+
+    def start_maintenance(self, **options) -> Maintenance:
+        """
+        Start a background scheduler that runs 'PRAGMA optimize', 'ANALYZE', incremental vacuum and WAL
+        checkpoints on its own connection. A running scheduler is replaced.
+
+        Args:
+            **options: Intervals and thresholds passed to Maintenance.
+
+        Returns:
+            Maintenance: The running scheduler.
+        """
+        self.stop_maintenance()
+        self.maintenance = Maintenance(self.db_name, **options)
+        self.maintenance.start()
+        return self.maintenance
+
+    def stop_maintenance(self) -> None:
+        """
+        Stop the background maintenance scheduler, if one is running.
+        """
+        if self.maintenance is not None:
+            self.maintenance.stop()
+            self.maintenance = None
+
     def close(self) -> None:
         """
         Close the database connection.
@@ -298,6 +682,7 @@ class Manager:
         Raises:
             ConnectionError: If there is an error closing the connection.
         """
+        self.stop_maintenance()
         try:
             if self.connection:
                 self.connection.close()
@@ -1,10 +1,114 @@
 from ...data.Rules import Rules
-from typing import List, Optional, Union
+from ...Codec import Codec
+from .ORMException import ORMMException
+from typing import Callable, Dict, List, Optional, Union
+import inspect
+
+MISSING = object()
 
 class Field:
     """
     Base class for all model fields.
+
+    Subclasses that store values in a different form define 'to_db(value)', converting a Python
+    value to the stored value, and 'to_python(value)', converting it back. Neither is called with
+    None. Fields without conversion leave both as None, so no per-value work is done for them.
+    'converted_aggregates' names the aggregate functions whose results are converted with 'to_python'.
+    'searchable' marks fields indexed for full-text search, and 'generated_columns(name)' gives the
+    VIRTUAL generated columns derived from the field, which are created and indexed with the table.
+
+    Validators are compiled once, when the field is created, into a single synchronous 'check(value)'
+    function covering 'required', NOT NULL and the synchronous validator callables, or None when
+    there is nothing to check. A value of None or MISSING (absent) only fails 'required' or NOT NULL;
+    validator callables are called for other values only.
+    Async validators are rejected; use the aio ORM for them.
     """
-    def __init__(self, data_type: str, constraints: Optional[List[Union[str, Rules]]] = None):
+    to_db = None
+    to_python = None
+    converted_aggregates = ('min', 'max')
+    searchable = False
+
+    def __init__(self, data_type: str, constraints: Optional[List[Union[str, Rules]]] = None, codec: Optional[Codec] = None,
+                 index: bool = False, unique: bool = False, validators: Optional[List[Callable]] = None, required: bool = False,
+                 deferred: bool = False):
+        """
+        Initialize the field.
+
+        Args:
+            data_type (str): The SQL data type of the column.
+            constraints (Optional[List[Union[str, Rules]]]): Constraints applied to the column.
+            codec (Optional[Codec]): Compression codec applied transparently to the column's values.
+            index (bool): Create an index on the column. Default is False.
+            unique (bool): Create a UNIQUE index on the column. Default is False.
+            validators (Optional[List[Callable]]): Callables returning True for valid values. Callables
+                and 'required' given in constraints are treated as validators and kept out of the SQL.
+            required (bool): Reject absent and None values. Default is False.
+            deferred (bool): Leave the column out of model queries and load it on demand. Default is False.
+        """
+        constraints = list(constraints or [])
         self.data_type = data_type
-        self.constraints = constraints or []
+        self.constraints = [rule for rule in constraints if not callable(rule) and rule != 'required']
+        self.validators = [rule for rule in constraints if callable(rule)] + list(validators or [])
+        self.required = required or 'required' in constraints
+        rules = [rule.value if isinstance(rule, Rules) else str(rule).upper() for rule in self.constraints]
+        self.not_null = any('NOT NULL' in rule for rule in rules) and not any('PRIMARY KEY' in rule for rule in rules)
+        self.check, self.async_validators = self._compile_validators()
+        self.codec = codec
+        self.index = index
+        self.unique = unique
+        self.deferred = deferred
+
+    @staticmethod
+    def _is_async(validator) -> bool:
+        return inspect.iscoroutinefunction(validator) or inspect.iscoroutinefunction(getattr(validator, '__call__', None))
+
+    def generated_columns(self, name: str) -> Dict[str, str]:
+        """
+        Get the VIRTUAL generated columns derived from the field.
+
+        Args:
+            name (str): The field name.
+
+        Returns:
+            dict: The generation expressions keyed by column name; empty for plain fields.
+        """
+        return {}
+
+    def _compile_validators(self):
+        """
+        Compose the synchronous checks into one function and set the async validators apart.
+
+        Returns:
+            tuple: The check function (None when there is nothing to check) and the async validators.
+        """
+        async_validators = tuple(validator for validator in self.validators if self._is_async(validator))
+        if async_validators:
+            raise ORMMException("Async validators are only supported by the aio ORM.")
+        validators = tuple(validator for validator in self.validators if not self._is_async(validator))
+        if not (validators or self.required or self.not_null):
+            return None, async_validators
+        missing_ok = not self.required
+        none_ok = not (self.required or self.not_null)
+
+        def check(value) -> bool:
+            if value is None:
+                return none_ok
+            if value is MISSING:
+                return missing_ok
+            for validator in validators:
+                if not validator(value):
+                    return False
+            return True
+        return check, async_validators
+
+    def validate(self, value) -> bool:
+        """
+        Validate the value against the field's constraints and validators.
+
+        Args:
+            value: The value to be validated, or MISSING for an absent value.
+
+        Returns:
+            bool: True if the value is valid, False otherwise.
+        """
+        return self.check is None or self.check(value)
@@ -0,0 +1,58 @@
+from typing import Dict, Optional, Sequence
+
+def fts_table(table_name: str) -> str:
+    """
+    Get the name of the FTS5 table indexing a table.
+
+    Args:
+        table_name (str): The indexed table.
+
+    Returns:
+        str: The FTS5 table name.
+    """
+    return f"{table_name}_fts"
+
+def fts_triggers(table_name: str) -> Dict[str, str]:
+    """
+    Get the names of the triggers keeping a table's FTS5 index in sync, keyed by event.
+
+    Args:
+        table_name (str): The indexed table.
+
+    Returns:
+        dict: The trigger names keyed by 'insert', 'delete' and 'update'.
+    """
+    fts = fts_table(table_name)
+    return {'insert': f"{fts}_ai", 'delete': f"{fts}_ad", 'update': f"{fts}_au"}
+
+def fts_statements(table_name: str, columns: Sequence[str], rowid_column: Optional[str] = None) -> Dict[str, str]:
+    """
+    Get the statements of an external-content FTS5 index over some columns of a table, exactly as
+    SQLite stores them in 'sqlite_master'.
+
+    The FTS5 table stores only the index; the text is read back from the table by rowid. Three
+    triggers keep the index in sync with inserts, deletes and updates of the indexed columns.
+
+    Args:
+        table_name (str): The indexed table.
+        columns (Sequence[str]): The indexed columns.
+        rowid_column (Optional[str]): The INTEGER PRIMARY KEY column aliasing the rowid, if any. Updates
+            of it also move the index entry.
+
+    Returns:
+        dict: The statements keyed by object name, the FTS5 table first.
+    """
+    fts = fts_table(table_name)
+    triggers = fts_triggers(table_name)
+    names = ', '.join(columns)
+    new = ', '.join(f"new.{column}" for column in columns)
+    old = ', '.join(f"old.{column}" for column in columns)
+    watched = ', '.join(list(columns) + ([rowid_column] if rowid_column else []))
+    insert = f"INSERT INTO {fts}(rowid, {names}) VALUES (new.rowid, {new});"
+    delete = f"INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.rowid, {old});"
+    return {
+        fts: f"CREATE VIRTUAL TABLE {fts} USING fts5({names}, content='{table_name}', content_rowid='rowid')",
+        triggers['insert']: f"CREATE TRIGGER {triggers['insert']} AFTER INSERT ON {table_name} BEGIN {insert} END",
+        triggers['delete']: f"CREATE TRIGGER {triggers['delete']} AFTER DELETE ON {table_name} BEGIN {delete} END",
+        triggers['update']: f"CREATE TRIGGER {triggers['update']} AFTER UPDATE OF {watched} ON {table_name} BEGIN {delete} {insert} END",
+    }
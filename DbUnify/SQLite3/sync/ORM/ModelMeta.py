@@ -1,14 +1,182 @@
 from .Field import Field
+from .Index import Index
+from ...data.Rules import Rules
+
+_MISSING = object()
 
 class ModelMeta(type):
+    """
+    Metaclass for models.
+
+    It moves the Field attributes of a model into '_fields', records the primary key field in '_pk',
+    collects the field-level and 'Meta.indexes' indexes into '_indexes', gives the model '__slots__'
+    for the fields so instances carry no '__dict__', and compiles two constructors for the fields:
+
+        - __init__(self, **kwargs): Sets the given field values, ignoring unknown keys.
+        - _from_row(row): Builds an instance from a row tuple in field order without calling __init__.
+
+    It also precomputes the table name in '_table', the column order in '_columns', the model's SQL
+    statements in '_sql' (create, select, insert, and select/update/delete by primary key), and two
+    compiled value extractors, '_row_values(obj)' and '_insert_values(obj)', which return the field
+    values as a tuple in column order (the latter without the primary key).
+
+    Fields with a 'to_db' or 'to_python' converter are collected into '_adapters' and '_converters'.
+    The converters are inlined into the compiled code for those columns only, so '_from_row' and the
+    value extractors convert values without any per-value dispatch, and NULL is never converted.
+
+    The compiled validation checks of the fields are collected into '_checks', and their async
+    validators into '_async_checks', both keyed by field name and holding only the fields that have any.
+
+    'Meta.cache = True' sets '_cached', which routes the model's reads through the manager's result
+    cache; cached rows are reused until a write to the model's table bumps its generation.
+    Fields declared with 'deferred=True' are collected into '_deferred_fields'. The names in 'Meta.fts'
+    and the searchable fields (see 'SearchableTextField') are collected, in order, into '_fts'.
+    'Meta.rtree' lists the dimensions of an R*Tree index, each a (min, max) pair of fields or a single
+    field for a point; they are normalized to pairs in '_rtree'. The generated columns of the fields
+    (see 'JSONField.index_paths') are collected into '_generated', and each gets an index.
+
+    Both write the slots through their descriptors, so they bypass the dirty-field tracking of
+    Model.__setattr__. Instances built by '_from_row' are marked as loaded and clean.
+    """
+
     def __new__(cls, name, bases, attrs):
-        if name == 'Model':
+        if name in ('Model', 'PartitionedModel'):
             return super().__new__(cls, name, bases, attrs)
         
         fields = {k: v for k, v in attrs.items() if isinstance(v, Field)}
         for field_name in fields.keys():
             attrs.pop(field_name)
-        
+
+        slots = attrs.get('__slots__', ())
+        slots = (slots,) if isinstance(slots, str) else tuple(slots)
+        inherited = {slot for base in bases for klass in base.__mro__ for slot in getattr(klass, '__slots__', ())}
+        attrs['__slots__'] = slots + tuple(f for f in fields if f not in inherited and f not in slots)
+
         new_class = super().__new__(cls, name, bases, attrs)
         new_class._fields = fields
+        new_class._pk = next((field_name for field_name, field in fields.items() if cls._is_primary_key(field)), None)
+        new_class._indexes = [Index(field_name, unique=field.unique) for field_name, field in fields.items() if field.index or field.unique]
+        new_class._generated = {column: expression for field_name, field in fields.items()
+                                for column, expression in field.generated_columns(field_name).items()}
+        new_class._indexes += [Index(column) for column in new_class._generated]
+        new_class._indexes += list(getattr(attrs.get('Meta'), 'indexes', ()))
+        new_class._cached = bool(getattr(attrs.get('Meta'), 'cache', False))
+        new_class._deferred_fields = frozenset(field_name for field_name, field in fields.items()
+                                               if field.deferred and field_name != new_class._pk)
+        searchable = [field_name for field_name, field in fields.items() if field.searchable]
+        new_class._fts = tuple(dict.fromkeys(list(getattr(attrs.get('Meta'), 'fts', ())) + searchable))
+        new_class._rtree = tuple((dimension, dimension) if isinstance(dimension, str) else tuple(dimension)
+                                 for dimension in getattr(attrs.get('Meta'), 'rtree', ()))
+        new_class._adapters = {field_name: field.to_db for field_name, field in fields.items() if field.to_db is not None}
+        new_class._converters = {field_name: field.to_python for field_name, field in fields.items() if field.to_python is not None}
+        new_class._checks = {field_name: field.check for field_name, field in fields.items() if field.check is not None}
+        new_class._async_checks = {field_name: field.async_validators for field_name, field in fields.items() if field.async_validators}
+        if '__init__' not in attrs:
+            new_class.__init__ = cls._compile_init(new_class, fields)
+        new_class._from_row = staticmethod(cls._compile_from_row(new_class, fields))
+        new_class._loaders = {tuple(fields): new_class._from_row}
+        new_class._table = new_class.get_table_name()
+        new_class._columns = tuple(fields)
+        new_class._sql = cls._statements(new_class._table, fields, new_class._pk)
+        data_columns = tuple(field_name for field_name in fields if field_name != new_class._pk)
+        new_class._updates = {data_columns: new_class._sql['update_pk']} if 'update_pk' in new_class._sql else {}
+        new_class._row_values = staticmethod(cls._compile_values(new_class, '_row_values', fields))
+        new_class._insert_values = staticmethod(cls._compile_values(new_class, '_insert_values', data_columns))
         return new_class
+
+    @staticmethod
+    def _is_primary_key(field: Field) -> bool:
+        """
+        Check if a field is declared with a PRIMARY KEY constraint.
+        """
+        return any(rule == Rules.PRIMARY_KEY or (isinstance(rule, str) and 'PRIMARY KEY' in rule.upper())
+                   for rule in field.constraints)
+
+    @staticmethod
+    def _statements(table_name: str, fields: dict, pk) -> dict:
+        """
+        Build the model's SQL statements once, so hot paths do no string work.
+        """
+        columns = ', '.join(fields)
+        data_columns = [field_name for field_name in fields if field_name != pk]
+        definitions = ', '.join(f"{field_name} {field.data_type} {Rules.render(field.constraints)}" for field_name, field in fields.items())
+        sql = {
+            'create': f"CREATE TABLE IF NOT EXISTS {table_name} ({definitions})",
+            'select': f"SELECT {columns} FROM {table_name}",
+            'insert': f"INSERT INTO {table_name} ({columns}) VALUES ({', '.join('?' * len(fields))})",
+            'insert_auto': (f"INSERT INTO {table_name} ({', '.join(data_columns)}) VALUES ({', '.join('?' * len(data_columns))})"
+                            if data_columns else f"INSERT INTO {table_name} DEFAULT VALUES"),
+            'delete': f"DELETE FROM {table_name}"
+        }
+        if pk is not None:
+            sql['select_pk'] = f"{sql['select']} WHERE {pk} = ?"
+            sql['delete_pk'] = f"DELETE FROM {table_name} WHERE {pk} = ?"
+            if data_columns:
+                sql['update_pk'] = f"UPDATE {table_name} SET {', '.join(f'{name} = ?' for name in data_columns)} WHERE {pk} = ?"
+        return sql
+
+    @staticmethod
+    def _compile(source: str, name: str, namespace: dict):
+        """
+        Compile generated source and return the function it defines.
+        """
+        exec(compile(source, f"<DbUnify {name}>", 'exec'), namespace)
+        return namespace[name]
+
+    @staticmethod
+    def _setters(model, names) -> dict:
+        """
+        Get the slot descriptor setters of the given attributes, as '_set_<name>'.
+        """
+        return {f"_set_{name}": getattr(model, name).__set__ for name in names}
+
+    @classmethod
+    def _compile_init(mcs, model, fields):
+        """
+        Generate '__init__' with one keyword-only parameter per field.
+        """
+        params = ''.join(f"{name}=_MISSING, " for name in fields)
+        body = [f"    if {name} is not _MISSING: _set_{name}(_self, {name})" for name in fields] or ["    pass"]
+        source = f"def __init__(_self, *, {params}**_kwargs):\n" + '\n'.join(body)
+        init = mcs._compile(source, '__init__', dict(mcs._setters(model, fields), _MISSING=_MISSING))
+        init.__qualname__ = f"{model.__qualname__}.__init__"
+        init.__doc__ = "Initialize the model with provided field values. Keys that are not fields are ignored."
+        return init
+
+    @classmethod
+    def _compile_values(mcs, model, name: str, columns):
+        """
+        Generate a function returning the given attributes of an instance as a tuple, converted with
+        the 'to_db' of the columns that have one.
+        """
+        body, values, namespace = '', '', {}
+        for index, column in enumerate(columns):
+            if column in model._adapters:
+                body += f"    _v{index} = obj.{column}\n"
+                values += f"None if _v{index} is None else _to_{column}(_v{index}), "
+                namespace[f"_to_{column}"] = model._adapters[column]
+            else:
+                values += f"obj.{column}, "
+        return mcs._compile(f"def {name}(obj):\n{body}    return ({values})", name, namespace)
+
+    @classmethod
+    def _compile_from_row(mcs, model, fields):
+        """
+        Generate '_from_row', which unpacks a row tuple straight into the instance slots, converting
+        the columns that have a 'to_python' converter.
+        """
+        body = "    obj = _new(_model)\n"
+        converters = {}
+        for index, name in enumerate(fields):
+            if name in model._converters:
+                converters[f"_to_{name}"] = model._converters[name]
+                body += f"    _value = row[{index}]\n"
+                body += f"    _set_{name}(obj, _value if _value is None else _to_{name}(_value))\n"
+            else:
+                body += f"    _set_{name}(obj, row[{index}])\n"
+        body += "    _set__dirty(obj, ())\n"
+        source = "def _from_row(row):\n" + body + "    return obj"
+        namespace = dict(mcs._setters(model, list(fields) + ['_dirty']), _new=object.__new__, _model=model, **converters)
+        from_row = mcs._compile(source, '_from_row', namespace)
+        from_row.__qualname__ = f"{model.__qualname__}._from_row"
+        return from_row
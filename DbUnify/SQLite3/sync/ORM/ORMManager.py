@@ -1,7 +1,15 @@
 from .ORMException import ORMMException
+from .Session import Session
+from .Index import MARKER
+from .FullText import fts_table, fts_triggers
+from .RTree import rtree_fill, rtree_table, rtree_triggers
 from ..Manager.Manager import Manager
 from ...Cache import Cache
-from typing import Dict, Type
+from typing import Dict, List, Type
+import hashlib
+import sqlite3
+
+SCHEMA_TABLE = '_dbunify_schema'
 
 class ORMManager(Manager):
     """
@@ -17,7 +25,14 @@ class ORMManager(Manager):
         __exit__(self, exc_type, exc_val, exc_tb): Exit the runtime context related to this object.
         get_table_columns(self, table_name): Get the columns and their data types for a table.
         apply_migrations(self, model): Apply migrations to the database schema based on the provided model.
-        map_model(self, model): Map a model to a database table and create it if it doesn't exist.
+        map_model(self, model, force): Map a model to a database table and create it if it doesn't exist.
+        map_models(self, models, force): Map many models, skipping those whose schema fingerprint is unchanged.
+        schema_fingerprint(model): Get a stable hash of the schema a model generates.
+        session(self): Start a unit of work with an identity map.
+        sync_generated_columns(self, model): Add the model's missing generated columns.
+        sync_indexes(self, model): Create and drop indexes to match the model's declared indexes.
+        sync_search(self, model): Create, rebuild or drop the model's FTS5 index and its triggers.
+        sync_rtree(self, model): Create, refill or drop the model's R*Tree index and its triggers.
         table_exists(self, table_name): Check if a table exists in the database.
         _orm_exit(self): A private method for closing resources and performing final cleanup.
     """
@@ -96,37 +111,319 @@ class ORMManager(Manager):
                 elif existing_columns[field_name] != field_obj.data_type:
                     raise ORMMException(f"Data type mismatch for column '{field_name}' in table '{table_name}'")
             
-            if new_columns:
-                self.add_columns(table_name, new_columns)
+            for column_name, data_type, constraints in new_columns:
+                self.add_column(table_name, column_name, data_type, constraints)
             
             for existing_column in existing_columns:
                 if existing_column not in model_fields:
                     self.delete_column(table_name, existing_column)
+            self.sync_generated_columns(model)
+            self.sync_indexes(model)
+            self.sync_search(model)
+            self.sync_rtree(model)
         except Exception as e:
             raise ORMMException(f"Error applying migrations: {str(e)}")
 
-    def map_model(self, model: Type['Model']) -> None:
+    def map_model(self, model: Type['Model'], force: bool = False) -> None:
         """
         Map a model to a database table and create it if it doesn't exist.
 
+        Nothing is executed when the fingerprint stored for the table matches the model's schema.
+
         Args:
             model (Type[Model]): The model class to be mapped to the database.
+            force (bool): Check the table and migrate even if the fingerprint matches. Default is False.
 
         Raises:
             ORMMException: If there is an error mapping the model.
         """
+        self.map_models([model], force=force)
+
+    def map_models(self, models: List[Type['Model']], force: bool = False) -> List[str]:
+        """
+        Map many models to database tables, creating or migrating only those whose schema changed.
+
+        The fingerprints stored for every table are read with a single query. Models whose
+        fingerprint matches (and whose table still exists) are skipped; the others are created or
+        migrated and their new fingerprints are stored. Partitioned models map their own partitions and view.
+
+        Args:
+            models (List[Type[Model]]): The model classes to be mapped to the database.
+            force (bool): Check and migrate every model even if its fingerprint matches. Default is False.
+
+        Returns:
+            list: The names of the tables that were created or migrated.
+
+        Raises:
+            ORMMException: If there is an error mapping a model.
+        """
         from .Model import Model
 
         try:
-            table_name = model.get_table_name()
-            columns = [(field_name, field_obj.data_type, field_obj.constraints) for field_name, field_obj in model.get_fields().items()]
-            if not self.table_exists(table_name):
-                self.create_table(table_name, columns)
-            else:
-                self.apply_migrations(model)
+            stored = {} if force else self._stored_fingerprints()
+            changed = {}
+            for model in models:
+                table_name = model.get_table_name()
+                if getattr(model, '_partition_by', None) is not None:
+                    model.map_model()
+                    continue
+                for field_name, field_obj in model.get_fields().items():
+                    if field_obj.codec is not None:
+                        self.set_codec(table_name, field_name, field_obj.codec)
+                fingerprint = self.schema_fingerprint(model)
+                if stored.get(table_name) == fingerprint:
+                    continue
+                columns = [(field_name, field_obj.data_type, field_obj.constraints) for field_name, field_obj in model.get_fields().items()]
+                if not self.table_exists(table_name):
+                    self.create_table(table_name, columns)
+                    self.sync_generated_columns(model)
+                    self.sync_indexes(model)
+                    self.sync_search(model)
+                    self.sync_rtree(model)
+                else:
+                    self.apply_migrations(model)
+                changed[table_name] = fingerprint
+            if changed:
+                self._store_fingerprints(changed)
+            return list(changed)
         except Exception as e:
             raise ORMMException(f"Error mapping model: {str(e)}")
 
+    @staticmethod
+    def schema_fingerprint(model: Type['Model']) -> str:
+        """
+        Get a stable hash of the schema a model generates: its CREATE TABLE statement, its index
+        definitions, its generated columns and the statements of its full-text search and R*Tree indexes.
+
+        Args:
+            model (Type[Model]): The model class.
+
+        Returns:
+            str: The SHA-256 hex digest.
+        """
+        table_name = model.get_table_name()
+        parts = [model.create_table_schema()]
+        parts.extend(sorted(index.sql(table_name) for index in getattr(model, '_indexes', [])))
+        parts.extend(f"{column} AS ({expression})" for column, expression in getattr(model, '_generated', {}).items())
+        if getattr(model, '_fts', ()):
+            parts.extend(model._search_statements().values())
+        if getattr(model, '_rtree', ()):
+            parts.extend(model._rtree_statements().values())
+        return hashlib.sha256('\n'.join(parts).encode()).hexdigest()
+
+    def _stored_fingerprints(self) -> Dict[str, str]:
+        """
+        Read the stored fingerprints of every table that still exists, with a single query.
+
+        Returns:
+            dict: Fingerprints keyed by table name, empty if none were stored yet.
+        """
+        try:
+            rows = self.connection.execute(
+                f"SELECT s.name, s.fingerprint FROM {SCHEMA_TABLE} s "
+                "JOIN sqlite_master m ON m.type = 'table' AND m.name = s.name"
+            ).fetchall()
+        except sqlite3.Error:
+            return {}
+        return dict(rows)
+
+    def _store_fingerprints(self, fingerprints: Dict[str, str]) -> None:
+        """
+        Store table fingerprints, creating the metadata table on first use.
+
+        Args:
+            fingerprints (dict): Fingerprints keyed by table name.
+        """
+        self.connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {SCHEMA_TABLE} (name TEXT PRIMARY KEY, fingerprint TEXT NOT NULL)"
+        )
+        self.connection.executemany(
+            f"INSERT OR REPLACE INTO {SCHEMA_TABLE} (name, fingerprint) VALUES (?, ?)", list(fingerprints.items())
+        )
+        self.connection.commit()
+
+    def sync_indexes(self, model: Type['Model']) -> Dict[str, List[str]]:
+        """
+        Create and drop indexes so the table matches the model's declared indexes.
+
+        Only indexes created by DbUnify (marked in their SQL) are dropped. An index whose definition
+        changed is dropped and recreated. All changes run in a single transaction, and nothing is
+        executed when the indexes already match.
+
+        Args:
+            model (Type[Model]): The model class.
+
+        Returns:
+            dict: The names of the 'created' and 'dropped' indexes.
+
+        Raises:
+            ORMMException: If there is an error building the indexes. The transaction is rolled back.
+        """
+        table_name = model.get_table_name()
+        desired = {index.get_name(table_name): index.sql(table_name) for index in getattr(model, '_indexes', [])}
+        existing = dict(self.fetch_all(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql LIKE ?",
+            table_name, f"%{MARKER}"
+        ))
+        dropped = [name for name, sql in existing.items() if desired.get(name) != sql]
+        created = [name for name, sql in desired.items() if existing.get(name) != sql]
+        if not dropped and not created:
+            return {'created': [], 'dropped': []}
+        try:
+            self.connection.execute("BEGIN")
+            for name in dropped:
+                self.connection.execute(f"DROP INDEX {name}")
+            for name in created:
+                self.connection.execute(desired[name])
+            self.connection.commit()
+        except sqlite3.Error as e:
+            self.connection.rollback()
+            raise ORMMException(f"Error building indexes for '{table_name}': {str(e)}")
+        return {'created': created, 'dropped': dropped}
+
+    def sync_generated_columns(self, model: Type['Model']) -> List[str]:
+        """
+        Add the model's missing VIRTUAL generated columns (see 'JSONField.index_paths') to its table.
+
+        Generated columns are computed when read and take no space in the rows. Columns that are no
+        longer declared are left in place; their managed indexes are dropped by 'sync_indexes'.
+
+        Args:
+            model (Type[Model]): The model class.
+
+        Returns:
+            list: The names of the columns that were added.
+
+        Raises:
+            ORMMException: If a generated column clashes with a field or cannot be added.
+        """
+        generated = getattr(model, '_generated', {})
+        if not generated:
+            return []
+        table_name = model.get_table_name()
+        clashing = [column for column in generated if column in model._fields]
+        if clashing:
+            raise ORMMException(f"Generated column '{clashing[0]}' clashes with a field of '{model.__name__}'.")
+        existing = {row[1] for row in self.fetch_all(f"PRAGMA table_xinfo({table_name})")}
+        added = [column for column in generated if column not in existing]
+        try:
+            for column in added:
+                self.connection.execute(
+                    f"ALTER TABLE {table_name} ADD COLUMN {column} GENERATED ALWAYS AS ({generated[column]}) VIRTUAL"
+                )
+            self.connection.commit()
+        except sqlite3.Error as e:
+            self.connection.rollback()
+            raise ORMMException(f"Error adding generated columns to '{table_name}': {str(e)}")
+        return added
+
+    def sync_search(self, model: Type['Model']) -> Dict[str, List[str]]:
+        """
+        Create, rebuild or drop the model's FTS5 index and its sync triggers so they match the
+        model's searchable fields.
+
+        The FTS5 table and triggers are recognised by name. Objects whose definition changed are
+        dropped and recreated, and a new FTS5 table is filled from the existing rows with a single
+        'rebuild'. All changes run in a single transaction, and nothing is executed when they match.
+
+        Args:
+            model (Type[Model]): The model class.
+
+        Returns:
+            dict: The names of the 'created' and 'dropped' tables and triggers.
+
+        Raises:
+            ORMMException: If a searchable field is unknown or there is an error building the index.
+                The transaction is rolled back.
+        """
+        table_name = model.get_table_name()
+        fts = fts_table(table_name)
+        columns = getattr(model, '_fts', ())
+        self._check_columns(model, columns)
+        desired = model._search_statements() if columns else {}
+        return self._sync_companion(table_name, fts, list(fts_triggers(table_name).values()), desired,
+                                    f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+    def sync_rtree(self, model: Type['Model']) -> Dict[str, List[str]]:
+        """
+        Create, refill or drop the model's R*Tree index and its sync triggers so they match the
+        model's 'Meta.rtree' dimensions.
+
+        The R*Tree table and triggers are recognised by name. Objects whose definition changed are
+        dropped and recreated, and a new R*Tree table is filled from the existing rows with a single
+        'INSERT ... SELECT'. All changes run in a single transaction, and nothing is executed when they match.
+
+        Args:
+            model (Type[Model]): The model class.
+
+        Returns:
+            dict: The names of the 'created' and 'dropped' tables and triggers.
+
+        Raises:
+            ORMMException: If a dimension column is unknown, there are more than 5 dimensions, or there
+                is an error building the index. The transaction is rolled back.
+        """
+        table_name = model.get_table_name()
+        dimensions = getattr(model, '_rtree', ())
+        if len(dimensions) > 5:
+            raise ORMMException(f"'{model.__name__}' declares {len(dimensions)} R*Tree dimensions; at most 5 are supported.")
+        self._check_columns(model, [column for dimension in dimensions for column in dimension])
+        desired = model._rtree_statements() if dimensions else {}
+        return self._sync_companion(table_name, rtree_table(table_name), list(rtree_triggers(table_name).values()),
+                                    desired, rtree_fill(table_name, dimensions) if dimensions else '')
+
+    @staticmethod
+    def _check_columns(model: Type['Model'], columns) -> None:
+        unknown = [name for name in columns if name not in model._fields]
+        if unknown:
+            raise ORMMException(f"'{model.__name__}' has no field '{unknown[0]}' to index.")
+
+    def _sync_companion(self, table_name: str, companion: str, triggers: List[str],
+                        desired: Dict[str, str], fill: str) -> Dict[str, List[str]]:
+        """
+        Make a companion virtual table and its sync triggers match their desired statements.
+
+        Args:
+            table_name (str): The indexed table.
+            companion (str): The companion table name.
+            triggers (List[str]): The names of its triggers.
+            desired (dict): The desired statements keyed by object name, empty to drop everything.
+            fill (str): The statement filling a newly created companion table from the existing rows.
+
+        Returns:
+            dict: The names of the 'created' and 'dropped' tables and triggers.
+        """
+        names = [companion] + triggers
+        existing = dict(self.fetch_all(
+            f"SELECT name, sql FROM sqlite_master WHERE name IN ({', '.join('?' * len(names))})", *names
+        ))
+        dropped = [name for name, sql in existing.items() if desired.get(name) != sql]
+        created = [name for name, sql in desired.items() if existing.get(name) != sql]
+        if not dropped and not created:
+            return {'created': [], 'dropped': []}
+        try:
+            self.connection.execute("BEGIN")
+            for name in sorted(dropped, key=lambda name: name == companion):
+                self.connection.execute(f"DROP {'TABLE' if name == companion else 'TRIGGER'} {name}")
+            for name in created:
+                self.connection.execute(desired[name])
+            if companion in created:
+                self.connection.execute(fill)
+            self.connection.commit()
+        except sqlite3.Error as e:
+            self.connection.rollback()
+            raise ORMMException(f"Error building '{companion}' for '{table_name}': {str(e)}")
+        return {'created': created, 'dropped': dropped}
+
+    def session(self) -> Session:
+        """
+        Start a unit of work with an identity map over this manager's connection.
+
+        Returns:
+            Session: A new session.
+        """
+        return Session(self)
+
     def table_exists(self, table_name: str) -> bool:
         """
         Check if a table exists in the database.
@@ -152,5 +449,6 @@ class ORMManager(Manager):
 
         This method ensures that resources related to ORMManager are properly released and no resources are left open.
         """
+        self.stop_maintenance()
         if hasattr(self, 'connection') and self.connection:
             self.connection.close()
@@ -0,0 +1,504 @@
+from .Model import Model
+from .Index import Index
+from .ORMException import ORMMException
+from datetime import date, datetime, timezone
+from typing import Dict, List, Tuple, Union
+import sqlite3
+
+INTERVALS = ('day', 'month')
+
+class PartitionedModel(Model):
+    """
+    PartitionedModel Class
+
+    A model whose rows are stored in one table per day or per month, picked by a timestamp field.
+    Set 'Meta.partition_by' to the field name and 'Meta.partition_interval' to 'day' or 'month'
+    (default). An event model named 'events' writes to tables such as 'events_2026_10' or
+    'events_2026_10_19', created on first write with the model's columns and indexes.
+
+    Reads go through a view named after the model, the UNION ALL of every partition, so 'select',
+    'get', QuerySets and aggregates work unchanged. 'select_between' fans a time range out to the
+    overlapping partitions only. Retention drops whole partition tables with 'drop_partitions',
+    which frees their pages without the page rewrites and long write locks of a large DELETE.
+
+    The partition key accepts datetime and date values, ISO 8601 strings, and UNIX timestamps (UTC).
+
+    Methods:
+        partition_name(value): Gets the partition table for a timestamp.
+        partitions(): Lists the partition tables, oldest first.
+        create_partition(value): Creates the partition for a timestamp and refreshes the view.
+        drop_partitions(before): Drops the partitions that end before a timestamp.
+        select_between(start, end, as_model): Reads a time range from the overlapping partitions.
+
+    Note:
+        - Primary keys are unique per partition only; use explicit or UUID keys when they must be
+          unique across partitions.
+        - The partition key of a saved instance cannot be changed, and Session does not support
+          partitioned models.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        meta = getattr(cls, 'Meta', None)
+        cls._partition_by = getattr(meta, 'partition_by', None)
+        cls._partition_interval = getattr(meta, 'partition_interval', 'month')
+        cls._partitions = None
+        if cls._partition_interval not in INTERVALS:
+            raise ORMMException(f"Invalid partition interval {cls._partition_interval!r}; use one of {INTERVALS}.")
+
+    @classmethod
+    def _period(cls, value) -> str:
+        """
+        Get the partition suffix of a timestamp: 'YYYY_MM' or 'YYYY_MM_DD'.
+        """
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            value = datetime.fromtimestamp(value, timezone.utc)
+        elif isinstance(value, str):
+            value = date.fromisoformat(value[:10])
+        elif not isinstance(value, date):
+            raise ORMMException(f"Cannot partition '{cls.__name__}' by {value!r}.")
+        if cls._partition_interval == 'day':
+            return f"{value.year:04d}_{value.month:02d}_{value.day:02d}"
+        return f"{value.year:04d}_{value.month:02d}"
+
+    @classmethod
+    def partition_name(cls, value) -> str:
+        """
+        Get the partition table that holds rows with the given timestamp.
+
+        Args:
+            value: A datetime, date, ISO 8601 string or UNIX timestamp.
+
+        Returns:
+            str: The partition table name.
+
+        Raises:
+            ORMMException: If the value cannot be read as a timestamp.
+        """
+        return f"{cls._table}_{cls._period(value)}"
+
+    @classmethod
+    def _partition_of(cls, values: Dict) -> str:
+        if cls._partition_by not in cls._fields:
+            raise ORMMException(f"'{cls.__name__}.Meta.partition_by' must name one of its fields.")
+        value = values.get(cls._partition_by)
+        if value is None:
+            raise ORMMException(f"'{cls.__name__}.{cls._partition_by}' is required to pick a partition.")
+        return cls.partition_name(value)
+
+    @classmethod
+    def partitions(cls) -> List[str]:
+        """
+        List the partition tables, oldest first.
+
+        Returns:
+            list: The partition table names.
+
+        Raises:
+            ORMMException: If ORMManager instance is not set.
+        """
+        if cls.orm_manager is None:
+            raise ORMMException("ORMManager instance is not set.")
+        pattern = '[0-9]' * 4 + '_' + '[0-9]' * 2 + ('_' + '[0-9]' * 2 if cls._partition_interval == 'day' else '')
+        rows = cls.orm_manager.fetch_all(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name GLOB ? ORDER BY name",
+            f"{cls._table}_{pattern}"
+        )
+        cls._partitions = [row[0] for row in rows]
+        return list(cls._partitions)
+
+    @classmethod
+    def _partition_indexes(cls, partition: str) -> List[str]:
+        """
+        Get the model's index statements for one partition. Named indexes get the partition's suffix.
+        """
+        suffix = partition[len(cls._table):]
+        statements = []
+        for index in cls._indexes:
+            if index.name:
+                index = Index(*index.expressions, name=f"{index.name}{suffix}", unique=index.unique,
+                              where=index.where, include=index.include)
+            statements.append(index.sql(partition).replace('INDEX ', 'INDEX IF NOT EXISTS ', 1))
+        return statements
+
+    @classmethod
+    def _view_sql(cls, partitions: List[str]) -> str:
+        columns = ', '.join(cls._fields)
+        if not partitions:
+            empty = ', '.join(f"NULL AS {name}" for name in cls._fields)
+            return f"CREATE VIEW {cls._table} AS SELECT {empty} WHERE 0"
+        return f"CREATE VIEW {cls._table} AS " + ' UNION ALL '.join(f"SELECT {columns} FROM {name}" for name in partitions)
+
+    @classmethod
+    def _refresh_view(cls, partitions: List[str]) -> None:
+        """
+        Recreate the UNION ALL view over the given partitions. Runs inside the caller's transaction.
+        """
+        connection = cls.orm_manager.connection
+        connection.execute(f"DROP VIEW IF EXISTS {cls._table}")
+        connection.execute(cls._view_sql(partitions))
+        cls.orm_manager.touch(cls._table)
+
+    @classmethod
+    def _ensure_partition(cls, partition: str) -> None:
+        """
+        Create a partition and add it to the view if it does not exist yet.
+        """
+        if cls._partitions is None:
+            cls.partitions()
+        if partition in cls._partitions:
+            return
+        connection = cls.orm_manager.connection
+        create = cls._sql['create'].replace(f"CREATE TABLE IF NOT EXISTS {cls._table} (", f"CREATE TABLE IF NOT EXISTS {partition} (", 1)
+        try:
+            connection.execute(create)
+            for statement in cls._partition_indexes(partition):
+                connection.execute(statement)
+            cls._refresh_view(sorted(cls._partitions + [partition]))
+            connection.commit()
+        except sqlite3.Error as e:
+            connection.rollback()
+            raise ORMMException(f"Error creating partition '{partition}': {str(e)}")
+        cls._partitions = sorted(cls._partitions + [partition])
+
+    @classmethod
+    def create_partition(cls, value) -> str:
+        """
+        Create the partition for a timestamp, with the model's columns and indexes, and add it to the view.
+
+        Args:
+            value: A datetime, date, ISO 8601 string or UNIX timestamp.
+
+        Returns:
+            str: The partition table name.
+
+        Raises:
+            ORMMException: If ORMManager instance is not set or the partition cannot be created.
+        """
+        if cls.orm_manager is None:
+            raise ORMMException("ORMManager instance is not set.")
+        partition = cls.partition_name(value)
+        cls._ensure_partition(partition)
+        return partition
+
+    @classmethod
+    def drop_partitions(cls, before) -> List[str]:
+        """
+        Drop every partition whose period ends before the period of a timestamp.
+
+        Each partition goes with a single DROP TABLE, so retention costs the same however many rows
+        a partition holds.
+
+        Args:
+            before: A datetime, date, ISO 8601 string or UNIX timestamp. Its own partition is kept.
+
+        Returns:
+            list: The dropped partition table names.
+
+        Raises:
+            ORMMException: If ORMManager instance is not set or there is an error dropping a partition.
+        """
+        if cls.orm_manager is None:
+            raise ORMMException("ORMManager instance is not set.")
+        cutoff = cls.partition_name(before)
+        partitions = cls.partitions()
+        dropped = [name for name in partitions if name < cutoff]
+        if not dropped:
+            return []
+        connection = cls.orm_manager.connection
+        try:
+            for name in dropped:
+                connection.execute(f"DROP TABLE {name}")
+                cls.orm_manager.touch(name)
+            cls._refresh_view([name for name in partitions if name >= cutoff])
+            connection.commit()
+        except sqlite3.Error as e:
+            connection.rollback()
+            cls._partitions = None
+            raise ORMMException(f"Error dropping partitions: {str(e)}")
+        cls._partitions = [name for name in partitions if name >= cutoff]
+        return dropped
+
+    @classmethod
+    def select_between(cls, start, end, as_model: bool = False) -> List[Union['PartitionedModel', Dict]]:
+        """
+        Read the rows whose partition key is in [start, end), querying only the overlapping partitions
+        with a single UNION ALL statement.
+
+        Args:
+            start: The inclusive lower bound, a datetime, date, ISO 8601 string or UNIX timestamp.
+            end: The exclusive upper bound, of the same type as the stored values.
+            as_model (bool): Return model instances instead of dictionaries. Default is False.
+
+        Returns:
+            list: The rows, partition by partition.
+
+        Raises:
+            ORMMException: If ORMManager instance is not set.
+        """
+        if cls.orm_manager is None:
+            raise ORMMException("ORMManager instance is not set.")
+        first, last = cls.partition_name(start), cls.partition_name(end)
+        selected = [name for name in cls.partitions() if first <= name <= last]
+        if not selected:
+            return []
+        key = cls._partition_by
+        bounds = tuple(cls._to_db({key: value})[key] for value in (start, end))
+        columns = tuple(cls._fields)
+        query = ' UNION ALL '.join(f"SELECT {', '.join(columns)} FROM {name} WHERE {key} >= ? AND {key} < ?" for name in selected)
+        rows = cls._fetch(query, *(bounds * len(selected)))
+        if as_model:
+            return cls._hydrate(rows)
+        decode_row = cls.orm_manager._decode_row
+        return [cls._to_python(dict(zip(columns, decode_row(cls._table, columns, row)))) for row in rows]
+
+    @classmethod
+    def create_table(cls) -> None:
+        """
+        Create the view over the existing partitions. Partitions themselves are created on first write.
+
+        Raises:
+            ORMMException: If ORMManager instance is not set.
+        """
+        if cls.orm_manager is None:
+            raise ORMMException("ORMManager instance is not set.")
+        connection = cls.orm_manager.connection
+        try:
+            cls._refresh_view(cls.partitions())
+            connection.commit()
+        except sqlite3.Error as e:
+            connection.rollback()
+            raise ORMMException(f"Error creating view '{cls._table}': {str(e)}")
+
+    @classmethod
+    def drop_table(cls) -> None:
+        """
+        Drop the view and every partition.
+
+        Raises:
+            ORMMException: If ORMManager instance is not set.
+        """
+        if cls.orm_manager is None:
+            raise ORMMException("ORMManager instance is not set.")
+        connection = cls.orm_manager.connection
+        try:
+            connection.execute(f"DROP VIEW IF EXISTS {cls._table}")
+            for name in cls.partitions():
+                connection.execute(f"DROP TABLE {name}")
+                cls.orm_manager.touch(name)
+            connection.commit()
+        except sqlite3.Error as e:
+            connection.rollback()
+            raise ORMMException(f"Error dropping partitions: {str(e)}")
+        cls.orm_manager.touch(cls._table)
+        cls._partitions = []
+
+    @classmethod
+    def apply_migrations(cls) -> None:
+        """
+        Add the model's new columns to every partition and recreate the view.
+
+        Raises:
+            ORMMException: If ORMManager instance is not set or a column type changed.
+        """
+        if cls.orm_manager is None:
+            raise ORMMException("ORMManager instance is not set.")
+        for partition in cls.partitions():
+            existing_columns = cls.orm_manager.get_table_columns(partition)
+            for field_name, field_obj in cls._fields.items():
+                if field_name not in existing_columns:
+                    cls.orm_manager.add_column(partition, field_name, field_obj.data_type, field_obj.constraints)
+                elif existing_columns[field_name] != field_obj.data_type:
+                    raise ORMMException(f"Data type mismatch for column '{field_name}' in table '{partition}'")
+        cls.create_table()
+
+    @classmethod
+    def map_model(cls) -> None:
+        """
+        Map the model: migrate its partitions and create its view.
+
+        Raises:
+            ORMMException: If ORMManager instance is not set.
+        """
+        cls.apply_migrations()
+
+    @classmethod
+    def insert_row(cls, values: Dict[str, Union[str, int, float]]) -> None:
+        """
+        Insert a row into the partition of its timestamp, creating the partition if needed.
+
+        Args:
+            values (Dict[str, Union[str, int, float]]): The values to insert into the row.
+
+        Raises:
+            ORMMException: If ORMManager instance is not set or the partition key is missing.
+        """
+        if cls.orm_manager is None:
+            raise ORMMException("ORMManager instance is not set.")
+        partition = cls._partition_of(values)
+        cls._ensure_partition(partition)
+        values = cls._to_db(values)
+        cls.orm_manager.raw.execute_query(f"INSERT INTO {partition} ({', '.join(values)}) VALUES ({', '.join('?' * len(values))})", *values.values())
+        cls.orm_manager.touch(cls._table)
+
+    @classmethod
+    def insert_many(cls, rows: List[Dict[str, Union[str, int, float]]], validate: bool = True) -> int:
+        """
+        Insert many rows in one transaction, grouped by partition and set of columns.
+
+        Args:
+            rows (List[Dict[str, Union[str, int, float]]]): The rows, as dictionaries keyed by field name.
+            validate (bool): Validate the rows before inserting them. Default is True.
+
+        Returns:
+            int: The number of rows inserted.
+
+        Raises:
+            ORMMException: If ORMManager instance is not set, a row is invalid or lacks its partition
+                key, or there is an error inserting the rows. The transaction is rolled back on error.
+        """
+        if cls.orm_manager is None:
+            raise ORMMException("ORMManager instance is not set.")
+        if validate:
+            errors = cls.validate_many(rows)
+            if errors:
+                details = '; '.join(f"row {index}: {', '.join(names)}" for index, names in list(errors.items())[:10])
+                raise ORMMException(f"{len(errors)} invalid row(s) for '{cls.__name__}': {details}")
+        groups: Dict[Tuple[str, Tuple[str, ...]], List[Dict]] = {}
+        for row in rows:
+            groups.setdefault((cls._partition_of(row), tuple(row)), []).append(row)
+        for partition in {partition for partition, _ in groups}:
+            cls._ensure_partition(partition)
+
+        connection = cls.orm_manager.connection
+        try:
+            for (partition, columns), group in groups.items():
+                values = [tuple(cls._to_db(row).values()) for row in group]
+                connection.executemany(f"INSERT INTO {partition} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})", values)
+                cls.orm_manager.touch(partition)
+            connection.commit()
+        except sqlite3.Error as e:
+            connection.rollback()
+            raise ORMMException(f"Error inserting rows: {str(e)}")
+        cls.orm_manager.touch(cls._table)
+        return len(rows)
+
+    @classmethod
+    def bulk_save(cls, instances: List['PartitionedModel']) -> int:
+        """
+        Save many instances, each in the partition of its timestamp.
+
+        Args:
+            instances (List[PartitionedModel]): Instances of this model.
+
+        Returns:
+            int: The number of instances written.
+        """
+        written = 0
+        for instance in instances:
+            if getattr(instance, '_dirty', None) != ():
+                instance.save()
+                written += 1
+        return written
+
+    def save(self) -> None:
+        """
+        Write the instance to the partition of its timestamp.
+
+        Raises:
+            ORMMException: If ORMManager instance is not set, the model has no primary key field, the
+                partition key is missing, or the partition key of a loaded instance was changed.
+        """
+        cls = type(self)
+        if cls.orm_manager is None:
+            raise ORMMException("ORMManager instance is not set.")
+        pk = cls._require_pk()
+        dirty = getattr(self, '_dirty', None)
+        values = self.to_dict()
+        partition = cls._partition_of(values)
+        if dirty is None:
+            cls._ensure_partition(partition)
+            values = cls._to_db(values)
+            cls.orm_manager.raw.execute_query(f"INSERT INTO {partition} ({', '.join(values)}) VALUES ({', '.join('?' * len(values))})", *values.values())
+            if getattr(self, pk, None) is None:
+                object.__setattr__(self, pk, cls.orm_manager.cursor.lastrowid)
+        elif dirty:
+            if pk in dirty or cls._partition_by in dirty:
+                raise ORMMException(f"The primary key and partition key of a saved '{cls.__name__}' cannot be changed.")
+            columns = tuple(sorted(dirty))
+            values = cls._to_db({name: getattr(self, name) for name in columns})
+            assignments = ', '.join(f"{name} = ?" for name in columns)
+            cls.orm_manager.raw.execute_query(f"UPDATE {partition} SET {assignments} WHERE {pk} = ?", *values.values(), cls._pk_to_db(getattr(self, pk)))
+        cls.orm_manager.touch(cls._table)
+        object.__setattr__(self, '_dirty', ())
+
+    def delete(self) -> None:
+        """
+        Delete the instance's row from its partition.
+
+        Raises:
+            ORMMException: If ORMManager instance is not set or the model has no primary key field.
+        """
+        cls = type(self)
+        if cls.orm_manager is None:
+            raise ORMMException("ORMManager instance is not set.")
+        pk = cls._require_pk()
+        partition = cls._partition_of(self.to_dict())
+        cls.orm_manager.raw.execute_query(f"DELETE FROM {partition} WHERE {pk} = ?", cls._pk_to_db(getattr(self, pk)))
+        cls.orm_manager.touch(cls._table)
+        if hasattr(self, '_dirty'):
+            object.__delattr__(self, '_dirty')
+
+    @classmethod
+    def _fan_out(cls, statement: str, *args) -> None:
+        """
+        Run a statement on every partition in one transaction. '{table}' in the statement is replaced
+        by each partition name.
+        """
+        connection = cls.orm_manager.connection
+        try:
+            for partition in cls.partitions():
+                connection.execute(statement.replace('{table}', partition), args)
+                cls.orm_manager.touch(partition)
+            connection.commit()
+        except sqlite3.Error as e:
+            connection.rollback()
+            raise ORMMException(f"Error writing partitions: {str(e)}")
+        cls.orm_manager.touch(cls._table)
+
+    @classmethod
+    def update_row(cls, values: Dict[str, Union[str, int, float]], condition: str, *args) -> None:
+        """
+        Update the matching rows of every partition in one transaction.
+
+        Args:
+            values (Dict[str, Union[str, int, float]]): The values to update in the rows.
+            condition (str): The condition to identify which row(s) to update.
+            *args: Additional arguments for the query.
+
+        Raises:
+            ORMMException: If ORMManager instance is not set or the partition key would change.
+        """
+        if cls.orm_manager is None:
+            raise ORMMException("ORMManager instance is not set.")
+        if cls._partition_by in values:
+            raise ORMMException(f"The partition key of '{cls.__name__}' cannot be updated in place.")
+        values = cls._to_db(values)
+        assignments = ', '.join(f"{name} = ?" for name in values)
+        cls._fan_out(f"UPDATE {{table}} SET {assignments} WHERE {condition}", *values.values(), *args)
+
+    @classmethod
+    def delete_row(cls, condition: str, *args) -> None:
+        """
+        Delete the matching rows of every partition in one transaction. Use 'drop_partitions' for retention.
+
+        Args:
+            condition (str): The condition to identify which row(s) to delete.
+            *args: Additional arguments for the query.
+
+        Raises:
+            ORMMException: If ORMManager instance is not set.
+        """
+        if cls.orm_manager is None:
+            raise ORMMException("ORMManager instance is not set.")
+        cls._fan_out(f"DELETE FROM {{table}} WHERE {condition}", *args)
@@ -0,0 +1,739 @@
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from .ORMException import ORMMException
+from ...Aggregate import aggregate_columns, compile_aggregate
+from .FullText import fts_table
+from .RTree import box_condition
+
+_LOOKUPS = {
+    'exact': '{col} = ?',
+    'ne': '{col} != ?',
+    'lt': '{col} < ?',
+    'lte': '{col} <= ?',
+    'gt': '{col} > ?',
+    'gte': '{col} >= ?',
+    'contains': 'instr({col}, ?) > 0',
+    'icontains': "{col} LIKE ? ESCAPE '\\'",
+    'istartswith': "{col} LIKE ? ESCAPE '\\'",
+    'iendswith': "{col} LIKE ? ESCAPE '\\'",
+}
+
+_CONVERTED_LOOKUPS = {'exact', 'ne', 'lt', 'lte', 'gt', 'gte', 'in', 'range'}
+_OPERATORS = set(_LOOKUPS) | {'in', 'isnull', 'range', 'startswith', 'endswith'}
+
+def _escape_like(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+class QuerySet:
+    """
+    QuerySet Class
+
+    A lazy, chainable query over a model's table. Every chained call returns a new QuerySet; the
+    query is compiled to a single parameterized SQL statement only when the QuerySet is iterated,
+    counted or indexed, and rows are streamed with 'fetchmany'.
+
+    Lookups are written as 'field' or 'field__op', where op is one of: exact, ne, lt, lte, gt, gte,
+    in, isnull, range, contains, startswith, endswith, icontains, istartswith, iendswith.
+    JSONField lookups may name a key path before the op, as 'field__key__subkey__op'; declared
+    'index_paths' compile to their indexed generated column, other paths to 'json_extract'.
+
+    'search' keeps the rows matching an FTS5 query on the model's searchable fields, ordered by
+    relevance unless the QuerySet is ordered explicitly. 'within' and 'overlapping' keep the rows
+    whose box, on the model's 'Meta.rtree' dimensions, lies inside or overlaps a query box.
+
+    Slices such as qs[10:20] apply to the current window and are pushed down to LIMIT and OFFSET.
+
+    Fields declared with 'deferred=True', fields left out by 'only' and fields named in 'defer' are
+    not selected. The primary key is always selected, and the instances of each fetched batch share
+    the batch, so the first access to a deferred field loads it for every instance of the batch
+    with one query; 'instance.load_deferred()' loads it explicitly.
+
+    ForeignKey fields can be loaded together with the rows: 'select_related' joins the referenced
+    table into the same query, and 'prefetch_related' runs one 'IN (...)' query per relation for each
+    fetched batch. Both stitch the referenced instances onto the rows through a dictionary keyed by
+    primary key, so rows sharing a reference share one instance.
+
+    Methods:
+        filter(self, **lookups): Keeps rows matching every lookup.
+        exclude(self, **lookups): Drops rows matching every lookup.
+        where(self, condition, *args): Keeps rows matching a raw SQL condition.
+        search(self, query, rank): Keeps rows matching a full-text query.
+        within(self, box): Keeps rows lying inside a bounding box.
+        overlapping(self, box): Keeps rows overlapping a bounding box.
+        order_by(self, *fields): Orders by fields; a leading '-' sorts descending.
+        only(self, *fields): Loads only the given fields and the primary key; the others are deferred.
+        defer(self, *fields): Defers the given fields.
+        select_related(self, *fields): Loads ForeignKey references with a JOIN.
+        prefetch_related(self, *fields): Loads ForeignKey references with batched IN queries.
+        limit(self, count): Sets the SQL LIMIT.
+        offset(self, count): Sets the SQL OFFSET.
+        to_sql(self): Compiles the query to (sql, params).
+        iterator(self, batch_size): Streams model instances.
+        count(self): Counts the matching rows.
+        exists(self): Checks if any row matches.
+        first(self): Gets the first matching instance, or None.
+        aggregate(self, count, sum, avg, min, max, group_by, ...): Computes aggregates with a single GROUP BY query.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self._where: List[Tuple[str, Tuple]] = []
+        self._order: List[str] = []
+        self._only: Optional[Tuple[str, ...]] = None
+        self._defer: Tuple[str, ...] = ()
+        self._limit: Optional[int] = None
+        self._offset: int = 0
+        self._select_related: Tuple[str, ...] = ()
+        self._prefetch_related: Tuple[str, ...] = ()
+        self._search: Optional[Tuple[str, bool]] = None
+
+    def _clone(self) -> 'QuerySet':
+        clone = self.__class__(self.model)
+        clone._where = list(self._where)
+        clone._order = list(self._order)
+        clone._only = self._only
+        clone._defer = self._defer
+        clone._limit = self._limit
+        clone._offset = self._offset
+        clone._select_related = self._select_related
+        clone._prefetch_related = self._prefetch_related
+        clone._search = self._search
+        return clone
+
+    def _check_field(self, name: str) -> str:
+        if name not in self.model._fields:
+            raise ORMMException(f"'{self.model.__name__}' has no field '{name}'")
+        return name
+
+    def _column(self, name: str) -> str:
+        return f"{self.model.get_table_name()}.{self._check_field(name)}"
+
+    def _check_relation(self, name: str):
+        field = self.model._fields.get(self._check_field(name))
+        if getattr(field, 'to', None) is None:
+            raise ORMMException(f"'{self.model.__name__}.{name}' is not a ForeignKey")
+        return field.to
+
+    def _compile_lookup(self, key: str, value: Any) -> Tuple[str, List]:
+        """
+        Compile one 'field__op' lookup to an SQL condition and its parameters.
+        """
+        name, _, op = key.partition('__')
+        col = self._column(name)
+        op = op or 'exact'
+        adapt = self.model._adapters.get(name)
+        if op not in _OPERATORS and hasattr(self.model._fields[name], 'index_paths'):
+            col, op = self._json_path(name, op)
+            adapt = None
+        if adapt is not None and value is not None and op in _CONVERTED_LOOKUPS:
+            if op in ('in', 'range'):
+                value = [item if item is None else adapt(item) for item in value]
+            else:
+                value = adapt(value)
+        if op == 'exact' and value is None:
+            return f"{col} IS NULL", []
+        if op == 'ne' and value is None:
+            return f"{col} IS NOT NULL", []
+        if op == 'isnull':
+            return f"{col} IS {'' if value else 'NOT '}NULL", []
+        if op == 'in':
+            values = list(value)
+            if not values:
+                return "0", []
+            return f"{col} IN ({', '.join('?' * len(values))})", values
+        if op in ('startswith', 'endswith'):
+            if not value:
+                return f"{col} IS NOT NULL", []
+            if op == 'startswith':
+                return f"substr({col}, 1, ?) = ?", [len(value), value]
+            return f"substr({col}, ?) = ?", [-len(value), value]
+        if op == 'range':
+            low, high = value
+            return f"{col} BETWEEN ? AND ?", [low, high]
+        if op not in _LOOKUPS:
+            raise ORMMException(f"Unsupported lookup '{op}' on field '{name}'")
+        if op == 'icontains':
+            value = f"%{_escape_like(value)}%"
+        elif op == 'istartswith':
+            value = f"{_escape_like(value)}%"
+        elif op == 'iendswith':
+            value = f"%{_escape_like(value)}"
+        return _LOOKUPS[op].format(col=col), [value]
+
+    def _json_path(self, name: str, lookup: str) -> Tuple[str, str]:
+        """
+        Split a 'key__subkey__op' lookup on a JSONField into the SQL expression of the key path and the op.
+        """
+        field = self.model._fields[name]
+        keys = lookup.split('__')
+        op = keys.pop() if len(keys) > 1 and keys[-1] in _OPERATORS else 'exact'
+        try:
+            path = field.check_path('.'.join(keys))
+        except ORMMException:
+            raise ORMMException(f"Unsupported lookup '{lookup}' on field '{name}'")
+        if path in field.index_paths:
+            return f"{self.model.get_table_name()}.{field.path_column(name, path)}", op
+        return f"json_extract({self._column(name)}, '$.{path}')", op
+
+    def _add_where(self, lookups: Dict[str, Any], negate: bool) -> 'QuerySet':
+        if not lookups:
+            return self._clone()
+        parts, params = [], []
+        for key, value in lookups.items():
+            sql, values = self._compile_lookup(key, value)
+            parts.append(sql)
+            params.extend(values)
+        condition = ' AND '.join(parts)
+        clone = self._clone()
+        clone._where.append((f"NOT ({condition})" if negate else f"({condition})", tuple(params)))
+        return clone
+
+    def filter(self, **lookups) -> 'QuerySet':
+        """
+        Keep only the rows matching every lookup.
+
+        Args:
+            **lookups: Conditions written as field=value or field__op=value.
+
+        Returns:
+            QuerySet: The filtered QuerySet.
+
+        Raises:
+            ORMMException: If a field or lookup is unknown.
+        """
+        return self._add_where(lookups, negate=False)
+
+    def exclude(self, **lookups) -> 'QuerySet':
+        """
+        Drop the rows matching every lookup.
+
+        Args:
+            **lookups: Conditions written as field=value or field__op=value.
+
+        Returns:
+            QuerySet: The filtered QuerySet.
+
+        Raises:
+            ORMMException: If a field or lookup is unknown.
+        """
+        return self._add_where(lookups, negate=True)
+
+    def where(self, condition: str, *args) -> 'QuerySet':
+        """
+        Keep only the rows matching a raw SQL condition.
+
+        Args:
+            condition (str): The SQL condition, with '?' placeholders.
+            *args: Parameters for the placeholders.
+
+        Returns:
+            QuerySet: The filtered QuerySet.
+        """
+        clone = self._clone()
+        clone._where.append((f"({condition})", tuple(args)))
+        return clone
+
+    def search(self, query: str, rank: bool = True) -> 'QuerySet':
+        """
+        Keep only the rows matching a full-text query on the model's FTS5 index, replacing any previous search.
+
+        Args:
+            query (str): The FTS5 query, such as 'sqlite AND "full text"' or 'prefix*'.
+            rank (bool): Order the rows by relevance (bm25) when no 'order_by' is given. Default is True.
+
+        Returns:
+            QuerySet: The filtered QuerySet.
+
+        Raises:
+            ORMMException: If the model has no searchable fields.
+        """
+        if not self.model._fts:
+            raise ORMMException(f"'{self.model.__name__}' has no searchable fields")
+        clone = self._clone()
+        clone._search = (query, rank)
+        return clone
+
+    def within(self, box) -> 'QuerySet':
+        """
+        Keep only the rows whose box lies entirely inside a bounding box, found through the model's R*Tree index.
+
+        Args:
+            box (Sequence[Sequence]): A (low, high) pair of bounds per 'Meta.rtree' dimension, in order.
+                A bound of None leaves that side open.
+
+        Returns:
+            QuerySet: The filtered QuerySet.
+
+        Raises:
+            ORMMException: If the model has no R*Tree index or the box does not match its dimensions.
+        """
+        return self._add_box(box, contained=True)
+
+    def overlapping(self, box) -> 'QuerySet':
+        """
+        Keep only the rows whose box overlaps a bounding box or range, found through the model's R*Tree index.
+
+        Args:
+            box (Sequence[Sequence]): A (low, high) pair of bounds per 'Meta.rtree' dimension, in order.
+                A bound of None leaves that side open.
+
+        Returns:
+            QuerySet: The filtered QuerySet.
+
+        Raises:
+            ORMMException: If the model has no R*Tree index or the box does not match its dimensions.
+        """
+        return self._add_box(box, contained=False)
+
+    def _add_box(self, box, contained: bool) -> 'QuerySet':
+        model = self.model
+        if not model._rtree:
+            raise ORMMException(f"'{model.__name__}' has no R*Tree index")
+        adapters = [model._adapters.get(low) for low, _ in model._rtree]
+        if len(box) == len(adapters):
+            box = [bounds if adapter is None else tuple(bound if bound is None else adapter(bound) for bound in bounds)
+                   for bounds, adapter in zip(box, adapters)]
+        condition, params = box_condition(model.get_table_name(), model._rtree, box, contained)
+        clone = self._clone()
+        clone._where.append((f"({condition})", tuple(params)))
+        return clone
+
+    def order_by(self, *fields: str) -> 'QuerySet':
+        """
+        Order the rows by the given fields, replacing any previous ordering.
+
+        Args:
+            *fields (str): Field names; prefix a name with '-' to sort descending.
+
+        Returns:
+            QuerySet: The ordered QuerySet.
+        """
+        clone = self._clone()
+        clone._order = [
+            f"{self._column(field[1:])} DESC" if field.startswith('-') else f"{self._column(field)} ASC"
+            for field in fields
+        ]
+        return clone
+
+    def only(self, *fields: str) -> 'QuerySet':
+        """
+        Load only the given fields and the primary key. The other fields are deferred.
+
+        Args:
+            *fields (str): Field names.
+
+        Returns:
+            QuerySet: The QuerySet.
+        """
+        clone = self._clone()
+        clone._only = tuple(self._check_field(field) for field in fields)
+        return clone
+
+    def defer(self, *fields: str) -> 'QuerySet':
+        """
+        Leave the given fields out of the query. They are loaded on demand; the primary key is never deferred.
+
+        Args:
+            *fields (str): Field names.
+
+        Returns:
+            QuerySet: The QuerySet.
+        """
+        clone = self._clone()
+        clone._defer = self._defer + tuple(self._check_field(field) for field in fields)
+        return clone
+
+    def select_related(self, *fields: str) -> 'QuerySet':
+        """
+        Load the instances referenced by the given ForeignKey fields with a LEFT JOIN in the same query.
+
+        Args:
+            *fields (str): ForeignKey field names.
+
+        Returns:
+            QuerySet: The QuerySet.
+
+        Raises:
+            ORMMException: If a field is not a ForeignKey.
+        """
+        for field in fields:
+            self._check_relation(field)
+        clone = self._clone()
+        clone._select_related = tuple(dict.fromkeys(self._select_related + fields))
+        return clone
+
+    def prefetch_related(self, *fields: str) -> 'QuerySet':
+        """
+        Load the instances referenced by the given ForeignKey fields with one 'IN (...)' query per
+        relation and fetched batch, chunked below the SQLite variable limit.
+
+        Args:
+            *fields (str): ForeignKey field names.
+
+        Returns:
+            QuerySet: The QuerySet.
+
+        Raises:
+            ORMMException: If a field is not a ForeignKey.
+        """
+        for field in fields:
+            self._check_relation(field)
+        clone = self._clone()
+        clone._prefetch_related = tuple(dict.fromkeys(self._prefetch_related + fields))
+        return clone
+
+    def limit(self, count: int) -> 'QuerySet':
+        """
+        Set the SQL LIMIT, replacing any previous limit.
+
+        Args:
+            count (int): The maximum number of rows.
+
+        Returns:
+            QuerySet: The limited QuerySet.
+        """
+        clone = self._clone()
+        clone._limit = count
+        return clone
+
+    def offset(self, count: int) -> 'QuerySet':
+        """
+        Set the SQL OFFSET, replacing any previous offset.
+
+        Args:
+            count (int): The number of rows to skip.
+
+        Returns:
+            QuerySet: The QuerySet.
+        """
+        clone = self._clone()
+        clone._offset = count
+        return clone
+
+    def __getitem__(self, key: Union[int, slice]):
+        if isinstance(key, slice):
+            if key.step not in (None, 1) or (key.start or 0) < 0 or (key.stop is not None and key.stop < 0):
+                raise ORMMException("QuerySet slices must have non-negative bounds and no step.")
+            start = key.start or 0
+            clone = self._clone()
+            clone._offset = self._offset + start
+            if self._limit is not None:
+                clone._limit = max(self._limit - start, 0)
+            if key.stop is not None:
+                stop = max(key.stop - start, 0)
+                clone._limit = stop if clone._limit is None else min(clone._limit, stop)
+            return clone
+        if not isinstance(key, int) or key < 0:
+            raise ORMMException("QuerySet indices must be non-negative integers.")
+        return self._get_index(key)
+
+    def _columns(self) -> Tuple[str, ...]:
+        model = self.model
+        if self._only is not None:
+            skipped = set(model._fields).difference(self._only)
+        else:
+            skipped = set(model._deferred_fields)
+        skipped.update(self._defer)
+        skipped.discard(model._pk)
+        return tuple(name for name in model._fields if name not in skipped)
+
+    def _deferring_loader(self, load, columns: Tuple[str, ...], batch_size: int):
+        """
+        Wrap a row loader so that each instance records its deferred fields and the batch it was
+        fetched with, for batched loading on demand.
+        """
+        model = self.model
+        deferred = frozenset(model._fields).difference(columns)
+        if not deferred or model._pk is None:
+            return load
+        model._allow_deferred()
+        batch = []
+
+        def load_deferring(row):
+            nonlocal batch
+            obj = load(row)
+            if len(batch) >= batch_size:
+                batch = []
+            batch.append(obj)
+            object.__setattr__(obj, '_deferred', (deferred, batch))
+            return obj
+        return load_deferring
+
+    def _compile(self, select: str, ordered: bool = True, paged: bool = True, joins: str = '') -> Tuple[str, Tuple]:
+        """
+        Compile the QuerySet around a select list.
+        """
+        table_name = self.model.get_table_name()
+        where = list(self._where)
+        order = self._order
+        if self._search is not None:
+            fts = fts_table(table_name)
+            joins = f" JOIN {fts} ON {fts}.rowid = {table_name}.rowid{joins}"
+            where.insert(0, (f"{fts} MATCH ?", (self._search[0],)))
+            if self._search[1] and not order:
+                order = [f"{fts}.rank"]
+        sql = f"SELECT {select} FROM {table_name}{joins}"
+        params: List = []
+        if where:
+            sql += ' WHERE ' + ' AND '.join(condition for condition, _ in where)
+            for _, values in where:
+                params.extend(values)
+        if ordered and order:
+            sql += ' ORDER BY ' + ', '.join(order)
+        if paged and (self._limit is not None or self._offset):
+            sql += f" LIMIT {int(self._limit) if self._limit is not None else -1}"
+            if self._offset:
+                sql += f" OFFSET {int(self._offset)}"
+        return sql, tuple(params)
+
+    def to_sql(self) -> Tuple[str, Tuple]:
+        """
+        Compile the QuerySet to a single parameterized statement.
+
+        Returns:
+            tuple: The SQL statement and its parameters.
+        """
+        table_name = self.model.get_table_name()
+        select = [f"{table_name}.{column}" for column in self._columns()]
+        joins = ''
+        for index, name in enumerate(self._select_related):
+            target = self._check_relation(name)
+            alias = f"_r{index}"
+            select.extend(f"{alias}.{column}" for column in target._fields)
+            joins += f" LEFT JOIN {target.get_table_name()} AS {alias} ON {alias}.{target._pk} = {table_name}.{name}"
+        return self._compile(', '.join(select), joins=joins)
+
+    def _related_loaders(self, manager) -> List[Tuple]:
+        """
+        Get (field name, row width, loader, pk position, index) for every select_related relation.
+        """
+        specs = []
+        for name in self._select_related:
+            target = self._check_relation(name)
+            columns = tuple(target._fields)
+            specs.append((name, len(columns), self._row_loader(manager, target, columns), columns.index(target._pk), {}))
+        return specs
+
+    @staticmethod
+    def _row_loader(manager, model, columns: Tuple[str, ...]):
+        """
+        Get the compiled constructor of a model for the given columns, decoding codec columns first.
+        """
+        load = model._loader(columns)
+        table_name = model.get_table_name()
+        if not manager.codecs.get(table_name):
+            return load
+        decode_row = manager._decode_row
+        return lambda row: load(decode_row(table_name, columns, row))
+
+    def _stitch(self, row: Tuple, load, width: int, related: List[Tuple]):
+        """
+        Build an instance and its joined references from one row of a select_related query.
+        """
+        obj = load(row[:width])
+        offset = width
+        for name, size, load_related, pk_position, index in related:
+            part = row[offset:offset + size]
+            offset += size
+            pk = part[pk_position]
+            if pk is None:
+                obj._set_related(name, None)
+                continue
+            target = index.get(pk)
+            if target is None:
+                target = index[pk] = load_related(part)
+            obj._set_related(name, target)
+        return obj
+
+    @staticmethod
+    def _chunks(values: List, size: int = 900):
+        for start in range(0, len(values), size):
+            yield values[start:start + size]
+
+    def _manager(self):
+        if self.model.orm_manager is None:
+            raise ORMMException("ORMManager instance is not set.")
+        return self.model.orm_manager
+
+    def _tables(self) -> Tuple[str, ...]:
+        return (self.model._table,) + tuple(self._check_relation(name)._table for name in self._select_related)
+
+    def _fetch_all(self, sql: str, params: Tuple) -> List[Tuple]:
+        """
+        Fetch all rows of a compiled query, through the result cache when the model sets 'Meta.cache'.
+        """
+        manager = self._manager()
+        if self.model._cached:
+            return manager.fetch_cached(self._tables(), sql, *params)
+        return manager.fetch_all(sql, *params)
+
+    def iterator(self, batch_size: int = 1000) -> Iterator:
+        """
+        Run the query and stream model instances, fetching 'batch_size' rows at a time.
+
+        Args:
+            batch_size (int): Number of rows fetched per round trip. Default is 1000.
+
+        Yields:
+            Model: The model instances.
+
+        Raises:
+            ORMMException: If ORMManager instance is not set.
+        """
+        manager = self._manager()
+        columns = self._columns()
+        sql, params = self.to_sql()
+        load = self._deferring_loader(self._row_loader(manager, self.model, columns), columns, batch_size)
+        related = self._related_loaders(manager)
+        if self.model._cached:
+            rows = manager.fetch_cached(self._tables(), sql, *params)
+        else:
+            rows = manager.fetch_iter(sql, *params, batch_size=batch_size)
+        if related:
+            width = len(columns)
+            instances = (self._stitch(row, load, width, related) for row in rows)
+        else:
+            instances = map(load, rows)
+        if not self._prefetch_related:
+            yield from instances
+            return
+        batch = []
+        for obj in instances:
+            batch.append(obj)
+            if len(batch) >= batch_size:
+                self._prefetch(batch)
+                yield from batch
+                batch = []
+        if batch:
+            self._prefetch(batch)
+            yield from batch
+
+    def _prefetch(self, instances: List) -> None:
+        """
+        Load the prefetched relations of a batch of instances, one chunked 'IN (...)' query per relation.
+        """
+        for name in self._prefetch_related:
+            target = self._check_relation(name)
+            keys = list({getattr(obj, name, None) for obj in instances} - {None})
+            index = {}
+            for chunk in self._chunks(keys):
+                queryset = target.objects.filter(**{f"{target._pk}__in": chunk})
+                for related in queryset:
+                    index[getattr(related, target._pk)] = related
+            for obj in instances:
+                obj._set_related(name, index.get(getattr(obj, name, None)))
+
+    def __iter__(self) -> Iterator:
+        return self.iterator()
+
+    def count(self) -> int:
+        """
+        Count the matching rows, honouring limit and offset.
+
+        Returns:
+            int: The number of rows.
+        """
+        if self._limit is not None or self._offset:
+            sql, params = self._compile('1', ordered=False)
+            sql = f"SELECT COUNT(*) FROM ({sql})"
+        else:
+            sql, params = self._compile('COUNT(*)', ordered=False)
+        return self._fetch_all(sql, params)[0][0]
+
+    def exists(self) -> bool:
+        """
+        Check if any row matches.
+
+        Returns:
+            bool: True if at least one row matches, False otherwise.
+        """
+        sql, params = self[:1]._compile('1', ordered=False)
+        return bool(self._fetch_all(sql, params))
+
+    def first(self):
+        """
+        Get the first matching instance.
+
+        Returns:
+            Optional[Model]: The instance, or None if no row matches.
+        """
+        for obj in self[:1]:
+            return obj
+        return None
+
+    def _get_index(self, index: int):
+        obj = self[index:index + 1].first()
+        if obj is None:
+            raise IndexError("QuerySet index out of range")
+        return obj
+
+    def _aggregate_query(self, spec: Dict, group_by, having, order_by, limit) -> Tuple[str, Tuple, List[str], Dict]:
+        """
+        Compile an aggregate over the QuerySet's rows, and find the result keys that need 'to_python'.
+        """
+        group_by = [self._check_field(column) for column in group_by or ()]
+        try:
+            columns = aggregate_columns(spec)
+            for _, _, column in columns:
+                if column is not None:
+                    self._check_field(column)
+            if self._limit is not None or self._offset or self._search is not None:
+                inner, params = self._compile(f"{self.model.get_table_name()}.*")
+                source, where = f"({inner})", None
+            else:
+                source = self.model.get_table_name()
+                where = ' AND '.join(condition for condition, _ in self._where) or None
+                params = tuple(value for _, values in self._where for value in values)
+            sql, keys = compile_aggregate(source, columns, group_by, where, having, order_by or (), limit)
+        except ValueError as e:
+            raise ORMMException(str(e))
+        converters = self.model._converters
+        converted = {column: converters[column] for column in group_by if column in converters}
+        for key, _, column in columns:
+            if column in converters and key.split('_', 1)[0] in self.model._fields[column].converted_aggregates:
+                converted[key] = converters[column]
+        return sql, params, keys, converted
+
+    def aggregate(self, count=None, sum=None, avg=None, min=None, max=None, group_by: Optional[List[str]] = None,
+                  having: Optional[str] = None, order_by: Optional[List[str]] = None, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Compute aggregates over the matching rows with a single SELECT ... GROUP BY query, so only
+        the aggregated rows are fetched.
+
+        Each aggregate is a field name or a list of field names, and 'count' also accepts True for
+        COUNT(*). Results are keyed '<function>_<field>' (for example 'sum_amount'), 'count' for
+        COUNT(*), and by name for the group fields. Group fields, and the aggregates listed in a
+        field's 'converted_aggregates', are converted with the field's 'to_python'.
+
+        Args:
+            count, sum, avg, min, max: The fields to aggregate.
+            group_by (Optional[List[str]]): The fields to group by. Without it a single row is returned.
+            having (Optional[str]): SQL condition applied to the groups, for example 'count > 10'.
+            order_by (Optional[List[str]]): Group fields or result keys; prefix '-' to sort descending.
+            limit (Optional[int]): The maximum number of groups.
+
+        Returns:
+            list: One dictionary per group.
+
+        Raises:
+            ORMMException: If ORMManager instance is not set, or an aggregate or field name is invalid.
+        """
+        spec = {'count': count, 'sum': sum, 'avg': avg, 'min': min, 'max': max}
+        sql, params, keys, converted = self._aggregate_query(spec, group_by, having, order_by, limit)
+        rows = [dict(zip(keys, row)) for row in self._fetch_all(sql, params)]
+        for row in rows:
+            for key, convert in converted.items():
+                if row[key] is not None:
+                    row[key] = convert(row[key])
+        return rows
+
+    def __repr__(self) -> str:
+        return f"<QuerySet({self.model.__name__}): {self.to_sql()[0]}>"
+
+
+class QuerySetDescriptor:
+    """
+    Class attribute that returns a fresh QuerySet over the model it is accessed on, as 'Model.objects'.
+    """
+
+    def __get__(self, instance, owner) -> QuerySet:
+        return QuerySet(owner)
@@ -0,0 +1,269 @@
+from typing import Dict, List, Tuple
+import sqlite3
+import time
+from .ORMException import ORMMException
+
+_MISSING = object()
+
+class Session:
+    """
+    Session Class
+
+    The Session class is a unit of work over an ORMManager. It keeps an identity map keyed by
+    (model, primary key), so loading the same row twice returns the same instance without a query,
+    and it collects new, changed and deleted instances until they are flushed.
+
+    Changes are found by comparing each mapped instance with a snapshot taken when it was loaded.
+    A flush writes everything in one transaction, batching statements with 'executemany' per model
+    and statement shape (the same set of columns).
+
+    Attributes:
+        manager (ORMManager): The manager whose connection is used.
+        identity_map (dict): Loaded instances keyed by (model, primary key).
+
+    Methods:
+        get(self, model, pk): Gets an instance by primary key, querying only on a miss.
+        load(self, queryset): Runs a QuerySet and maps its instances.
+        add(self, instance): Schedules a new instance for insertion.
+        delete(self, instance): Schedules an instance for deletion.
+        dirty(self): Gets the changed instances and their changed fields.
+        flush(self): Writes pending changes inside a transaction without committing it.
+        commit(self): Flushes and commits.
+        rollback(self): Rolls back and forgets every instance.
+        clear(self): Forgets every instance and pending change.
+
+    Note:
+        - Models used with a session need a PRIMARY KEY field and must use the session's manager.
+        - Used as a context manager, the session commits on success and rolls back on error.
+    """
+
+    def __init__(self, manager):
+        """
+        Initialize the Session instance.
+
+        Args:
+            manager (ORMManager): The manager whose connection is used.
+        """
+        self.manager = manager
+        self.identity_map: Dict[Tuple[type, object], object] = {}
+        self._snapshots: Dict[Tuple[type, object], Dict] = {}
+        self._keys: Dict[int, Tuple[type, object]] = {}
+        self._new: List = []
+        self._deleted: List = []
+
+    def __enter__(self) -> 'Session':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+
+    @staticmethod
+    def _pk(model) -> str:
+        if model._pk is None:
+            raise ORMMException(f"'{model.__name__}' has no primary key field.")
+        return model._pk
+
+    def _register(self, instance):
+        """
+        Map a loaded instance, returning the instance already mapped for its key if there is one.
+        """
+        model = type(instance)
+        key = (model, getattr(instance, self._pk(model)))
+        mapped = self.identity_map.get(key)
+        if mapped is not None:
+            return mapped
+        self.identity_map[key] = instance
+        self._snapshots[key] = instance.to_dict()
+        self._keys[id(instance)] = key
+        object.__setattr__(instance, '_dirty', ())
+        return instance
+
+    def _forget(self, instance) -> None:
+        key = self._keys.pop(id(instance), None)
+        if key is not None:
+            del self.identity_map[key]
+            del self._snapshots[key]
+
+    def get(self, model, pk):
+        """
+        Get an instance by primary key. Only the first lookup of a key queries the database.
+
+        Args:
+            model (Type[Model]): The model class.
+            pk: The primary key value.
+
+        Returns:
+            Optional[Model]: The instance, or None if no row has that key.
+        """
+        instance = self.identity_map.get((model, pk))
+        if instance is None:
+            instance = model.get(pk)
+            if instance is not None:
+                instance = self._register(instance)
+        return instance
+
+    def load(self, queryset) -> List:
+        """
+        Run a QuerySet and map its instances. Rows that are already mapped resolve to the mapped instance.
+
+        Args:
+            queryset (QuerySet): The query to run.
+
+        Returns:
+            list: The mapped instances.
+        """
+        self._pk(queryset.model)
+        return [self._register(instance) for instance in queryset]
+
+    def add(self, instance) -> None:
+        """
+        Schedule a new instance for insertion at the next flush.
+
+        Args:
+            instance (Model): The new instance.
+
+        Raises:
+            ORMMException: If another instance is already mapped with the same primary key.
+        """
+        model = type(instance)
+        pk = getattr(instance, self._pk(model), None)
+        mapped = self.identity_map.get((model, pk))
+        if mapped is not None and mapped is not instance:
+            raise ORMMException(f"An instance of '{model.__name__}' with primary key {pk!r} is already in the session.")
+        if mapped is None and instance not in self._new:
+            self._new.append(instance)
+
+    def delete(self, instance) -> None:
+        """
+        Schedule an instance for deletion at the next flush.
+
+        Args:
+            instance (Model): The instance to delete.
+        """
+        if instance in self._new:
+            self._new.remove(instance)
+        elif instance not in self._deleted:
+            self._deleted.append(instance)
+
+    def dirty(self) -> List[Tuple[object, Dict]]:
+        """
+        Get the mapped instances that changed since they were loaded or last flushed.
+
+        Returns:
+            list: Pairs of (instance, dictionary of changed fields and their new values).
+        """
+        changes = []
+        deleted = set(map(id, self._deleted))
+        for key, instance in self.identity_map.items():
+            if id(instance) in deleted:
+                continue
+            snapshot = self._snapshots[key]
+            changed = {name: value for name, value in instance.to_dict().items() if snapshot.get(name, _MISSING) != value}
+            if changed:
+                changes.append((instance, changed))
+        return changes
+
+    def _executemany(self, query: str, rows: List[Tuple]) -> None:
+        started = time.perf_counter()
+        self.manager.connection.executemany(query, rows)
+        self.manager.result_cache.note_write(query)
+        if self.manager.query_listeners:
+            self.manager._notify_query(query, (), time.perf_counter() - started)
+
+    def flush(self) -> None:
+        """
+        Write pending inserts, updates and deletes inside one transaction, without committing it.
+
+        Raises:
+            ORMMException: If a statement fails. The transaction is rolled back.
+        """
+        connection = self.manager.connection
+        inserts: Dict[Tuple, List] = {}
+        updates: Dict[Tuple, List] = {}
+        deletes: Dict[type, List] = {}
+        single_inserts = []
+        dirty = self.dirty()
+
+        for instance in self._new:
+            model = type(instance)
+            values = instance.to_dict()
+            if values.get(self._pk(model)) is None:
+                single_inserts.append(instance)
+            else:
+                inserts.setdefault((model, tuple(values)), []).append(instance)
+        for instance, changed in dirty:
+            updates.setdefault((type(instance), tuple(changed)), []).append((instance, changed))
+        for instance in self._deleted:
+            deletes.setdefault(type(instance), []).append(instance)
+
+        try:
+            if not connection.in_transaction:
+                connection.execute("BEGIN")
+            for (model, columns), instances in inserts.items():
+                table_name = model.get_table_name()
+                rows = [tuple(model._to_db(instance.to_dict()).values()) for instance in instances]
+                self._executemany(f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})", rows)
+            for instance in single_inserts:
+                model = type(instance)
+                values = model._to_db(instance.to_dict())
+                values.pop(model._pk, None)
+                if values:
+                    query = f"INSERT INTO {model.get_table_name()} ({', '.join(values)}) VALUES ({', '.join('?' * len(values))})"
+                else:
+                    query = f"INSERT INTO {model.get_table_name()} DEFAULT VALUES"
+                self.manager.touch(model._table)
+                setattr(instance, model._pk, connection.execute(query, tuple(values.values())).lastrowid)
+            for (model, columns), pairs in updates.items():
+                table_name = model.get_table_name()
+                pk_name = self._pk(model)
+                rows = [
+                    tuple(model._to_db(changed).values()) + (model._pk_to_db(self._keys[id(instance)][1]),)
+                    for instance, changed in pairs
+                ]
+                assignments = ', '.join(f"{column} = ?" for column in columns)
+                self._executemany(f"UPDATE {table_name} SET {assignments} WHERE {pk_name} = ?", rows)
+            for model, instances in deletes.items():
+                rows = [(model._pk_to_db(self._keys[id(instance)][1] if id(instance) in self._keys else getattr(instance, model._pk)),)
+                        for instance in instances]
+                self._executemany(f"DELETE FROM {model.get_table_name()} WHERE {self._pk(model)} = ?", rows)
+        except sqlite3.Error as e:
+            connection.rollback()
+            raise ORMMException(f"Error flushing session: {str(e)}")
+
+        for instance in self._deleted:
+            self._forget(instance)
+        for instance, _ in dirty:
+            self._forget(instance)
+            self._register(instance)
+        for instance in self._new:
+            self._register(instance)
+        self._new.clear()
+        self._deleted.clear()
+
+    def commit(self) -> None:
+        """
+        Flush pending changes and commit the transaction.
+        """
+        self.flush()
+        self.manager.connection.commit()
+
+    def rollback(self) -> None:
+        """
+        Roll back the transaction and forget every instance and pending change.
+        """
+        self.manager.connection.rollback()
+        self.manager.touch()
+        self.clear()
+
+    def clear(self) -> None:
+        """
+        Forget every mapped instance and pending change.
+        """
+        self.identity_map.clear()
+        self._snapshots.clear()
+        self._keys.clear()
+        self._new.clear()
+        self._deleted.clear()
@@ -1,10 +1,173 @@
 from .Field import Field
-from typing import List, Optional
+from .ORMException import ORMMException
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, List, Optional
+import json
+import re
+import uuid
+
+_KEY_RE = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
 
 class IntegerField(Field):
-    def __init__(self, constraints: Optional[List[str]] = None):
-        super().__init__('INTEGER', constraints)
+    def __init__(self, constraints: Optional[List[str]] = None, **kwargs):
+        super().__init__('INTEGER', constraints, **kwargs)
 
 class TextField(Field):
-    def __init__(self, constraints: Optional[List[str]] = None):
-        super().__init__('TEXT', constraints)
+    def __init__(self, constraints: Optional[List[str]] = None, **kwargs):
+        super().__init__('TEXT', constraints, **kwargs)
+
+class SearchableTextField(TextField):
+    """
+    A TEXT column indexed for full-text search. 'map_model' creates an external-content FTS5 table over
+    the model's searchable fields, kept in sync by triggers; query it with 'Model.search'.
+    """
+    searchable = True
+
+class BlobField(Field):
+    def __init__(self, constraints: Optional[List[str]] = None, **kwargs):
+        super().__init__('BLOB', constraints, **kwargs)
+
+class BooleanField(Field):
+    """
+    A boolean stored as INTEGER 0 or 1.
+    """
+    def __init__(self, constraints: Optional[List[str]] = None, **kwargs):
+        super().__init__('INTEGER', constraints, **kwargs)
+
+    to_db = staticmethod(int)
+    to_python = staticmethod(bool)
+
+class DateTimeField(Field):
+    """
+    A datetime stored as ISO 8601 TEXT, which sorts and compares in time order for values with the same offset.
+    """
+    def __init__(self, constraints: Optional[List[str]] = None, **kwargs):
+        super().__init__('TEXT', constraints, **kwargs)
+
+    to_db = staticmethod(datetime.isoformat)
+    to_python = staticmethod(datetime.fromisoformat)
+
+class DecimalField(Field):
+    """
+    A Decimal stored as an INTEGER count of 10^-decimal_places units, so values stay exact and
+    compare numerically in SQL. Values are rounded half-even to 'decimal_places'.
+    """
+    def __init__(self, constraints: Optional[List[str]] = None, decimal_places: int = 2, **kwargs):
+        """
+        Initialize the field.
+
+        Args:
+            constraints (Optional[List[str]]): Constraints for the column.
+            decimal_places (int): The number of digits kept after the decimal point. Default is 2.
+        """
+        super().__init__('INTEGER', constraints, **kwargs)
+        self.decimal_places = decimal_places
+
+    converted_aggregates = ('sum', 'avg', 'min', 'max')
+
+    def to_db(self, value) -> int:
+        return int(Decimal(value).scaleb(self.decimal_places).to_integral_value())
+
+    def to_python(self, value) -> Decimal:
+        if value.__class__ is float:
+            # AVG returns a REAL; go through its shortest repr rather than its binary expansion.
+            value = int(value) if value.is_integer() else repr(value)
+        return Decimal(value).scaleb(-self.decimal_places)
+
+class JSONField(Field):
+    """
+    A JSON document stored as compact TEXT.
+
+    Each path in 'index_paths', a dotted key path such as 'user_id' or 'meta.kind', gets a VIRTUAL
+    generated column named '<field>_<path>' (dots replaced by underscores) holding
+    'json_extract(<field>, '$.<path>')', and an index on it. QuerySet lookups such as
+    'payload__user_id=5' or 'payload__meta__kind__in=[...]' compile to that column and use the
+    index; lookups on other paths compile to 'json_extract' and scan.
+    """
+    def __init__(self, constraints: Optional[List[str]] = None, index_paths: Optional[List[str]] = None, **kwargs):
+        """
+        Initialize the field.
+
+        Args:
+            constraints (Optional[List[str]]): Constraints for the column.
+            index_paths (Optional[List[str]]): Dotted key paths to extract into indexed generated columns.
+
+        Raises:
+            ORMMException: If a path is not a dotted sequence of identifiers.
+        """
+        super().__init__('TEXT', constraints, **kwargs)
+        self.index_paths = tuple(self.check_path(path) for path in index_paths or ())
+
+    @staticmethod
+    def check_path(path: str) -> str:
+        """
+        Check that a key path is a dotted sequence of identifiers, so it can be inlined in SQL.
+
+        Args:
+            path (str): The key path.
+
+        Returns:
+            str: The key path.
+
+        Raises:
+            ORMMException: If the path is invalid.
+        """
+        if not isinstance(path, str) or not all(_KEY_RE.match(key) for key in path.split('.')):
+            raise ORMMException(f"Invalid JSON key path: {path!r}")
+        return path
+
+    @staticmethod
+    def path_column(name: str, path: str) -> str:
+        """
+        Get the name of the generated column extracting a key path from a field.
+        """
+        return f"{name}_{path.replace('.', '_')}"
+
+    def generated_columns(self, name: str) -> Dict[str, str]:
+        return {self.path_column(name, path): f"json_extract({name}, '$.{path}')" for path in self.index_paths}
+
+    to_db = staticmethod(json.JSONEncoder(separators=(',', ':'), ensure_ascii=False).encode)
+    to_python = staticmethod(json.loads)
+
+class UUIDField(Field):
+    """
+    A UUID stored as its canonical 36 character TEXT form.
+    """
+    def __init__(self, constraints: Optional[List[str]] = None, **kwargs):
+        super().__init__('TEXT', constraints, **kwargs)
+
+    to_db = staticmethod(str)
+    to_python = staticmethod(uuid.UUID)
+
+class ForeignKey(Field):
+    """
+    A column holding the primary key of a row in another model's table.
+
+    The column takes the data type and converters of the referenced primary key and a REFERENCES clause. The
+    referenced instance is available through 'instance.related(name)', and can be loaded for many
+    rows at once with 'QuerySet.select_related' or 'QuerySet.prefetch_related'.
+    """
+    def __init__(self, to, constraints: Optional[List[str]] = None, on_delete: Optional[str] = None, **kwargs):
+        """
+        Initialize the field.
+
+        Args:
+            to (Type[Model]): The referenced model. It must have a PRIMARY KEY field.
+            constraints (Optional[List[str]]): Additional constraints for the column.
+            on_delete (Optional[str]): The ON DELETE action, such as 'CASCADE' or 'SET NULL'.
+
+        Raises:
+            ORMMException: If the referenced model has no primary key field.
+        """
+        if getattr(to, '_pk', None) is None:
+            raise ORMMException(f"ForeignKey target '{to.__name__}' has no primary key field.")
+        references = f"REFERENCES {to.get_table_name()}({to._pk})"
+        if on_delete:
+            references += f" ON DELETE {on_delete}"
+        target = to._fields[to._pk]
+        super().__init__(target.data_type, list(constraints or []) + [references], **kwargs)
+        self.to_db = target.to_db
+        self.to_python = target.to_python
+        self.to = to
+        self.on_delete = on_delete
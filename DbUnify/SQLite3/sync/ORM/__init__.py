@@ -1,4 +1,9 @@
 from .Model import Model
+from .PartitionedModel import PartitionedModel
 from .Field import Field
 from .ORMManager import ORMManager
-from .ORMException import ORMMException
\ No newline at end of file
+from .ORMException import ORMMException
+from .QuerySet import QuerySet
+from .Session import Session
+from .Types import ForeignKey
+from .Index import Index
\ No newline at end of file
@@ -2,4 +2,5 @@ from .Manager.Manager import Manager
 from .Exporter.Exporter import Exporter
 from .Raw.Raw import Raw
 from .ORM import Model
-from .Live import *
\ No newline at end of file
+from .Live import *
+from .Maintenance.Maintenance import Maintenance
@@ -15,7 +15,7 @@ setup(
     packages=find_packages(),
     install_requires=[
         'matplotlib',
-        'aiosqlite',
+        'aiosqlite>=0.17,<0.23',
         'asyncio'
     ],
     python_requires='>=3.7',
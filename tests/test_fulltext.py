@@ -0,0 +1,61 @@
+import asyncio
+import unittest
+
+from DbUnify.SQLite3.sync.ORM import Model, ORMManager
+from DbUnify.SQLite3.sync.ORM.Types import IntegerField, SearchableTextField
+from DbUnify.SQLite3.aio.ORM import Model as AsyncModel, ORMManager as AsyncORMManager
+from DbUnify.SQLite3.aio.ORM.Types import IntegerField as AsyncIntegerField, SearchableTextField as AsyncSearchableTextField
+
+ROWS = [{'id': 50, 'body': 'fifty'}, {'id': None, 'body': 'assigned'}, {'id': 300, 'body': 'three hundred'}]
+INTEGRITY_CHECK = "INSERT INTO {0}_fts({0}_fts, rank) VALUES('integrity-check', 1)"
+
+
+class InsertManyMixedKeysTest(unittest.TestCase):
+    """
+    insert_many indexes a group mixing explicit and assigned keys, including explicit keys below the
+    table's previous maximum rowid.
+    """
+
+    def test_sync(self):
+        manager = ORMManager(':memory:')
+
+        class Note(Model):
+            id = IntegerField(['PRIMARY KEY'])
+            body = SearchableTextField()
+
+        Note.set_manager(manager)
+        manager.map_models([Note])
+        Note.insert_many([{'id': 100, 'body': 'hundred'}])
+        Note.insert_many(ROWS)
+
+        self.assertEqual([row['id'] for row in Note.search('fifty')], [50])
+        self.assertEqual([row['id'] for row in Note.search('assigned')], [101])
+        self.assertEqual([row['id'] for row in Note.search('three')], [300])
+        manager.connection.execute(INTEGRITY_CHECK.format(Note.get_table_name()))
+        manager.close()
+
+    def test_aio(self):
+        async def run():
+            manager = AsyncORMManager(':memory:')
+            await manager.connect()
+
+            class AsyncNote(AsyncModel):
+                id = AsyncIntegerField(['PRIMARY KEY'])
+                body = AsyncSearchableTextField()
+
+            AsyncNote.set_manager(manager)
+            await manager.map_models([AsyncNote])
+            await AsyncNote.insert_many([{'id': 100, 'body': 'hundred'}])
+            await AsyncNote.insert_many(ROWS)
+
+            self.assertEqual([row['id'] for row in await AsyncNote.search('fifty')], [50])
+            self.assertEqual([row['id'] for row in await AsyncNote.search('assigned')], [101])
+            self.assertEqual([row['id'] for row in await AsyncNote.search('three')], [300])
+            await manager.connection.execute(INTEGRITY_CHECK.format(AsyncNote.get_table_name()))
+            await manager.close()
+
+        asyncio.run(run())
+
+
+if __name__ == '__main__':
+    unittest.main()